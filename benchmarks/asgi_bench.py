@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+벤치마크용 ASGI 호출 도우미
+네트워크와 HTTP 파싱 없이 ASGI 앱을 직접 호출해 앱 안에서 쓰는 시간만 잽니다.
+"""
+
+import asyncio
+import time
+from typing import List, Tuple
+
+
+async def call(app, path: str, query: str = "", headers: List[Tuple[bytes, bytes]] = ()) -> Tuple[int, bytes]:
+    """
+    GET 요청 하나를 ASGI 앱에 보내고 (상태 코드, 본문) 반환
+
+    Args:
+        app: ASGI 앱
+        path: 요청 경로
+        query: 쿼리 문자열 (? 제외)
+        headers: 추가 요청 헤더
+
+    Returns:
+        (상태 코드, 본문 바이트)
+    """
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+        "method": "GET", "scheme": "http", "path": path, "raw_path": path.encode(),
+        "query_string": query.encode(), "root_path": "",
+        "headers": [(b"host", b"bench"), *headers],
+        "client": ("127.0.0.1", 50000), "server": ("bench", 80),
+    }
+    status = 0
+    body = []
+
+    # 실제 서버처럼 요청을 받을 때 이벤트 루프에 한 번 양보 (동시 요청이 서로 끼어들 수 있게)
+    await asyncio.sleep(0)
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body":
+            body.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return status, b"".join(body)
+
+
+async def _run(app, path: str, query: str, requests: int, concurrency: int) -> List[float]:
+    latencies: List[float] = []
+    remaining = requests
+
+    async def worker():
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            start = time.perf_counter()
+            status, _ = await call(app, path, query)
+            latencies.append(time.perf_counter() - start)
+            assert status == 200, status
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies
+
+
+def measure(app, path: str, query: str = "", requests: int = 5000, concurrency: int = 1) -> Tuple[float, List[float]]:
+    """
+    요청을 반복해 초당 요청 수와 요청별 지연 시간 측정
+
+    Args:
+        app: ASGI 앱
+        path: 요청 경로
+        query: 쿼리 문자열
+        requests: 총 요청 수
+        concurrency: 동시에 진행할 요청 수
+
+    Returns:
+        (초당 요청 수, 요청별 지연 시간 리스트(초))
+    """
+    asyncio.run(_run(app, path, query, min(200, requests), concurrency))  # 워밍업
+    start = time.perf_counter()
+    latencies = asyncio.run(_run(app, path, query, requests, concurrency))
+    return requests / (time.perf_counter() - start), latencies
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+카탈로그 로드 시간 벤치마크
+순차/병렬 폴더 스캔(JSON 파싱)과 스냅샷(mmap) 로드를 비교합니다.
+
+사용법:
+    python3 benchmarks/catalog_load.py --albums 100 --tracks 30
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from src.lyrics_database import LyricsDatabase
+from synthetic_catalog import generate_catalog
+
+
+def _best_of(repeat: int, fn) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='카탈로그 로드 시간 벤치마크')
+    parser.add_argument('--data-dir', help='기존 data 디렉토리 (없으면 가상 카탈로그 생성)')
+    parser.add_argument('--albums', type=int, default=100)
+    parser.add_argument('--tracks', type=int, default=30)
+    parser.add_argument('--chunks', type=int, default=12)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--workers', type=int, default=8, help='병렬 로드 스레드 수')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = args.data_dir or str(generate_catalog(tmp, args.albums, args.tracks, args.chunks))
+        LyricsDatabase(data_dir, use_snapshot=False).build_snapshot()
+
+        scan = _best_of(args.repeat, lambda: LyricsDatabase(data_dir, use_snapshot=False))
+        parallel = _best_of(args.repeat, lambda: LyricsDatabase(data_dir, use_snapshot=False,
+                                                                load_workers=args.workers))
+        verified = _best_of(args.repeat, lambda: LyricsDatabase(data_dir))
+        trusted = _best_of(args.repeat, lambda: LyricsDatabase(data_dir, verify_snapshot=False))
+
+        db = LyricsDatabase(data_dir, verify_snapshot=False)
+        print(f"트랙 {db.tracks_count}개, 가사 청크 {db.get_chunk_count()}개")
+        print(f"  폴더 스캔 + JSON 파싱 : {scan * 1000:8.2f} ms")
+        print(f"  병렬 스캔 ({args.workers}스레드)   : {parallel * 1000:8.2f} ms")
+        print(f"  스냅샷 (stat 검증)    : {verified * 1000:8.2f} ms")
+        print(f"  스냅샷 (검증 생략)    : {trusted * 1000:8.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
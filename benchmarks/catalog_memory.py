@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+카탈로그 메모리 사용량 벤치마크
+청크마다 7개 키 딕셔너리를 만들던 기존 방식, TrackInfo/LyricChunk 방식,
+lazy 모드(라인 없이 인덱스만 상주)를 비교합니다.
+
+사용법:
+    python3 benchmarks/catalog_memory.py --albums 100 --tracks 30
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from src.lyrics_database import LyricsDatabase
+from synthetic_catalog import generate_catalog
+
+
+def load_legacy_dicts(data_dir: str) -> list:
+    """기존 load_all_lyrics()와 같은 청크 딕셔너리 리스트 생성"""
+    all_chunks = []
+    for album_folder in sorted(p for p in Path(data_dir).iterdir() if p.is_dir()):
+        for track_file in sorted(album_folder.glob("*.json")):
+            with open(track_file, 'r', encoding='utf-8') as f:
+                track_data = json.load(f)
+            for chunk in track_data.get('chunks', []):
+                all_chunks.append({
+                    'lines': chunk.get('lines', []),
+                    'title': track_data.get('title', 'Unknown'),
+                    'album': track_data.get('album', 'Unknown'),
+                    'year': track_data.get('year', 0),
+                    'track_number': track_data.get('track_number', 0),
+                    'artist': track_data.get('artist', '태연 (TAEYEON)'),
+                    'album_folder': album_folder.name
+                })
+    return all_chunks
+
+
+def retained_bytes(fn) -> int:
+    """fn()이 반환한 객체가 붙잡고 있는 메모리 (tracemalloc 기준)"""
+    tracemalloc.start()
+    result = fn()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current
+
+
+def main():
+    parser = argparse.ArgumentParser(description='카탈로그 메모리 사용량 벤치마크')
+    parser.add_argument('--data-dir', help='기존 data 디렉토리 (없으면 가상 카탈로그 생성)')
+    parser.add_argument('--albums', type=int, default=100)
+    parser.add_argument('--tracks', type=int, default=30)
+    parser.add_argument('--chunks', type=int, default=12)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = args.data_dir or str(generate_catalog(tmp, args.albums, args.tracks, args.chunks))
+
+        legacy = retained_bytes(lambda: load_legacy_dicts(data_dir))
+        compact = retained_bytes(lambda: LyricsDatabase(data_dir, use_snapshot=False))
+        lazy = retained_bytes(lambda: LyricsDatabase(data_dir, use_snapshot=False, lazy=True))
+        text = sum(
+            len(line.encode('utf-8'))
+            for chunk in LyricsDatabase(data_dir, use_snapshot=False).get_all_chunks()
+            for line in chunk.lines
+        )
+        chunks = len(LyricsDatabase(data_dir, use_snapshot=False).get_all_chunks())
+
+    print(f"가사 청크 {chunks}개, 가사 텍스트 {text / 1024 / 1024:.2f} MiB (UTF-8)")
+    print(f"  청크별 딕셔너리      : {legacy / 1024 / 1024:8.2f} MiB ({legacy / chunks:6.0f} B/청크)")
+    print(f"  TrackInfo/LyricChunk : {compact / 1024 / 1024:8.2f} MiB ({compact / chunks:6.0f} B/청크)")
+    print(f"  lazy 인덱스          : {lazy / 1024 / 1024:8.2f} MiB ({lazy / chunks:6.0f} B/청크)")
+
+
+if __name__ == '__main__':
+    main()
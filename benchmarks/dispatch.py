@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+엔드포인트 실행 방식 부하 테스트
+같은 엔드포인트 코드를 이벤트 루프에서 바로 실행하는 방식(async def)과
+요청마다 스레드 풀로 넘기는 방식(sync def, 이전 구조)으로 실행해 처리량과 p50/p99 지연 시간을 비교합니다.
+네트워크 대신 ASGI 앱을 직접 호출하므로 서버 안에서 쓰는 시간만 측정됩니다.
+
+사용법:
+    python3 benchmarks/dispatch.py --requests 20000 --concurrency 1 64 256
+"""
+
+import argparse
+import functools
+import json
+import logging
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from asgi_bench import measure
+from synthetic_catalog import generate_catalog
+
+ENDPOINTS = (("/current-lyric", "interval=3h"), ("/random-lyric", ""), ("/health", ""))
+
+
+def _run_to_completion(coro):
+    """중간에 대기하지 않는 코루틴을 동기적으로 실행 (메모리 카탈로그의 엔드포인트는 대기하지 않음)"""
+    try:
+        coro.send(None)
+    except StopIteration as stop:
+        return stop.value
+    coro.close()
+    raise RuntimeError("엔드포인트가 이벤트 루프에서 대기했습니다 (lazy 카탈로그는 이 벤치마크에서 지원하지 않음)")
+
+
+def threadpool_app(widget_service):
+    """같은 엔드포인트 코드를 sync def로 감싸 요청마다 스레드 풀에서 실행하는 앱 (이전 구조)"""
+    from fastapi import FastAPI
+    from fastapi.middleware.cors import CORSMiddleware
+
+    app = FastAPI()
+    app.add_middleware(CORSMiddleware, allow_origins=["*"], allow_credentials=True,
+                       allow_methods=["*"], allow_headers=["*"])
+    for route in widget_service.app.routes:
+        if getattr(route, "path", None) in dict(ENDPOINTS):
+            endpoint = route.endpoint
+
+            # 시그니처는 __wrapped__로 원래 함수의 것을 쓰고, 코루틴 함수가 아니므로 스레드 풀에서 실행됨
+            @functools.wraps(endpoint)
+            def sync_endpoint(*args, __endpoint=endpoint, **kwargs):
+                return _run_to_completion(__endpoint(*args, **kwargs))
+
+            app.add_api_route(route.path, sync_endpoint, methods=["GET"])
+    return app
+
+
+def percentile(values, fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='엔드포인트 실행 방식 부하 테스트')
+    parser.add_argument('--data-dir', help='기존 data 디렉토리 (없으면 가상 카탈로그 생성)')
+    parser.add_argument('--requests', type=int, default=20000)
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 64, 256])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = args.data_dir or str(generate_catalog(tmp, albums=10, tracks=10))
+        config = Path(tmp) / "catalogs.json"
+        config.write_text(json.dumps({"catalogs": {"default": {"data_dir": data_dir}}}), encoding='utf-8')
+        os.environ["DAILY_LYRICS_CATALOGS"] = str(config)
+
+        from src import widget_service
+        widget_service.catalog_warmup.run()  # 서버 시작 이벤트 없이 앱을 직접 호출하므로 바로 로드
+        logging.getLogger().setLevel(logging.WARNING)
+
+        apps = {"스레드 풀 (sync def)": threadpool_app(widget_service),
+                "이벤트 루프 (async def)": widget_service.app}
+        for path, query in ENDPOINTS:
+            for concurrency in args.concurrency:
+                print(f"\n{path} ({args.requests}회, 동시 {concurrency})")
+                for name, app in apps.items():
+                    rps, latencies = measure(app, path, query, args.requests, concurrency)
+                    print(f"  {name:22s} {rps:8.0f} req/s   p50 {percentile(latencies, 0.5) * 1000:7.2f}ms"
+                          f"   p99 {percentile(latencies, 0.99) * 1000:7.2f}ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+로깅 비용 벤치마크
+요청마다 파일에 바로 쓰는 접근 로그(uvicorn 기본 방식)와 로그 큐 + 샘플링 접근 로그의
+처리량, 로그 호출 한 번이 요청 스레드에서 쓰는 시간을 비교합니다.
+--write-delay로 레코드마다 쓰기 지연을 넣으면 느린 디스크나 막힌 stderr 파이프를 흉내 냅니다.
+
+사용법:
+    python3 benchmarks/logging_bench.py --requests 5000
+    python3 benchmarks/logging_bench.py --write-delay 0.5   # 레코드마다 0.5ms 쓰기 지연
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from asgi_bench import measure
+from synthetic_catalog import generate_catalog
+
+FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+
+def with_access_log(app, sample_rate: int):
+    """AccessLogMiddleware의 샘플링 비율만 바꾼 미들웨어 스택"""
+    from starlette.middleware import Middleware
+
+    from src.log_pipeline import AccessLogMiddleware
+
+    user_middleware = []
+    for m in app.user_middleware:
+        options = dict(m.options)
+        if m.cls is AccessLogMiddleware:
+            options["sample_rate"] = sample_rate
+        user_middleware.append(Middleware(m.cls, **options))
+    configured = app.__class__.__new__(app.__class__)
+    configured.__dict__.update(app.__dict__)
+    configured.user_middleware = user_middleware
+    configured.middleware_stack = None
+    return configured
+
+
+class SlowFileHandler(logging.FileHandler):
+    """레코드마다 delay초 더 걸리는 파일 핸들러"""
+
+    def __init__(self, path: str, delay: float):
+        super().__init__(path, encoding='utf-8')
+        self.write_delay = delay
+
+    def emit(self, record):
+        if self.write_delay:
+            time.sleep(self.write_delay)
+        super().emit(record)
+
+
+def use_file_handler(path: str, queued: bool, delay: float, max_queue: int = 10000):
+    """루트 로거를 파일 핸들러 하나로 바꾸고, queued면 로그 큐 뒤로 옮김"""
+    from src.log_pipeline import LogPipeline
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    handler = SlowFileHandler(path, delay)
+    handler.setFormatter(logging.Formatter(FORMAT))
+    root.addHandler(handler)
+    root.setLevel(logging.INFO)
+    return LogPipeline(max_queue).start() if queued else None
+
+
+def call_cost(logger: logging.Logger, repeat: int) -> float:
+    """logger.info 한 번이 호출한 스레드에서 쓰는 시간 (µs)"""
+    start = time.perf_counter()
+    for i in range(repeat):
+        logger.info('127.0.0.1 - "GET /current-lyric?interval=3h" %d %.1fms', 200, 0.4)
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description='로깅 방식별 처리량 비교')
+    parser.add_argument('--data-dir', help='기존 data 디렉토리 (없으면 가상 카탈로그 생성)')
+    parser.add_argument('--requests', type=int, default=5000)
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--rounds', type=int, default=3, help='반복 측정 횟수 (최댓값 사용)')
+    parser.add_argument('--write-delay', type=float, default=0.0, help='레코드마다 넣을 쓰기 지연 (ms)')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = args.data_dir or str(generate_catalog(tmp, albums=10, tracks=10))
+        config = Path(tmp) / "catalogs.json"
+        config.write_text(json.dumps({"catalogs": {"default": {"data_dir": data_dir}}}), encoding='utf-8')
+        os.environ["DAILY_LYRICS_CATALOGS"] = str(config)
+        os.environ["DAILY_LYRICS_LOG_QUEUE"] = "0"
+
+        from src import widget_service
+        widget_service.catalog_warmup.run()  # 서버 시작 이벤트 없이 앱을 직접 호출하므로 바로 로드
+        log_path = str(Path(tmp) / "access.log")
+        delay = args.write_delay / 1000
+        access_logger = logging.getLogger("src.widget_service.access")
+
+        # (이름, 큐 사용, 샘플링 비율)
+        cases = [
+            ("파일 직접, 모든 요청", False, 1),
+            ("로그 큐, 모든 요청", True, 1),
+            ("로그 큐, 100건 중 1건", True, 100),
+        ]
+
+        print(f"\nlogger.info 1회 (요청 스레드 기준, 쓰기 지연 {args.write_delay}ms)")
+        for name, queued in (("파일 직접", False), ("로그 큐", True)):
+            # 큐가 넘치지 않도록 큐 크기를 호출 횟수보다 크게
+            pipeline = use_file_handler(log_path, queued, delay, max_queue=60000)
+            cost = call_cost(access_logger, 2000 if delay else 50000)
+            if pipeline is not None:
+                pipeline.stop()
+            print(f"  {name:8s} {cost:6.2f}µs")
+
+        for path, query in (("/current-lyric", "interval=3h"), ("/random-lyric", "")):
+            print(f"\n{path} ({args.requests}회, 동시 {args.concurrency})")
+            for name, queued, sample_rate in cases:
+                app = with_access_log(widget_service.app, sample_rate)
+                pipeline = use_file_handler(log_path, queued, delay)
+                best = 0.0
+                for _ in range(args.rounds):
+                    rps, _ = measure(app, path, query, args.requests, args.concurrency)
+                    best = max(best, rps)
+                dropped = pipeline.dropped if pipeline is not None else 0
+                if pipeline is not None:
+                    pipeline.stop()
+                print(f"  {name:20s} {best:9.0f} req/s  (버린 로그 {dropped}건)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+메트릭 기록 비용 벤치마크
+MetricsMiddleware를 뺀 앱과 넣은 앱의 처리량, 기록 한 번의 비용, /metrics 렌더링 시간을 비교합니다.
+
+사용법:
+    python3 benchmarks/metrics.py --requests 5000
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from asgi_bench import measure
+from synthetic_catalog import generate_catalog
+
+
+def without_metrics(app):
+    """MetricsMiddleware만 뺀 미들웨어 스택 (라우트와 다른 미들웨어는 그대로)"""
+    from starlette.middleware import Middleware
+
+    from src.metrics import MetricsMiddleware
+
+    user_middleware = [m for m in app.user_middleware if m.cls is not MetricsMiddleware]
+    stripped = app.__class__.__new__(app.__class__)
+    stripped.__dict__.update(app.__dict__)
+    stripped.user_middleware = [Middleware(m.cls, **m.options) for m in user_middleware]
+    stripped.middleware_stack = None
+    return stripped
+
+
+def record_cost(repeat: int):
+    """카운터 + 히스토그램 기록 한 번의 비용 (µs)"""
+    from src.metrics import MetricsRegistry
+
+    metrics = MetricsRegistry("bench")
+    counter = metrics.counter("requests_total", "bench")
+    histogram = metrics.histogram("duration_seconds", "bench")
+    labels = (("route", "/current-lyric"), ("interval", "3h"))
+    status_labels = labels + (("status", "200"),)
+
+    start = time.perf_counter()
+    for i in range(repeat):
+        histogram.observe(0.0004, labels)
+        counter.inc(status_labels)
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description='메트릭 기록 비용 측정')
+    parser.add_argument('--data-dir', help='기존 data 디렉토리 (없으면 가상 카탈로그 생성)')
+    parser.add_argument('--requests', type=int, default=5000)
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--rounds', type=int, default=3, help='번갈아 측정할 횟수 (최댓값 사용)')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = args.data_dir or str(generate_catalog(tmp, albums=10, tracks=10))
+        config = Path(tmp) / "catalogs.json"
+        config.write_text(json.dumps({"catalogs": {"default": {"data_dir": data_dir}}}), encoding='utf-8')
+        os.environ["DAILY_LYRICS_CATALOGS"] = str(config)
+
+        from src import widget_service
+        widget_service.catalog_warmup.run()  # 서버 시작 이벤트 없이 앱을 직접 호출하므로 바로 로드
+        logging.getLogger().setLevel(logging.WARNING)
+
+        print(f"\n기록 1회 (카운터 + 히스토그램): {record_cost(200000):.2f}µs")
+
+        apps = {"메트릭 없음": without_metrics(widget_service.app), "메트릭 기록": widget_service.app}
+        for path, query in (("/current-lyric", "interval=3h"), ("/random-lyric", "")):
+            print(f"\n{path} ({args.requests}회, 동시 {args.concurrency})")
+            best = {name: 0.0 for name in apps}
+            for _ in range(args.rounds):
+                for name, app in apps.items():
+                    rps, _ = measure(app, path, query, args.requests, args.concurrency)
+                    best[name] = max(best[name], rps)
+            for name, rps in best.items():
+                print(f"  {name:8s} {rps:9.0f} req/s")
+
+        start = time.perf_counter()
+        body = widget_service.metrics.render()
+        print(f"\n/metrics 렌더링: {(time.perf_counter() - start) * 1000:.2f}ms ({len(body.splitlines())}줄)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+가사 응답 직렬화 벤치마크
+요청마다 딕셔너리를 만들어 JSONResponse로 직렬화하던 방식과
+미리 직렬화한 바이트에 timestamp만 끼워 넣는 방식(PreparedLyric)을 비교합니다.
+
+사용법:
+    python3 benchmarks/responses.py --requests 5000
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from asgi_bench import measure
+from synthetic_catalog import generate_catalog
+
+
+def legacy_app(widget_service):
+    """
+    이전 방식의 /current-lyric, /random-lyric
+    파라미터와 캐시 헤더 처리는 지금과 같고, 딕셔너리를 만들어 INFO 로그를 남긴 뒤 JSONResponse로 직렬화
+    """
+    from typing import Optional
+
+    from fastapi import FastAPI, Header, Response
+    from fastapi.middleware.cors import CORSMiddleware
+
+    from src.daily_selector import get_block_start, get_next_block_start, get_random_lyric
+    from src.http_cache import block_cache_headers, make_etag
+    from src.selection_cache import BlockSelectionCache
+
+    app = FastAPI()
+    app.add_middleware(CORSMiddleware, allow_origins=["*"], allow_credentials=True,
+                       allow_methods=["*"], allow_headers=["*"])
+    registry, logger = widget_service.registry, widget_service.logger
+    cache = BlockSelectionCache(lambda chunk, interval: {**widget_service.lyric_data(chunk), "interval": interval})
+
+    @app.get("/current-lyric")
+    def current(response: Response,
+                interval: str = widget_service.INTERVAL_QUERY,
+                tz: Optional[str] = widget_service.TZ_QUERY,
+                catalog: Optional[str] = widget_service.CATALOG_QUERY,
+                if_none_match: Optional[str] = Header(default=None)):
+        now = widget_service.resolve_request_time(interval, tz)
+        version, seed, data = cache.get_entry(registry.default_name, registry.default, interval, now,
+                                              widget_service.SELECTION_ALGORITHM)
+        etag = make_etag(registry.default_name, version, interval, seed, widget_service.SELECTION_ALGORITHM, None, tz)
+        response.headers.update(block_cache_headers(etag, now, get_next_block_start(now, interval)))
+        logger.info(f"가사 반환: {data['title']} (interval={interval})")
+        return {"success": True, "data": {**data, "timestamp": get_block_start(now, interval).isoformat()}}
+
+    @app.get("/random-lyric")
+    def random_lyric(catalog: Optional[str] = widget_service.CATALOG_QUERY):
+        chunk = get_random_lyric(registry.default.get_all_chunks())
+        logger.info(f"랜덤 가사 반환: {chunk['title']}")
+        return {"success": True, "data": {**widget_service.lyric_data(chunk), "timestamp": datetime.now().isoformat()}}
+
+    return app
+
+
+def serialization(widget_service, repeat: int):
+    """직렬화만 따로 비교 (요청 처리 제외)"""
+    from fastapi.encoders import jsonable_encoder
+    from fastapi.responses import JSONResponse
+
+    from src import responses
+
+    chunk = widget_service.registry.default.get_all_chunks()[0]
+    data = {**widget_service.lyric_data(chunk), "interval": "3h"}
+    timestamp = datetime.now().isoformat()
+    prepared = responses.PreparedLyric(data)
+
+    def timed(fn):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            fn()
+        return (time.perf_counter() - start) / repeat * 1e6
+
+    print(f"\n직렬화 1회 (µs, {repeat}회 평균)")
+    print(f"  jsonable_encoder + JSONResponse : "
+          f"{timed(lambda: JSONResponse(jsonable_encoder({'success': True, 'data': {**data, 'timestamp': timestamp}}))):7.2f}")
+    if responses.orjson is not None:
+        print(f"  orjson.dumps (매번 직렬화)      : "
+              f"{timed(lambda: responses.orjson.dumps({'success': True, 'data': {**data, 'timestamp': timestamp}})):7.2f}")
+    print(f"  json.dumps (매번 직렬화)        : "
+          f"{timed(lambda: json.dumps({'success': True, 'data': {**data, 'timestamp': timestamp}}, ensure_ascii=False, separators=(',', ':')).encode()):7.2f}")
+    print(f"  PreparedLyric.render            : {timed(lambda: prepared.render(timestamp)):7.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='가사 응답 직렬화 벤치마크')
+    parser.add_argument('--data-dir', help='기존 data 디렉토리 (없으면 가상 카탈로그 생성)')
+    parser.add_argument('--requests', type=int, default=5000)
+    parser.add_argument('--concurrency', type=int, default=1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = args.data_dir or str(generate_catalog(tmp, albums=10, tracks=10))
+        config = Path(tmp) / "catalogs.json"
+        config.write_text(json.dumps({"catalogs": {"default": {"data_dir": data_dir}}}), encoding='utf-8')
+        os.environ["DAILY_LYRICS_CATALOGS"] = str(config)
+
+        from src import widget_service
+        widget_service.catalog_warmup.run()  # 서버 시작 이벤트 없이 앱을 직접 호출하므로 바로 로드
+
+        # 로그는 버리되 INFO 레코드 생성과 포맷 비용은 그대로 남김
+        for handler in logging.getLogger().handlers:
+            handler.stream = open(os.devnull, 'w')
+
+        serialization(widget_service, 20000)
+
+        apps = {"이전 방식": legacy_app(widget_service), "미리 직렬화": widget_service.app}
+        for path, query in (("/current-lyric", "interval=3h"), ("/random-lyric", "")):
+            print(f"\n{path} ({args.requests}회, 동시 {args.concurrency})")
+            for name, app in apps.items():
+                rps, _ = measure(app, path, query, args.requests, args.concurrency)
+                print(f"  {name:8s} {rps:9.0f} req/s")
+
+
+if __name__ == '__main__':
+    main()
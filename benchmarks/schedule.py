@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+가사 일정 일괄 계산 벤치마크
+블록마다 get_interval_lyric을 부르는 방식과 compute_schedule(순수 파이썬 / NumPy)을 비교합니다.
+
+사용법:
+    python3 benchmarks/schedule.py --years 12 --interval 1h   # 약 10만 블록
+    python3 benchmarks/schedule.py --years 3 --interval 15m   # 기존 시드를 쓰지 않는 주기
+"""
+
+import argparse
+import sys
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.daily_selector import get_block_start, get_interval_lyric, parse_interval
+from src.schedule import compute_schedule
+from src.selection import np
+
+
+def per_block(chunks, start, end, interval, algorithm):
+    step = timedelta(seconds=parse_interval(interval).seconds)
+    current = get_block_start(datetime.combine(start, datetime.min.time()), interval)
+    stop = datetime.combine(end + timedelta(days=1), datetime.min.time())
+    picks = []
+    while current < stop:
+        picks.append(get_interval_lyric(chunks, interval, current, algorithm))
+        current += step
+    return picks
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description='가사 일정 일괄 계산 벤치마크')
+    parser.add_argument('--chunks', type=int, default=787, help='카탈로그 청크 수')
+    parser.add_argument('--years', type=int, default=12)
+    parser.add_argument('--interval', type=parse_interval, default='1h', help='시간 주기 (예: 15m, 1h, 1w)')
+    args = parser.parse_args()
+    args.interval = args.interval.name
+
+    chunks = list(range(args.chunks))
+    start = date(2025, 1, 1)
+    end = date(2025 + args.years, 1, 1) - timedelta(days=1)
+
+    for algorithm in ('hash', 'legacy'):
+        print(f"\n[{algorithm}] {start} ~ {end}, interval={args.interval}")
+        picks, elapsed = timed(per_block, chunks, start, end, args.interval, algorithm)
+        print(f"  블록별 get_interval_lyric  {elapsed:9.1f}ms ({len(picks)}개 블록)")
+
+        schedule, elapsed = timed(compute_schedule, len(chunks), start, end, args.interval, algorithm, False)
+        assert list(schedule.indices) == picks
+        print(f"  compute_schedule (순수)    {elapsed:9.1f}ms")
+
+        if np is not None:
+            schedule, elapsed = timed(compute_schedule, len(chunks), start, end, args.interval, algorithm, True)
+            assert schedule.indices.tolist() == picks
+            print(f"  compute_schedule (NumPy)   {elapsed:9.1f}ms ({schedule.indices.nbytes / 1024:.0f} KiB)")
+        else:
+            print("  compute_schedule (NumPy)   NumPy 미설치")
+
+
+if __name__ == "__main__":
+    main()
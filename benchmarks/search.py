@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+가사 검색 벤치마크
+n-gram 역색인 검색과 all_chunks 선형 탐색을 비교합니다.
+
+사용법:
+    python3 benchmarks/search.py --albums 100 --tracks 84   # 약 10만 청크
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from src.lyrics_database import LyricsDatabase
+from src.search_index import normalize_text
+from synthetic_catalog import generate_catalog
+
+QUERIES = ['사랑', '그대', '밤 별', '하늘바람', '너를사랑', '가']
+
+
+def linear_search(chunks, query):
+    q = normalize_text(query)
+    return [chunk for chunk in chunks if q in normalize_text("".join(chunk.lines))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='가사 검색 벤치마크')
+    parser.add_argument('--data-dir', help='기존 data 디렉토리 (없으면 가상 카탈로그 생성)')
+    parser.add_argument('--albums', type=int, default=100)
+    parser.add_argument('--tracks', type=int, default=84)
+    parser.add_argument('--chunks', type=int, default=12)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = args.data_dir or str(generate_catalog(tmp, args.albums, args.tracks, args.chunks))
+        db = LyricsDatabase(data_dir, use_snapshot=False)
+
+        start = time.perf_counter()
+        db.get_search_index()
+        build = time.perf_counter() - start
+        print(f"가사 청크 {db.get_chunk_count()}개, 인덱스 생성 {build:.2f} s")
+
+        for query in QUERIES:
+            start = time.perf_counter()
+            for _ in range(args.repeat):
+                total, _ = db.search(query, 10)
+            indexed = (time.perf_counter() - start) / args.repeat
+
+            start = time.perf_counter()
+            linear_search(db.get_all_chunks(), query)
+            linear = time.perf_counter() - start
+
+            print(f"  {query:<8} 결과 {total:6d}개  인덱스 {indexed * 1000:7.2f} ms  선형 탐색 {linear * 1000:8.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+가사 선택 벤치마크
+기존 전역 random.seed 방식과 legacy/hash 선택 엔진의 호출당 비용을 스레드 수별로 비교합니다.
+
+사용법:
+    python3 benchmarks/selection.py --chunks 100000 --threads 1 8
+"""
+
+import argparse
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.selection import hash_index, legacy_index
+
+
+def global_seed_index(seed, size):
+    # 변경 전 방식: 전역 생성기를 시드하고 선택한 뒤 OS 엔트로피로 다시 시드
+    random.seed(seed)
+    index = random.randrange(size)
+    random.seed()
+    return index
+
+
+METHODS = [
+    ('global random.seed', global_seed_index),
+    ('legacy (Random)', legacy_index),
+    ('hash (splitmix64)', hash_index),
+]
+
+
+def run(select, size, calls, threads):
+    def worker(offset):
+        base = 2025120400 + offset
+        for i in range(calls):
+            select(base + i, size)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(worker, range(threads)))
+    return (time.perf_counter() - start) / (calls * threads) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description='가사 선택 벤치마크')
+    parser.add_argument('--chunks', type=int, default=100000, help='카탈로그 청크 수')
+    parser.add_argument('--calls', type=int, default=50000, help='스레드당 호출 수')
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 8])
+    args = parser.parse_args()
+
+    print(f"청크 {args.chunks}개, 스레드당 {args.calls}회 호출")
+    for threads in args.threads:
+        print(f"\n스레드 {threads}개")
+        for name, select in METHODS:
+            print(f"  {name:<20} {run(select, args.chunks, args.calls, threads):7.2f} µs/호출")
+
+
+if __name__ == "__main__":
+    main()
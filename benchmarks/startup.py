@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+서버 시작 시간 벤치마크
+프로세스를 띄운 시점부터 첫 응답 바이트(/livez), 준비 완료(/readyz 200), 첫 가사 응답(/current-lyric 200)까지의
+시간을 잽니다. 비교 대상은 카탈로그를 다 로드한 뒤 포트를 여는 방식(python -m src.prefork --workers 1,
+이전의 import 시 로드와 같은 순서)과 포트를 먼저 열고 백그라운드에서 로드하는 방식(uvicorn 단일 프로세스)입니다.
+
+사용법:
+    python3 benchmarks/startup.py --albums 300 --tracks 20
+    python3 benchmarks/startup.py --snapshot   # 스냅샷(mmap) 카탈로그
+"""
+
+import argparse
+import http.client
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from synthetic_catalog import generate_catalog
+
+# 첫 응답은 촘촘히, 이후 단계는 느슨하게 확인 (촘촘한 확인 요청은 로드 스레드와 GIL을 다퉈 로드를 늦춤)
+FIRST_POLL_INTERVAL = 0.005
+POLL_INTERVAL = 0.05
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def status_of(port: int, path: str) -> Optional[int]:
+    """응답 상태 코드 (연결할 수 없으면 None)"""
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
+    try:
+        connection.request("GET", path)
+        response = connection.getresponse()
+        response.read()
+        return response.status
+    except OSError:
+        return None
+    finally:
+        connection.close()
+
+
+def measure(mode: str, env: Dict[str, str], timeout: float = 300.0) -> Dict[str, float]:
+    """프로세스 시작부터 각 단계까지 걸린 시간 (초)"""
+    port = free_port()
+    if mode == "prefork":
+        command = [sys.executable, "-m", "src.prefork", "--workers", "1",
+                   "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning"]
+    else:
+        command = [sys.executable, "-m", "uvicorn", "src.widget_service:app",
+                   "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning"]
+
+    # (단계 이름, 경로, 기다릴 상태 코드, None이면 어떤 응답이든)
+    stages = [("첫 응답", "/livez", None, FIRST_POLL_INTERVAL),
+              ("준비 완료", "/readyz", 200, POLL_INTERVAL),
+              ("첫 가사", "/current-lyric?interval=3h", 200, POLL_INTERVAL)]
+    timings: Dict[str, float] = {}
+    start = time.perf_counter()
+    process = subprocess.Popen(command, cwd=project_root, env=env,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        for name, path, expected, interval in stages:
+            while True:
+                if process.poll() is not None:
+                    raise RuntimeError(f"서버가 종료되었습니다 ({mode}, 코드 {process.returncode})")
+                if time.perf_counter() - start > timeout:
+                    raise RuntimeError(f"시간 초과 ({mode}, {name})")
+                status = status_of(port, path)
+                if status is not None and (expected is None or status == expected):
+                    timings[name] = time.perf_counter() - start
+                    break
+                time.sleep(interval)
+        return timings
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=15)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='프로세스 시작부터 첫 응답까지의 시간 측정')
+    parser.add_argument('--data-dir', help='기존 data 디렉토리 (없으면 가상 카탈로그 생성)')
+    parser.add_argument('--albums', type=int, default=300)
+    parser.add_argument('--tracks', type=int, default=20)
+    parser.add_argument('--rounds', type=int, default=3, help='방식별 반복 횟수 (중앙값 사용)')
+    parser.add_argument('--snapshot', action='store_true', help='스냅샷 파일을 만든 뒤 mmap으로 로드')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = args.data_dir or str(generate_catalog(tmp, albums=args.albums, tracks=args.tracks))
+        catalog = {"data_dir": data_dir, "use_snapshot": args.snapshot}
+        if args.snapshot:
+            from src.lyrics_database import LyricsDatabase
+            snapshot_path = Path(tmp) / "catalog.snapshot"
+            LyricsDatabase(data_dir, use_snapshot=False).build_snapshot(str(snapshot_path))
+            catalog["snapshot_path"] = str(snapshot_path)
+
+        config = Path(tmp) / "catalogs.json"
+        config.write_text(json.dumps({"catalogs": {"default": catalog}}), encoding='utf-8')
+        env = {**os.environ, "DAILY_LYRICS_CATALOGS": str(config), "PYTHONPATH": str(project_root)}
+
+        print(f"카탈로그 {args.albums}×{args.tracks} 트랙{' (스냅샷)' if args.snapshot else ''}, "
+              f"방식별 {args.rounds}회 중앙값 (프로세스 시작 기준)")
+        print(f"  {'방식':28s} {'첫 응답':>10s} {'준비 완료':>10s} {'첫 가사':>10s}")
+        for mode, title in (("prefork", "로드 후 포트 열기 (이전 순서)"), ("uvicorn", "포트 먼저, 백그라운드 로드")):
+            rounds = [measure(mode, env) for _ in range(args.rounds)]
+            median = {name: sorted(r[name] for r in rounds)[len(rounds) // 2] for name in rounds[0]}
+            print(f"  {title:28s} " + " ".join(f"{median[name] * 1000:8.0f}ms" for name in median))
+
+
+if __name__ == '__main__':
+    main()
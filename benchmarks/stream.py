@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+/stream (Server-Sent Events) 벤치마크
+연결 하나가 차지하는 메모리와, 블록 경계에서 모든 구독자에게 이벤트가 전달되기까지의 시간을 잽니다.
+
+사용법:
+    python3 benchmarks/stream.py --connections 1000 5000
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from synthetic_catalog import generate_catalog
+
+
+def stream_scope(query: str) -> dict:
+    return {
+        "type": "http", "http_version": "1.1", "method": "GET", "scheme": "http",
+        "path": "/stream", "raw_path": b"/stream", "root_path": "", "query_string": query.encode(),
+        "headers": [(b"host", b"bench")], "client": ("127.0.0.1", 50000), "server": ("127.0.0.1", 58384)
+    }
+
+
+async def connection_memory(app, broadcaster, connections: int, query: str):
+    """ASGI 앱에 SSE 연결을 connections개 열어 둔 상태의 메모리 증가량 (연결당)"""
+    disconnect = asyncio.Event()
+    received = 0
+
+    async def receive():
+        await disconnect.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        nonlocal received
+        if message["type"] == "http.response.body" and message.get("body", b"").startswith(b"id:"):
+            received += 1
+
+    # 채널 스케줄러와 첫 이벤트는 측정에서 제외
+    warmup = asyncio.ensure_future(app(stream_scope(query), receive, send))
+    while received < 1:
+        await asyncio.sleep(0.01)
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    tasks = [asyncio.ensure_future(app(stream_scope(query), receive, send)) for _ in range(connections)]
+    while received < connections + 1:
+        await asyncio.sleep(0.01)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    subscribers = broadcaster.subscriber_count
+    disconnect.set()
+    await asyncio.gather(warmup, *tasks)
+    return (after - before) / connections, subscribers
+
+
+async def fan_out_latency(connections: int, events: int):
+    """이벤트를 만든 순간부터 각 구독자가 받기까지의 지연 시간"""
+    from src.broadcaster import BlockBroadcaster, sse_frame
+
+    async def produce(key):
+        now = time.perf_counter()
+        return f"{now}", sse_frame(f"{now}", "lyric", json.dumps(now).encode()), time.time() + 0.05
+
+    broadcaster = BlockBroadcaster(produce)
+    latencies = []
+
+    async def subscriber():
+        subscription = broadcaster.subscribe("bench")
+        try:
+            for _ in range(events):
+                frame = await subscription.next(5.0)
+                created = float(frame.rsplit(b"data: ", 1)[1])
+                latencies.append(time.perf_counter() - created)
+        finally:
+            broadcaster.unsubscribe("bench", subscription)
+
+    await asyncio.gather(*(subscriber() for _ in range(connections)))
+    await broadcaster.close()
+    latencies.sort()
+    return latencies[len(latencies) // 2], latencies[int(len(latencies) * 0.99)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='/stream 연결당 메모리와 이벤트 전달 지연 측정')
+    parser.add_argument('--data-dir', help='기존 data 디렉토리 (없으면 가상 카탈로그 생성)')
+    parser.add_argument('--connections', type=int, nargs='+', default=[1000, 5000])
+    parser.add_argument('--events', type=int, default=20, help='지연 측정에 쓸 이벤트 수')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = args.data_dir or str(generate_catalog(tmp, albums=10, tracks=10))
+        config = Path(tmp) / "catalogs.json"
+        config.write_text(json.dumps({"catalogs": {"default": {"data_dir": data_dir}}}), encoding='utf-8')
+        os.environ["DAILY_LYRICS_CATALOGS"] = str(config)
+
+        from src import widget_service
+        widget_service.catalog_warmup.run()  # 서버 시작 이벤트 없이 앱을 직접 호출하므로 바로 로드
+        logging.getLogger().setLevel(logging.WARNING)
+
+        print(f"{'연결 수':>8s} {'연결당 메모리':>14s} {'전달 p50':>10s} {'전달 p99':>10s}")
+        for connections in args.connections:
+            per_connection, subscribers = asyncio.run(connection_memory(
+                widget_service.app, widget_service.broadcaster, connections, "interval=3h"
+            ))
+            assert subscribers == connections + 1
+            p50, p99 = asyncio.run(fan_out_latency(connections, args.events))
+            print(f"{connections:8d} {per_connection / 1024:11.1f} KB {p50 * 1000:8.2f}ms {p99 * 1000:8.2f}ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+벤치마크용 가상 가사 카탈로그 생성기
+data/ 와 같은 구조(앨범 폴더 / 트랙 JSON)로 임의의 가사를 만듭니다.
+
+사용법:
+    python3 benchmarks/synthetic_catalog.py /tmp/bench_data --albums 50 --tracks 40
+"""
+
+import argparse
+import json
+import random
+from pathlib import Path
+
+_SYLLABLES = "가나다라마바사아자차카타파하너를그대사랑밤별꿈빛바람노래하늘"
+
+
+def _make_line(rng: random.Random) -> str:
+    words = []
+    for _ in range(rng.randint(3, 6)):
+        words.append("".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(1, 4))))
+    return " ".join(words)
+
+
+def generate_catalog(data_dir: str, albums: int = 20, tracks: int = 10,
+                     chunks: int = 12, seed: int = 0) -> Path:
+    """
+    가상 카탈로그 생성
+
+    Args:
+        data_dir: 출력 디렉토리
+        albums: 앨범 수
+        tracks: 앨범당 트랙 수
+        chunks: 트랙당 청크 수
+        seed: 난수 시드 (같은 시드면 같은 카탈로그)
+
+    Returns:
+        생성된 디렉토리 경로
+    """
+    rng = random.Random(seed)
+    root = Path(data_dir)
+    root.mkdir(parents=True, exist_ok=True)
+
+    for a in range(1, albums + 1):
+        album_name = f"Album {a:03d}"
+        album_dir = root / f"{a:03d}_Album{a:03d}"
+        album_dir.mkdir(exist_ok=True)
+        year = 2015 + a % 10
+
+        for t in range(1, tracks + 1):
+            track = {
+                'track_number': t,
+                'title': f"Track {a:03d}-{t:02d}",
+                'album': album_name,
+                'year': year,
+                'artist': "태연 (TAEYEON)",
+                'chunks': [
+                    {'id': c, 'lines': [_make_line(rng) for _ in range(rng.randint(2, 4))]}
+                    for c in range(1, chunks + 1)
+                ]
+            }
+            with open(album_dir / f"{t:02d}_Track{t:02d}.json", 'w', encoding='utf-8') as f:
+                json.dump(track, f, ensure_ascii=False, indent=2)
+
+    return root
+
+
+def main():
+    parser = argparse.ArgumentParser(description='벤치마크용 가상 가사 카탈로그 생성')
+    parser.add_argument('data_dir', help='출력 디렉토리')
+    parser.add_argument('--albums', type=int, default=20, help='앨범 수 (기본: 20)')
+    parser.add_argument('--tracks', type=int, default=10, help='앨범당 트랙 수 (기본: 10)')
+    parser.add_argument('--chunks', type=int, default=12, help='트랙당 청크 수 (기본: 12)')
+    parser.add_argument('--seed', type=int, default=0, help='난수 시드 (기본: 0)')
+    args = parser.parse_args()
+
+    root = generate_catalog(args.data_dir, args.albums, args.tracks, args.chunks, args.seed)
+    total = args.albums * args.tracks
+    print(f"✅ {root}: 트랙 {total}개, 가사 청크 {total * args.chunks}개 생성")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+멀티 워커 메모리 벤치마크 (Linux 전용, /proc/<pid>/smaps_rollup 사용)
+uvicorn --workers N(워커마다 카탈로그를 따로 로드)과 src.prefork(부모에서 한 번 로드 후 fork)를
+같은 카탈로그로 띄워 프로세스별 RSS, PSS, 전용 메모리(USS)를 비교합니다.
+워커 하나를 더 띄울 때 드는 메모리는 워커의 USS입니다.
+
+사용법:
+    python3 benchmarks/worker_memory.py --workers 4 --albums 100 --tracks 20
+    python3 benchmarks/worker_memory.py --workers 4 --snapshot   # 스냅샷(mmap) 카탈로그
+"""
+
+import argparse
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from pathlib import Path
+from typing import Dict, List
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from synthetic_catalog import generate_catalog
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def memory_of(pid: int) -> Dict[str, int]:
+    """smaps_rollup의 Rss, Pss, Private_Clean + Private_Dirty (KB)"""
+    values = {}
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) >= 2 and parts[0].endswith(":"):
+                values[parts[0][:-1]] = int(parts[1]) if parts[1].isdigit() else 0
+    return {
+        "rss": values.get("Rss", 0),
+        "pss": values.get("Pss", 0),
+        "uss": values.get("Private_Clean", 0) + values.get("Private_Dirty", 0)
+    }
+
+
+def descendants(pid: int) -> List[int]:
+    """pid의 모든 자손 프로세스"""
+    found = []
+    try:
+        with open(f"/proc/{pid}/task/{pid}/children") as f:
+            children = [int(child) for child in f.read().split()]
+    except OSError:
+        return found
+    for child in children:
+        found.append(child)
+        found.extend(descendants(child))
+    return found
+
+
+def wait_ready(port: int, timeout: float = 120.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/health", timeout=1) as response:
+                if response.status == 200:
+                    return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError("서버가 시작되지 않았습니다")
+
+
+def exercise(port: int, requests: int) -> None:
+    """워커마다 요청이 골고루 가도록 새 연결로 여러 엔드포인트 호출"""
+    paths = ["/current-lyric?interval=3h", "/random-lyric", "/timeline?interval=1h&count=24", "/search?q=love"]
+    for i in range(requests):
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}{paths[i % len(paths)]}", timeout=10) as response:
+            response.read()
+
+
+def measure(mode: str, workers: int, env: Dict[str, str], requests: int) -> List[Dict]:
+    port = free_port()
+    if mode == "prefork":
+        command = [sys.executable, "-m", "src.prefork", "--workers", str(workers),
+                   "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning"]
+    else:
+        command = [sys.executable, "-m", "uvicorn", "src.widget_service:app", "--workers", str(workers),
+                   "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning"]
+
+    process = subprocess.Popen(command, cwd=project_root, env=env,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        wait_ready(port)
+        # 모든 워커가 카탈로그를 로드할 때까지 (spawn 방식은 워커마다 따로 로드)
+        time.sleep(2.0)
+        exercise(port, requests)
+        time.sleep(0.5)
+        rows = [{"role": "부모", "pid": process.pid, **memory_of(process.pid)}]
+        for pid in descendants(process.pid):
+            with open(f"/proc/{pid}/cmdline", "rb") as f:
+                cmdline = f.read().replace(b"\0", b" ").decode(errors="replace")
+            # spawn 방식의 multiprocessing 보조 프로세스(resource_tracker)는 워커가 아님
+            role = "보조" if "resource_tracker" in cmdline else "워커"
+            rows.append({"role": role, "pid": pid, **memory_of(pid)})
+        return rows
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=15)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='멀티 워커 프로세스별 메모리 비교')
+    parser.add_argument('--data-dir', help='기존 data 디렉토리 (없으면 가상 카탈로그 생성)')
+    parser.add_argument('--albums', type=int, default=100)
+    parser.add_argument('--tracks', type=int, default=20)
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--snapshot', action='store_true', help='스냅샷 파일을 만든 뒤 mmap으로 로드')
+    args = parser.parse_args()
+
+    if not Path("/proc/self/smaps_rollup").exists():
+        print("이 벤치마크는 /proc/<pid>/smaps_rollup이 있는 Linux에서만 동작합니다.")
+        return 1
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = args.data_dir or str(generate_catalog(tmp, albums=args.albums, tracks=args.tracks))
+        catalog = {"data_dir": data_dir, "use_snapshot": args.snapshot}
+        if args.snapshot:
+            from src.lyrics_database import LyricsDatabase
+            snapshot_path = Path(tmp) / "catalog.snapshot"
+            LyricsDatabase(data_dir, use_snapshot=False).build_snapshot(str(snapshot_path))
+            catalog["snapshot_path"] = str(snapshot_path)
+
+        config = Path(tmp) / "catalogs.json"
+        config.write_text(json.dumps({"catalogs": {"default": catalog}}), encoding='utf-8')
+        env = {**os.environ, "DAILY_LYRICS_CATALOGS": str(config), "PYTHONPATH": str(project_root)}
+
+        print(f"워커 {args.workers}개, 카탈로그 {args.albums}×{args.tracks} 트랙"
+              f"{' (스냅샷)' if args.snapshot else ''}, 요청 {args.requests}회 후 측정")
+        for mode, title in (("spawn", "uvicorn --workers"), ("prefork", "python -m src.prefork")):
+            rows = measure(mode, args.workers, env, args.requests)
+            print(f"\n{title}")
+            print(f"  {'역할':4s} {'pid':>8s} {'RSS':>10s} {'PSS':>10s} {'USS':>10s}")
+            for row in rows:
+                print(f"  {row['role']:4s} {row['pid']:8d} {row['rss'] / 1024:8.1f}MB "
+                      f"{row['pss'] / 1024:8.1f}MB {row['uss'] / 1024:8.1f}MB")
+            worker_rows = [row for row in rows if row['role'] == "워커"]
+            total_pss = sum(row['pss'] for row in rows)
+            per_worker = sum(row['uss'] for row in worker_rows) / max(1, len(worker_rows))
+            print(f"  합계 PSS {total_pss / 1024:.1f}MB, 워커 하나 추가 비용(USS 평균) {per_worker / 1024:.1f}MB")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -10,13 +10,19 @@ import sys
 import argparse
 from datetime import datetime, date
 from pathlib import Path
+from typing import Optional
 
 # 프로젝트 루트를 Python 경로에 추가
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
+from src.covers import CoverStore
 from src.lyrics_database import LyricsDatabase
-from src.daily_selector import get_daily_lyric, get_random_lyric, get_interval_lyric, parse_date
+from src.daily_selector import (get_daily_lyric, get_random_lyric, get_interval_lyric, parse_date,
+                                parse_interval, resolve_timezone)
+from src.selection import ALGORITHMS, DEFAULT_ALGORITHM, get_hash_ring
+from src.schedule import compute_schedule
+from src.weights import SelectionWeights, get_alias_table
 
 
 def format_lyric_output(chunk: dict, show_date: str = None) -> str:
@@ -87,6 +93,81 @@ def show_stats(db: LyricsDatabase) -> None:
     print("\n" + "=" * 60 + "\n")
 
 
+def show_search_results(db: LyricsDatabase, query: str, limit: int, page: int) -> None:
+    """
+    가사 검색 결과를 표시
+
+    Args:
+        db: LyricsDatabase 인스턴스
+        query: 검색어
+        limit: 페이지당 결과 수
+        page: 페이지 번호 (1부터)
+    """
+    limit = max(limit, 1)
+    page = max(page, 1)
+    total, hits = db.search(query, limit, (page - 1) * limit)
+
+    if not hits:
+        print(f"\n🔍 '{query}' 검색 결과가 없습니다.\n")
+        return
+
+    pages = (total + limit - 1) // limit
+    print(f"\n🔍 '{query}' 검색 결과 {total}개 (페이지 {page}/{pages})")
+    for chunk, _ in hits:
+        print(format_lyric_output(chunk), end="")
+    print()
+
+
+def show_schedule(db: LyricsDatabase, start: str, end: str, interval: str, algorithm: str,
+                  weights: Optional[SelectionWeights] = None) -> bool:
+    """
+    날짜 범위의 블록별 가사 일정을 탭 구분 형식으로 출력 (미리보기/내보내기 용)
+
+    Args:
+        db: LyricsDatabase 인스턴스
+        start: 시작 날짜 문자열 (YYYY-MM-DD)
+        end: 종료 날짜 문자열 (YYYY-MM-DD)
+        interval: 시간 주기
+        algorithm: 선택 알고리즘
+        weights: 청크 가중치 (None이면 균등 선택)
+
+    Returns:
+        날짜 형식이 올바르면 True
+    """
+    start_date, end_date = parse_date(start), parse_date(end)
+    if start_date is None or end_date is None or end_date < start_date:
+        print(f"\n❌ 잘못된 날짜 범위: {start} ~ {end}")
+        print("   올바른 형식: YYYY-MM-DD YYYY-MM-DD (시작일 <= 종료일)\n")
+        return False
+
+    chunks = db.get_all_chunks()
+    ring = get_hash_ring(chunks) if algorithm == "consistent" else None
+    alias_table = get_alias_table(chunks, weights) if weights is not None else None
+    schedule = compute_schedule(len(chunks), start_date, end_date, interval, algorithm,
+                                ring=ring, alias_table=alias_table)
+    for block_start, chunk in schedule.iter_lyrics(chunks):
+        lines = chunk['lines']
+        print(f"{block_start:%Y-%m-%d %H:%M}\t{chunk['album']}\t{chunk['title']}\t{lines[0] if lines else ''}")
+    return True
+
+
+def interval_arg(value: str) -> str:
+    """--interval 값 검증 (argparse type)"""
+    try:
+        parse_interval(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+    return value
+
+
+def timezone_arg(value: str):
+    """--tz 값을 tzinfo로 변환 (argparse type)"""
+    try:
+        return resolve_timezone(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
 def main():
     """메인 함수"""
     parser = argparse.ArgumentParser(
@@ -96,19 +177,47 @@ def main():
 예시:
   python cli.py                    # 오늘의 가사 (24시간 주기)
   python cli.py --interval 3h      # 3시간마다 바뀌는 가사
+  python cli.py --interval 15m --tz Asia/Seoul   # 서울 시각 기준 15분마다 바뀌는 가사
   python cli.py --random           # 완전 랜덤 가사
   python cli.py --date 2025-12-01  # 특정 날짜의 가사
   python cli.py --stats            # 통계 보기
+  python cli.py --build-snapshot   # data/ 를 스냅샷 파일로 컴파일
+  python cli.py --build-covers     # 앨범 커버 축소본 미리 생성 (Pillow 필요)
+  python cli.py --search 사랑      # 가사 검색
+  python cli.py --search 사랑 --page 2
+  python cli.py --schedule 2025-01-01 2025-12-31 --interval 1h > schedule.tsv
         """
     )
 
     parser.add_argument(
         '--interval',
-        type=str,
-        choices=['1h', '3h', '6h', '12h', '24h'],
+        type=interval_arg,
         default='24h',
         metavar='INTERVAL',
-        help='가사 변경 주기 (1h, 3h, 6h, 12h, 24h 중 선택, 기본: 24h)'
+        help='가사 변경 주기 (숫자 + m/h/d/w, 예: 15m, 90m, 3h, 24h, 1w, 기본: 24h)'
+    )
+
+    parser.add_argument(
+        '--tz',
+        type=timezone_arg,
+        metavar='ZONE',
+        help='블록 경계를 맞출 IANA 시간대 (예: Asia/Seoul, 기본: 시스템 시간대)'
+    )
+
+    parser.add_argument(
+        '--algorithm',
+        choices=list(ALGORITHMS),
+        default=DEFAULT_ALGORITHM,
+        help='가사 선택 알고리즘 (legacy: 기존 선택 결과 유지, hash: 해시 기반, '
+             'consistent: 가사를 추가해도 기존 일정 대부분 유지, '
+             'rotation: 모든 가사가 한 번씩 나올 때까지 반복 없음, 기본: legacy)'
+    )
+
+    parser.add_argument(
+        '--weights',
+        type=str,
+        metavar='FILE',
+        help='가중치 설정 JSON 파일 (앨범/연도/트랙/청크별 선택 확률 조정, legacy/hash 알고리즘만 지원)'
     )
 
     parser.add_argument(
@@ -130,8 +239,70 @@ def main():
         help='가사 데이터베이스 통계 표시'
     )
 
+    parser.add_argument(
+        '--build-snapshot',
+        action='store_true',
+        help='data/ 폴더 전체를 스냅샷 파일(data/.catalog.snapshot)로 컴파일'
+    )
+
+    parser.add_argument(
+        '--build-covers',
+        action='store_true',
+        help='data/covers/ 의 모든 커버 축소본(small, medium)을 미리 생성 (Pillow 필요)'
+    )
+
+    parser.add_argument(
+        '--search',
+        type=str,
+        metavar='QUERY',
+        help='가사 전문 검색 (띄어쓰기 무시, 부분 일치)'
+    )
+
+    parser.add_argument(
+        '--limit',
+        type=int,
+        default=5,
+        help='검색 결과 페이지당 개수 (기본: 5)'
+    )
+
+    parser.add_argument(
+        '--page',
+        type=int,
+        default=1,
+        help='검색 결과 페이지 번호 (기본: 1)'
+    )
+
+    parser.add_argument(
+        '--schedule',
+        nargs=2,
+        metavar=('START', 'END'),
+        help='날짜 범위(YYYY-MM-DD YYYY-MM-DD)의 블록별 가사 일정을 탭 구분 형식으로 출력'
+    )
+
     args = parser.parse_args()
 
+    # 스냅샷 빌드 (폴더를 직접 스캔해서 컴파일)
+    if args.build_snapshot:
+        db = LyricsDatabase()
+        snapshot_path = db.build_snapshot()
+        if snapshot_path is None:
+            print("\n⚠️  스냅샷 생성 실패: 서버와 CLI는 폴더 스캔으로 로드합니다\n")
+            return 1
+        db.load_snapshot(verify=False)
+        print(f"\n✅ 스냅샷 생성 완료: {snapshot_path}")
+        print(f"   앨범 {db.albums_count}개, 트랙 {db.tracks_count}개, 가사 청크 {db.get_chunk_count()}개\n")
+        return 0
+
+    # 커버 축소본 생성 (첫 요청의 축소 비용을 배포 시점으로 옮김)
+    if args.build_covers:
+        try:
+            result = CoverStore().build_variants()
+        except RuntimeError as e:
+            print(f"\n⚠️  {e}\n")
+            return 1
+        print(f"\n✅ 커버 축소본 생성 완료: 커버 {result['covers']}개, 축소본 {result['variants']}개\n")
+        return 0
+
     # 가사 데이터베이스 로드
     #print("\n📚 가사 데이터베이스 로딩 중...")
     db = LyricsDatabase()
@@ -147,12 +318,33 @@ def main():
         print("⚠️ data/ 폴더에 앨범과 트랙 JSON 파일을 추가해주세요.\n")
         return 1
 
+    # 가사 검색
+    if args.search is not None:
+        show_search_results(db, args.search, args.limit, args.page)
+        return 0
+
+    # 가중치 설정
+    weights = None
+    if args.weights:
+        if args.algorithm not in ("legacy", "hash"):
+            print(f"\n❌ 가중치는 legacy, hash 알고리즘에서만 사용할 수 있습니다: {args.algorithm}\n")
+            return 1
+        try:
+            weights = SelectionWeights.from_config(args.weights)
+        except (OSError, ValueError) as e:
+            print(f"\n❌ 가중치 설정을 읽을 수 없습니다: {e}\n")
+            return 1
+
+    # 가사 일정 미리보기/내보내기
+    if args.schedule is not None:
+        return 0 if show_schedule(db, *args.schedule, args.interval, args.algorithm, weights) else 1
+
     # 가사 선택
     chunk = None
     display_date = None
 
     if args.random:
-        chunk = get_random_lyric(db.get_all_chunks())
+        chunk = get_random_lyric(db.get_all_chunks(), weights)
 
     elif args.date:
         target_date = parse_date(args.date)
@@ -162,14 +354,15 @@ def main():
             return 1
 
         # 특정 날짜 + interval 조합
-        target_datetime = datetime.combine(target_date, datetime.now().time())
-        chunk = get_interval_lyric(db.get_all_chunks(), args.interval, target_datetime)
+        target_datetime = datetime.combine(target_date, datetime.now(args.tz).time(), args.tz)
+        chunk = get_interval_lyric(db.get_all_chunks(), args.interval, target_datetime,
+                                   args.algorithm, weights)
         display_date = args.date
 
     else:
         # 오늘의 가사 (interval 적용)
-        chunk = get_interval_lyric(db.get_all_chunks(), args.interval)
-        now = datetime.now()
+        now = datetime.now(args.tz)
+        chunk = get_interval_lyric(db.get_all_chunks(), args.interval, now, args.algorithm, weights)
         display_date = now.strftime('%Y-%m-%d')
 
     # 가사 출력
@@ -0,0 +1,175 @@
+"""
+블록 경계 푸시 (Server-Sent Events)
+(카탈로그, 주기, 시간대)마다 스케줄러 태스크 하나가 블록 경계에 깨어나 미리 직렬화한 이벤트를
+구독자 전체에 나눠 줍니다. 구독자는 최신 이벤트 하나만 보관하므로 연결당 메모리가 작고,
+느린 클라이언트가 있어도 이벤트가 쌓이지 않습니다.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Dict, Hashable, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 스케줄러가 깨어나는 최소 간격 (초, 블록 경계보다 살짝 일찍 깨어났을 때의 재시도 간격)
+MIN_SLEEP_SECONDS = 0.01
+
+# produce(key) → (이벤트 ID, SSE 프레임 바이트, 다음에 깨어날 POSIX 시각)
+Producer = Callable[[Hashable], Awaitable[Tuple[str, bytes, float]]]
+
+
+def sse_frame(event_id: str, event: str, data: bytes) -> bytes:
+    """
+    Server-Sent Events 프레임 하나
+
+    Args:
+        event_id: 이벤트 ID (재연결 시 Last-Event-ID로 돌아옴)
+        event: 이벤트 이름
+        data: 한 줄짜리 데이터 (줄바꿈 없는 JSON)
+
+    Returns:
+        SSE 프레임 바이트
+    """
+    return b"".join((f"id: {event_id}\nevent: {event}\ndata: ".encode("utf-8"), data, b"\n\n"))
+
+
+class Subscription:
+    """구독자 한 명 (마지막 이벤트 하나만 보관)"""
+
+    __slots__ = ('_frame', '_ready')
+
+    def __init__(self):
+        self._frame: Optional[bytes] = None
+        self._ready = asyncio.Event()
+
+    def push(self, frame: bytes) -> None:
+        """새 이벤트 전달 (아직 보내지 못한 이전 이벤트는 덮어씀)"""
+        self._frame = frame
+        self._ready.set()
+
+    async def next(self, timeout: float) -> Optional[bytes]:
+        """
+        다음 이벤트 대기
+
+        Args:
+            timeout: 최대 대기 시간 (초)
+
+        Returns:
+            SSE 프레임 (timeout 안에 이벤트가 없으면 None → keepalive 전송)
+        """
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout)
+        except asyncio.TimeoutError:
+            return None
+        self._ready.clear()
+        frame, self._frame = self._frame, None
+        return frame
+
+
+class _Channel:
+    __slots__ = ('subscribers', 'task', 'event_id', 'frame')
+
+    def __init__(self):
+        self.subscribers: Set[Subscription] = set()
+        self.task: Optional[asyncio.Task] = None
+        self.event_id: Optional[str] = None
+        self.frame: Optional[bytes] = None
+
+
+class BlockBroadcaster:
+    """
+    채널(키)마다 스케줄러 태스크 하나로 이벤트를 만들어 구독자에게 나눠 주는 브로드캐스터
+    구독자가 없어진 채널의 태스크는 바로 종료합니다. 이벤트 루프 안에서만 사용합니다.
+    """
+
+    def __init__(self, produce: Producer, retry_seconds: float = 5.0):
+        """
+        Args:
+            produce: 채널의 현재 이벤트를 만드는 코루틴 함수
+                     (이벤트 ID, SSE 프레임, 다음에 다시 부를 POSIX 시각)을 반환
+            retry_seconds: produce가 실패했을 때 다시 시도할 간격 (초)
+        """
+        self.produce = produce
+        self.retry_seconds = retry_seconds
+        self.published = 0
+        self._channels: Dict[Hashable, _Channel] = {}
+
+    def subscribe(self, key: Hashable, last_event_id: Optional[str] = None) -> Subscription:
+        """
+        채널 구독 (채널이 없으면 스케줄러 태스크 시작)
+        이미 만든 이벤트가 있으면 바로 전달합니다 (last_event_id와 같으면 생략).
+
+        Args:
+            key: 채널 키
+            last_event_id: 클라이언트가 마지막으로 받은 이벤트 ID (Last-Event-ID 헤더)
+
+        Returns:
+            Subscription (연결이 끝나면 unsubscribe 필수)
+        """
+        channel = self._channels.get(key)
+        if channel is None:
+            channel = self._channels[key] = _Channel()
+            channel.task = asyncio.get_running_loop().create_task(self._run(key, channel))
+
+        subscription = Subscription()
+        channel.subscribers.add(subscription)
+        if channel.frame is not None and channel.event_id != last_event_id:
+            subscription.push(channel.frame)
+        return subscription
+
+    def unsubscribe(self, key: Hashable, subscription: Subscription) -> None:
+        """
+        구독 해제 (마지막 구독자였으면 스케줄러 태스크 종료)
+
+        Args:
+            key: 채널 키
+            subscription: subscribe가 반환한 구독
+        """
+        channel = self._channels.get(key)
+        if channel is None:
+            return
+        channel.subscribers.discard(subscription)
+        if not channel.subscribers:
+            del self._channels[key]
+            channel.task.cancel()
+
+    async def _run(self, key: Hashable, channel: _Channel) -> None:
+        while True:
+            try:
+                event_id, frame, wake_at = await self.produce(key)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"스트림 이벤트 생성 오류 ({key}): {e}", exc_info=True)
+                await asyncio.sleep(self.retry_seconds)
+                continue
+
+            if event_id != channel.event_id:
+                channel.event_id, channel.frame = event_id, frame
+                for subscription in channel.subscribers:
+                    subscription.push(frame)
+                self.published += 1
+
+            await asyncio.sleep(max(MIN_SLEEP_SECONDS, wake_at - time.time()))
+
+    async def close(self) -> None:
+        """모든 스케줄러 태스크 종료 (서버 종료 시)"""
+        channels, self._channels = list(self._channels.values()), {}
+        for channel in channels:
+            channel.task.cancel()
+        for channel in channels:
+            try:
+                await channel.task
+            except asyncio.CancelledError:
+                pass
+
+    @property
+    def channel_count(self) -> int:
+        """스케줄러가 돌고 있는 채널 수"""
+        return len(self._channels)
+
+    @property
+    def subscriber_count(self) -> int:
+        """연결된 구독자 수"""
+        return sum(len(channel.subscribers) for channel in self._channels.values())
@@ -0,0 +1,253 @@
+"""
+여러 가사 카탈로그 관리 모듈
+아티스트별 data 루트를 이름 붙인 LyricsDatabase로 한 프로세스에 올리고 요청마다 골라 씁니다.
+
+설정 파일 예시 (JSON):
+    {
+        "default": "taeyeon",
+        "load_workers": 8,
+        "catalogs": {
+            "taeyeon": {"data_dir": "data"},
+            "iu": {"data_dir": "/srv/lyrics/iu", "lazy": true, "exclude_folders": [],
+                   "weights": "weights/iu.json"}
+        }
+    }
+
+weights는 가중치 설정 파일 경로 또는 같은 구조의 딕셔너리입니다 (src/weights.py 참고).
+defer=True로 만들면 설정 검증과 가중치 로드만 하고 카탈로그 로드는 load_pending()으로 미룹니다
+(서버가 먼저 포트를 열고 백그라운드에서 로드하도록).
+"""
+
+import json
+import re
+import threading
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Union
+
+from src.lyrics_database import LyricsDatabase
+from src.weights import SelectionWeights
+
+DEFAULT_CATALOG = "default"
+
+# 카탈로그별로 설정할 수 있는 LyricsDatabase 옵션
+CATALOG_OPTIONS = (
+    'data_dir', 'snapshot_path', 'use_snapshot', 'verify_snapshot',
+    'lazy', 'lazy_cache_tracks', 'search_index', 'exclude_folders'
+)
+
+_NAME_PATTERN = re.compile(r'^[A-Za-z0-9_-]+$')
+
+
+class CatalogRegistry(Mapping):
+    """
+    이름 → LyricsDatabase 레지스트리
+    모든 카탈로그가 병렬 로드용 스레드 풀 하나를 공유합니다.
+    """
+
+    def __init__(self, default: Optional[str] = None, load_workers: int = 0):
+        """
+        Args:
+            default: 기본 카탈로그 이름 (None이면 처음 추가한 카탈로그)
+            load_workers: 공유 로드 스레드 풀 크기 (0/1이면 순차 로드)
+        """
+        self.default_name = default
+        self.executor = ThreadPoolExecutor(max_workers=load_workers, thread_name_prefix="catalog-load") \
+            if load_workers > 1 else None
+        self._catalogs: Dict[str, LyricsDatabase] = {}
+        self._weights: Dict[str, Optional[SelectionWeights]] = {}
+        self._pending: Dict[str, Dict] = {}  # 이름 → 아직 로드하지 않은 LyricsDatabase 옵션
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Union[str, Path, Dict], defer: bool = False, **defaults) -> 'CatalogRegistry':
+        """
+        설정 파일(또는 딕셔너리)로 레지스트리를 만들고 모든 카탈로그를 로드
+
+        Args:
+            config: JSON 설정 파일 경로 또는 같은 구조의 딕셔너리
+            defer: True면 카탈로그를 등록만 하고 로드는 load_pending()에서
+            **defaults: 카탈로그 설정에 없는 옵션의 기본값 (예: lazy=True)
+
+        Returns:
+            CatalogRegistry 인스턴스
+
+        Raises:
+            ValueError: 설정 형식이 올바르지 않은 경우
+        """
+        if not isinstance(config, dict):
+            with open(config, 'r', encoding='utf-8') as f:
+                config = json.load(f)
+
+        catalogs = config.get('catalogs')
+        if not isinstance(catalogs, dict) or not catalogs:
+            raise ValueError("카탈로그 설정에 'catalogs' 항목이 없습니다")
+
+        registry = cls(config.get('default'), int(config.get('load_workers', 0)))
+        for name, options in catalogs.items():
+            (registry.add if defer else registry.load)(name, **{**defaults, **options})
+
+        if registry.default_name not in registry and registry.default_name not in registry.pending:
+            raise ValueError(f"기본 카탈로그가 없습니다: {registry.default_name}")
+        return registry
+
+    def add(self, name: str, weights: Union[None, str, Path, Dict, SelectionWeights] = None,
+            **options) -> None:
+        """
+        카탈로그를 로드하지 않고 등록만 함 (load_pending()에서 로드)
+        이름, 옵션, 가중치는 여기서 검증하므로 설정 오류는 로드를 기다리지 않고 바로 드러납니다.
+
+        Args:
+            name: 카탈로그 이름 (영문, 숫자, _, -)
+            weights: 가중치 설정 (파일 경로, 딕셔너리 또는 SelectionWeights, None이면 균등 선택)
+            **options: LyricsDatabase 옵션 (CATALOG_OPTIONS)
+
+        Raises:
+            ValueError: 이름이나 옵션이 올바르지 않은 경우
+        """
+        if not _NAME_PATTERN.match(name):
+            raise ValueError(f"카탈로그 이름이 올바르지 않습니다: {name}")
+        unknown = set(options) - set(CATALOG_OPTIONS)
+        if unknown:
+            raise ValueError(f"알 수 없는 카탈로그 옵션 ({name}): {', '.join(sorted(unknown))}")
+
+        if weights is not None and not isinstance(weights, SelectionWeights):
+            weights = SelectionWeights.from_config(weights)
+
+        with self._lock:
+            self._pending = {**self._pending, name: options}
+            self._weights = {**self._weights, name: weights}
+            if self.default_name is None:
+                self.default_name = name
+
+    def load(self, name: str, weights: Union[None, str, Path, Dict, SelectionWeights] = None,
+             **options) -> LyricsDatabase:
+        """
+        카탈로그 하나를 로드하여 등록 (같은 이름이 있으면 교체)
+
+        Args:
+            name: 카탈로그 이름 (영문, 숫자, _, -)
+            weights: 가중치 설정 (파일 경로, 딕셔너리 또는 SelectionWeights, None이면 균등 선택)
+            **options: LyricsDatabase 옵션 (CATALOG_OPTIONS)
+
+        Returns:
+            로드된 LyricsDatabase
+
+        Raises:
+            ValueError: 이름이나 옵션이 올바르지 않은 경우
+        """
+        self.add(name, weights, **options)
+        return self._load_added(name)
+
+    def _load_added(self, name: str) -> LyricsDatabase:
+        db = LyricsDatabase(executor=self.executor, **self._pending[name])
+        with self._lock:
+            self._catalogs = {**self._catalogs, name: db}
+            self._pending = {key: value for key, value in self._pending.items() if key != name}
+        return db
+
+    def load_pending(self) -> List[str]:
+        """
+        add()로 등록만 한 카탈로그를 로드 (기본 카탈로그 먼저, 나머지는 등록한 순서대로)
+        로드가 끝난 카탈로그부터 조회할 수 있습니다.
+
+        Returns:
+            로드한 카탈로그 이름 목록
+        """
+        names = sorted(self._pending, key=lambda name: name != self.default_name)
+        for name in names:
+            self._load_added(name)
+        return names
+
+    @property
+    def pending(self) -> List[str]:
+        """등록만 하고 아직 로드하지 않은 카탈로그 이름"""
+        return list(self._pending)
+
+    @property
+    def ready(self) -> bool:
+        """등록한 카탈로그를 모두 로드했는지"""
+        return not self._pending and self.default_name in self._catalogs
+
+    def __getitem__(self, name: str) -> LyricsDatabase:
+        return self._catalogs[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._catalogs)
+
+    def __len__(self) -> int:
+        return len(self._catalogs)
+
+    @property
+    def default(self) -> LyricsDatabase:
+        """기본 카탈로그"""
+        return self._catalogs[self.default_name]
+
+    def resolve(self, name: Optional[str] = None) -> Optional[LyricsDatabase]:
+        """
+        요청의 catalog 파라미터로 카탈로그 찾기
+
+        Args:
+            name: 카탈로그 이름 (None이면 기본 카탈로그)
+
+        Returns:
+            LyricsDatabase 또는 None (없는 카탈로그)
+        """
+        return self._catalogs.get(self.default_name if name is None else name)
+
+    def weights_for(self, name: Optional[str] = None) -> Optional[SelectionWeights]:
+        """
+        카탈로그의 가중치 설정
+
+        Args:
+            name: 카탈로그 이름 (None이면 기본 카탈로그)
+
+        Returns:
+            SelectionWeights 또는 None (균등 선택)
+        """
+        return self._weights.get(self.default_name if name is None else name)
+
+    def get_catalogs_info(self) -> Dict[str, Dict]:
+        """
+        카탈로그별 규모, 로드 시간, 메모리 사용량
+
+        Returns:
+            카탈로그 이름을 키로 하는 딕셔너리
+        """
+        return {
+            name: {
+                "data_dir": str(db.data_dir),
+                "default": name == self.default_name,
+                "chunks_count": db.get_chunk_count(),
+                "albums_count": db.albums_count,
+                "tracks_count": db.tracks_count,
+                "catalog_version": db.version,
+                "snapshot": db.snapshot is not None,
+                "lazy": db.line_store is not None,
+                "load_duration_ms": round(db.load_duration * 1000, 2),
+                "reload_count": db.reload_count,
+                "weights_version": self._weights[name].version if self._weights.get(name) else None,
+                "memory_bytes": db.memory_usage()
+            }
+            for name, db in self._catalogs.items()
+        }
+
+    def after_fork(self) -> None:
+        """
+        fork로 만든 워커 프로세스에서 호출 (src.prefork)
+        부모의 스레드 풀은 자식에 스레드 없이 복사되어 작업을 받지 못하므로 새 풀로 바꿉니다.
+        """
+        for db in self._catalogs.values():
+            db.after_fork()
+        if self.executor is None:
+            return
+        self.executor = ThreadPoolExecutor(max_workers=self.executor._max_workers,
+                                           thread_name_prefix="catalog-load")
+        for db in self._catalogs.values():
+            db.executor = self.executor
+
+    def close(self) -> None:
+        """공유 스레드 풀 종료"""
+        if self.executor is not None:
+            self.executor.shutdown(wait=False)
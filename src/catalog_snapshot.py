@@ -0,0 +1,442 @@
+"""
+가사 카탈로그 스냅샷 모듈
+data/ 트리 전체를 하나의 바이너리 파일(문자열 테이블 + 청크 오프셋 인덱스)로
+컴파일하고, mmap으로 열어 청크를 바로 제공합니다.
+
+파일 구조 (리틀 엔디언):
+    헤더        매직, 포맷 버전, 개수들, 원본 지문(fingerprint), 섹션 오프셋
+    문자열 오프셋 (string_count + 1)개의 uint32 - 문자열 블롭 내 시작 위치
+    문자열 블롭  중복 제거된 UTF-8 문자열 (제목, 앨범명, 가사 라인 등)
+    트랙 테이블  트랙당 고정 길이 레코드 (메타데이터 문자열 ID, 파일 stat, 청크 범위)
+    청크 인덱스  청크당 고정 길이 레코드 (트랙 번호, 라인 참조 범위)
+    라인 참조    청크 라인의 문자열 ID 배열
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from src.lyrics_models import DEFAULT_ARTIST, LyricChunk, TrackInfo
+
+MAGIC = b"DLYRSNP\x00"
+# 2: null인 연도/트랙 번호/청크 id를 0 대신 _NONE_INT로 기록 (버전 1 스냅샷은 거부되어 폴더 스캔으로 대체)
+FORMAT_VERSION = 2
+
+# magic, version, flags, albums, tracks, chunks, strings, line_refs, fingerprint,
+# 섹션 오프셋 5개 (string offsets, string blob, tracks, chunks, line refs)
+_HEADER = struct.Struct("<8sHHIIIII16sQQQQQ")
+# title, album, artist, album_folder, track_file (문자열 ID), year, track_number,
+# mtime_ns, size, chunk_start, chunk_count, digest
+_TRACK = struct.Struct("<IIIIIiiqqII16s")
+# track_index, chunk id, line_start, line_count
+_CHUNK = struct.Struct("<IiII")
+_U32 = struct.Struct("<I")
+_U32_PAIR = struct.Struct("<II")
+# 메타데이터 값이 null인 경우를 나타내는 문자열 ID
+_NONE_ID = 0xFFFFFFFF
+# 정수 필드(연도, 트랙 번호, 청크 id)가 null인 경우 (폴더 스캔처럼 None으로 읽음)
+_NONE_INT = -0x80000000
+_INT_MIN, _INT_MAX = _NONE_INT + 1, 0x7FFFFFFF
+
+
+class SnapshotError(Exception):
+    """스냅샷 파일이 손상되었거나 호환되지 않을 때 발생"""
+
+
+def _int_field(value, where: str) -> int:
+    """
+    정수 필드를 기록할 값으로 변환 (폴더 스캔이 만드는 값과 같게 읽히도록 변환하지 않고 검사만 함)
+
+    Raises:
+        SnapshotError: None도 32비트 정수도 아닌 값 (예: 문자열 청크 id)
+    """
+    if value is None:
+        return _NONE_INT
+    if isinstance(value, bool) or not isinstance(value, int) or not _INT_MIN <= value <= _INT_MAX:
+        raise SnapshotError(f"스냅샷에 정수로 기록할 수 없는 값: {where} = {value!r}")
+    return value
+
+
+def _int_value(value: int) -> Optional[int]:
+    return None if value == _NONE_INT else value
+
+
+def file_digest(data: bytes) -> bytes:
+    """
+    트랙 파일 내용의 해시 계산
+
+    Args:
+        data: 파일 바이트
+
+    Returns:
+        16바이트 BLAKE2b 다이제스트
+    """
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def compute_fingerprint(manifest: Iterable[Tuple[str, int, int]]) -> bytes:
+    """
+    트랙 파일 목록의 stat 정보로 카탈로그 지문 계산
+    파일을 열지 않고 디렉토리 스캔 + stat만으로 스냅샷 신선도를 판단합니다.
+
+    Args:
+        manifest: (상대 경로, mtime_ns, size) 튜플들 (정렬된 순서)
+
+    Returns:
+        16바이트 지문
+    """
+    h = hashlib.blake2b(digest_size=16)
+    for rel_path, mtime_ns, size in manifest:
+        h.update(rel_path.encode('utf-8'))
+        h.update(b"\x00%d\x00%d\n" % (mtime_ns, size))
+    return h.digest()
+
+
+class SnapshotTrack:
+    """스냅샷에 기록할 트랙 한 개의 정보"""
+
+    __slots__ = ('album_folder', 'track_file', 'mtime_ns', 'size', 'digest', 'data')
+
+    def __init__(self, album_folder: str, track_file: str, mtime_ns: int,
+                 size: int, digest: bytes, data: Dict):
+        self.album_folder = album_folder
+        self.track_file = track_file
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.digest = digest
+        self.data = data
+
+
+def write_snapshot(path: Path, tracks: Sequence[SnapshotTrack],
+                   albums_count: int, fingerprint: bytes) -> None:
+    """
+    트랙 목록을 스냅샷 파일로 기록
+    임시 파일에 쓴 뒤 os.replace로 교체하므로, 기존 스냅샷을 mmap 중인
+    프로세스는 영향을 받지 않습니다.
+
+    Args:
+        path: 스냅샷 파일 경로
+        tracks: 로드 순서대로 정렬된 트랙 목록
+        albums_count: 앨범 폴더 수
+        fingerprint: compute_fingerprint() 결과
+
+    Raises:
+        SnapshotError: 연도, 트랙 번호, 청크 id가 정수나 null이 아닌 경우 (파일을 쓰지 않음)
+    """
+    strings: List[bytes] = []
+    string_ids: Dict[str, int] = {}
+
+    def sid(value) -> int:
+        if value is None:
+            return _NONE_ID
+        text = str(value)
+        idx = string_ids.get(text)
+        if idx is None:
+            idx = len(strings)
+            string_ids[text] = idx
+            strings.append(text.encode('utf-8'))
+        return idx
+
+    track_records = bytearray()
+    chunk_records = bytearray()
+    line_refs = bytearray()
+    chunk_count = 0
+    line_ref_count = 0
+
+    for track_index, track in enumerate(tracks):
+        data = track.data
+        chunks = data.get('chunks', [])
+        chunk_start = chunk_count
+        where = f"{track.album_folder}/{track.track_file}"
+
+        for position, chunk in enumerate(chunks):
+            lines = chunk.get('lines', [])
+            chunk_id = _int_field(chunk.get('id', position + 1), f"{where} chunks[{position}].id")
+            chunk_records += _CHUNK.pack(track_index, chunk_id, line_ref_count, len(lines))
+            for line in lines:
+                line_refs += _U32.pack(sid(line))
+            line_ref_count += len(lines)
+            chunk_count += 1
+
+        track_records += _TRACK.pack(
+            sid(data.get('title', 'Unknown')),
+            sid(data.get('album', 'Unknown')),
+            sid(data.get('artist', DEFAULT_ARTIST)),
+            sid(track.album_folder),
+            sid(track.track_file),
+            # TrackInfo.from_json과 같은 기본값 (키가 없으면 0, null이면 None)
+            _int_field(data.get('year', 0), f"{where} year"),
+            _int_field(data.get('track_number', 0), f"{where} track_number"),
+            track.mtime_ns,
+            track.size,
+            chunk_start,
+            chunk_count - chunk_start,
+            track.digest,
+        )
+
+    string_offsets = bytearray()
+    position = 0
+    for encoded in strings:
+        string_offsets += _U32.pack(position)
+        position += len(encoded)
+    string_offsets += _U32.pack(position)
+
+    offsets_pos = _HEADER.size
+    blob_pos = offsets_pos + len(string_offsets)
+    tracks_pos = blob_pos + position
+    chunks_pos = tracks_pos + len(track_records)
+    line_refs_pos = chunks_pos + len(chunk_records)
+
+    header = _HEADER.pack(
+        MAGIC, FORMAT_VERSION, 0,
+        albums_count, len(tracks), chunk_count, len(strings), line_ref_count,
+        fingerprint,
+        offsets_pos, blob_pos, tracks_pos, chunks_pos, line_refs_pos,
+    )
+
+    path = Path(path)
+    tmp_path = path.with_name(path.name + f".tmp{os.getpid()}")
+    with open(tmp_path, 'wb') as f:
+        f.write(header)
+        f.write(string_offsets)
+        for encoded in strings:
+            f.write(encoded)
+        f.write(track_records)
+        f.write(chunk_records)
+        f.write(line_refs)
+    os.replace(tmp_path, path)
+
+
+class CatalogSnapshot:
+    """mmap으로 연 스냅샷 파일"""
+
+    def __init__(self, path: Path):
+        """
+        Args:
+            path: 스냅샷 파일 경로
+
+        Raises:
+            SnapshotError: 매직/버전이 맞지 않거나 파일이 잘린 경우
+        """
+        self.path = Path(path)
+        with open(self.path, 'rb') as f:
+            try:
+                self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as e:  # 빈 파일
+                raise SnapshotError(f"빈 스냅샷 파일: {self.path}") from e
+
+        if len(self._mm) < _HEADER.size:
+            self.close()
+            raise SnapshotError(f"스냅샷 헤더가 잘렸습니다: {self.path}")
+
+        (magic, version, _flags,
+         self.albums_count, self.tracks_count, self.chunks_count,
+         self._string_count, _line_ref_count, self.fingerprint,
+         self._offsets_pos, self._blob_pos, self._tracks_pos,
+         self._chunks_pos, self._line_refs_pos) = _HEADER.unpack_from(self._mm, 0)
+
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self.close()
+            raise SnapshotError(f"지원하지 않는 스냅샷 형식: {self.path}")
+
+        expected_end = self._line_refs_pos + _line_ref_count * _U32.size
+        if len(self._mm) != expected_end:
+            self.close()
+            raise SnapshotError(f"스냅샷 크기가 올바르지 않습니다: {self.path}")
+
+        # 트랙 메타데이터는 청크에서 공유되므로 한 번 디코딩하면 재사용
+        self._track_cache: List[Optional[TrackInfo]] = [None] * self.tracks_count
+
+    def close(self) -> None:
+        """mmap 해제"""
+        self._mm.close()
+
+    @property
+    def mapped_bytes(self) -> int:
+        """mmap으로 매핑한 파일 크기 (프로세스 힙이 아니라 페이지 캐시에 올라감)"""
+        return len(self._mm)
+
+    def decoded_tracks(self) -> List[TrackInfo]:
+        """지금까지 디코딩되어 캐시된 트랙 메타데이터 목록"""
+        return [track for track in self._track_cache if track is not None]
+
+    def get_string(self, string_id: int) -> Optional[str]:
+        """
+        문자열 테이블에서 문자열 하나 디코딩
+
+        Args:
+            string_id: 문자열 ID
+
+        Returns:
+            디코딩된 문자열 (원본 값이 null이면 None)
+        """
+        if string_id == _NONE_ID:
+            return None
+        start, end = _U32_PAIR.unpack_from(self._mm, self._offsets_pos + string_id * 4)
+        return self._mm[self._blob_pos + start:self._blob_pos + end].decode('utf-8')
+
+    def get_track_record(self, track_index: int) -> Dict:
+        """
+        트랙 레코드 전체 반환 (파일 stat, 청크 범위 포함)
+
+        Args:
+            track_index: 트랙 번호 (0부터)
+
+        Returns:
+            track(TrackInfo), track_file, mtime_ns, size, chunk_start, chunk_count,
+            digest 를 담은 딕셔너리
+        """
+        (_title, _album, _artist, _folder, track_file, _year, _track_number,
+         mtime_ns, size, chunk_start, chunk_count, digest) = _TRACK.unpack_from(
+            self._mm, self._tracks_pos + track_index * _TRACK.size)
+        return {
+            'track': self.get_track(track_index),
+            'track_file': self.get_string(track_file),
+            'mtime_ns': mtime_ns,
+            'size': size,
+            'chunk_start': chunk_start,
+            'chunk_count': chunk_count,
+            'digest': digest,
+        }
+
+    def get_track(self, track_index: int) -> TrackInfo:
+        """
+        트랙 메타데이터 반환 (같은 트랙의 청크들이 공유하도록 캐시)
+
+        Args:
+            track_index: 트랙 번호 (0부터)
+
+        Returns:
+            TrackInfo 인스턴스
+        """
+        track = self._track_cache[track_index]
+        if track is None:
+            (title, album, artist, folder, track_file, year, track_number,
+             *_) = _TRACK.unpack_from(self._mm, self._tracks_pos + track_index * _TRACK.size)
+            track = TrackInfo(
+                self.get_string(title),
+                self.get_string(album),
+                _int_value(year),
+                _int_value(track_number),
+                self.get_string(artist),
+                self.get_string(folder),
+                self.get_string(track_file)
+            )
+            self._track_cache[track_index] = track
+        return track
+
+    def get_chunk_ref(self, chunk_index: int) -> Tuple[TrackInfo, int]:
+        """
+        청크의 트랙과 청크 번호 (가사 라인은 디코딩하지 않음)
+
+        Args:
+            chunk_index: 청크 번호 (0부터)
+
+        Returns:
+            (TrackInfo, 청크 id)
+        """
+        track_index, chunk_id, _, _ = _CHUNK.unpack_from(
+            self._mm, self._chunks_pos + chunk_index * _CHUNK.size)
+        return self.get_track(track_index), _int_value(chunk_id)
+
+    def get_stable_id(self, chunk_index: int) -> str:
+        """
+        청크의 안정 식별자 (LyricChunk.stable_id와 같은 값, 가사 라인은 디코딩하지 않음)
+
+        Args:
+            chunk_index: 청크 번호 (0부터)
+
+        Returns:
+            "앨범 폴더/트랙 파일#청크 번호"
+        """
+        track, chunk_id = self.get_chunk_ref(chunk_index)
+        return f"{track.album_folder}/{track.track_file}#{chunk_id}"
+
+    def get_lines(self, chunk_index: int) -> Tuple[str, ...]:
+        """
+        청크의 가사 라인만 디코딩
+
+        Args:
+            chunk_index: 청크 번호 (0부터)
+
+        Returns:
+            가사 라인 튜플
+        """
+        _, _, line_start, line_count = _CHUNK.unpack_from(
+            self._mm, self._chunks_pos + chunk_index * _CHUNK.size)
+        refs = struct.unpack_from(f"<{line_count}I", self._mm,
+                                  self._line_refs_pos + line_start * 4)
+        return tuple(self.get_string(ref) for ref in refs)
+
+    def get_chunk(self, chunk_index: int) -> LyricChunk:
+        """
+        청크 하나를 디코딩
+
+        Args:
+            chunk_index: 청크 번호 (0부터)
+
+        Returns:
+            LyricChunk 인스턴스
+        """
+        track, chunk_id = self.get_chunk_ref(chunk_index)
+        return LyricChunk(self.get_lines(chunk_index), track, chunk_id)
+
+
+class SnapshotLyricChunk(LyricChunk):
+    """
+    스냅샷의 청크를 가리키기만 하는 청크 (라인은 읽을 때마다 mmap에서 디코딩)
+    스냅샷으로 로드한 카탈로그를 리로드할 때 바뀌지 않은 트랙의 청크로 쓰여,
+    리로드 후에도 가사 라인이 힙에 올라오지 않습니다. 스냅샷 mmap은 이 청크들이 살아 있는 동안 유지됩니다.
+    """
+
+    __slots__ = ('_snapshot', '_index')
+
+    def __init__(self, snapshot: CatalogSnapshot, index: int, track: TrackInfo, number: int = 0):
+        self._text = None
+        self._snapshot = snapshot
+        self._index = index
+        self.track = track
+        self.number = number
+
+    @property
+    def lines(self) -> Tuple[str, ...]:
+        """가사 라인 튜플 (스냅샷에서 디코딩)"""
+        return self._snapshot.get_lines(self._index)
+
+
+class SnapshotChunks(Sequence):
+    """
+    스냅샷 청크를 리스트처럼 제공하는 읽기 전용 시퀀스
+    인덱싱할 때만 청크를 디코딩하므로 로드 시점에 청크 객체를 만들지 않습니다.
+    """
+
+    def __init__(self, snapshot: CatalogSnapshot):
+        self._snapshot = snapshot
+
+    def __len__(self) -> int:
+        return self._snapshot.chunks_count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._snapshot.get_chunk(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("snapshot chunk index out of range")
+        return self._snapshot.get_chunk(index)
+
+    def stable_ids(self) -> List[str]:
+        """모든 청크의 안정 식별자 (청크를 디코딩하지 않고 청크 테이블만 읽음)"""
+        return [self._snapshot.get_stable_id(i) for i in range(len(self))]
+
+    def chunk_refs(self) -> List[Tuple[TrackInfo, int]]:
+        """모든 청크의 (트랙, 청크 id) (청크를 디코딩하지 않고 청크 테이블만 읽음)"""
+        return [self._snapshot.get_chunk_ref(i) for i in range(len(self))]
+
+    @property
+    def snapshot(self) -> CatalogSnapshot:
+        """청크를 담고 있는 스냅샷"""
+        return self._snapshot
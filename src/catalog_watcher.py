@@ -0,0 +1,67 @@
+"""
+카탈로그 폴링 감시 모듈
+주기적으로 LyricsDatabase.reload()를 호출하여 data/ 변경을 서비스 재시작 없이 반영합니다.
+카탈로그가 여러 개여도 감시 스레드 하나가 차례로 폴링합니다.
+"""
+
+import logging
+import threading
+from functools import partial
+from typing import Callable, Mapping, Optional, Sequence, Union
+
+from src.lyrics_database import LyricsDatabase
+
+logger = logging.getLogger(__name__)
+
+
+class CatalogWatcher:
+    """백그라운드 스레드에서 카탈로그 변경을 폴링하는 감시자"""
+
+    def __init__(self, catalogs: Union[LyricsDatabase, Mapping[str, LyricsDatabase]],
+                 interval: float = 30.0,
+                 prepare: Optional[Callable[[str, Sequence], None]] = None):
+        """
+        Args:
+            catalogs: 감시할 LyricsDatabase 또는 이름 → LyricsDatabase 매핑 (CatalogRegistry)
+            interval: 폴링 주기 (초)
+            prepare: 바뀐 카탈로그를 교체하기 전에 (이름, 새 청크 목록)으로 호출할 함수
+                     (LyricsDatabase.reload의 prepare)
+        """
+        self.catalogs = {'default': catalogs} if isinstance(catalogs, LyricsDatabase) else catalogs
+        self.interval = interval
+        self.prepare = prepare
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """감시 스레드 시작 (이미 실행 중이면 무시)"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="catalog-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """감시 스레드 종료"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval + 1)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            # 매 주기마다 목록을 다시 읽어 새로 등록된 카탈로그도 감시
+            for name, db in list(self.catalogs.items()):
+                if self._stop.is_set():
+                    return
+                try:
+                    result = db.reload(partial(self.prepare, name) if self.prepare is not None else None)
+                except Exception as e:
+                    logger.error(f"카탈로그 리로드 오류 ({name}): {e}", exc_info=True)
+                    continue
+
+                if result['swapped']:
+                    logger.info(
+                        f"카탈로그 갱신 ({name}): 추가 {result['added']}, 변경 {result['changed']}, "
+                        f"삭제 {result['removed']} ({result['duration_ms']}ms, version={result['version']})"
+                    )
@@ -0,0 +1,321 @@
+"""
+앨범 커버 저장소
+커버 원본과 크기별 축소본(small, medium)을 바이트 수로 제한한 LRU 메모리 캐시에 보관하고,
+조건부 요청(ETag, Last-Modified)과 Range 요청에 필요한 메타데이터를 함께 제공합니다.
+축소본은 Pillow가 설치되어 있으면 생성하며 (pip install Pillow), 없으면 원본을 그대로 사용합니다.
+"""
+
+import logging
+import os
+import stat
+import threading
+import time
+from collections import OrderedDict
+from io import BytesIO
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+from src.http_cache import http_date, make_etag
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow는 선택 의존성 (없으면 축소본 대신 원본 제공)
+    Image = None
+
+logger = logging.getLogger(__name__)
+
+# 축소본 크기 (긴 변 픽셀 수), "original"은 원본 그대로
+COVER_SIZES = {
+    "small": 160,
+    "medium": 480
+}
+ORIGINAL_SIZE = "original"
+
+COVER_MEDIA_TYPES = {
+    ".webp": "image/webp",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png"
+}
+
+# 미리 만든 축소본을 저장할 하위 디렉토리 (covers/.variants/<size>/<파일명>)
+VARIANTS_DIRNAME = ".variants"
+
+_SAVE_OPTIONS = {
+    "WEBP": {"quality": 80, "method": 4},
+    "JPEG": {"quality": 85, "optimize": True},
+    "PNG": {"optimize": True}
+}
+
+
+class CoverImage:
+    """메모리에 올린 커버 이미지 한 장 (원본 또는 축소본)"""
+
+    __slots__ = ('body', 'media_type', 'etag', 'last_modified', 'mtime', 'source_stat', 'checked_at')
+
+    def __init__(self, body: bytes, media_type: str, etag: str, mtime: float,
+                 source_stat: Tuple[int, int]):
+        """
+        Args:
+            body: 이미지 바이트
+            media_type: Content-Type
+            etag: 강한 ETag
+            mtime: 원본 수정 시각 (POSIX 초)
+            source_stat: 원본 (st_mtime_ns, st_size), 원본이 바뀌었는지 확인할 때 사용
+        """
+        self.body = body
+        self.media_type = media_type
+        self.etag = etag
+        self.last_modified = http_date(mtime)
+        self.mtime = mtime
+        self.source_stat = source_stat
+        self.checked_at = time.monotonic()
+
+
+class CoverStore:
+    """
+    커버 디렉토리의 이미지를 크기별로 제공하는 저장소
+    캐시에 있는 커버는 revalidate_seconds 동안 파일 시스템을 다시 확인하지 않고 바로 반환합니다.
+    """
+
+    def __init__(self, covers_dir: str = "data/covers", max_bytes: int = 32 * 1024 * 1024,
+                 revalidate_seconds: float = 5.0):
+        """
+        Args:
+            covers_dir: 커버 이미지 디렉토리
+            max_bytes: 메모리에 보관할 최대 이미지 바이트 수
+            revalidate_seconds: 캐시된 커버의 원본 변경 여부를 다시 확인하는 주기 (초)
+        """
+        self.covers_dir = Path(covers_dir)
+        self.max_bytes = max_bytes
+        self.revalidate_seconds = revalidate_seconds
+        self.hits = 0
+        self.misses = 0
+        self._cache: "OrderedDict[Tuple[str, str], CoverImage]" = OrderedDict()
+        self._cache_bytes = 0
+        self._lock = threading.Lock()
+
+    def resolve_path(self, filename: str) -> Optional[Path]:
+        """
+        요청한 파일명을 커버 디렉토리 안의 경로로 변환
+        경로 구분자, 숨김 파일, 지원하지 않는 확장자, 디렉토리 밖을 가리키는 심볼릭 링크는 거부합니다.
+
+        Args:
+            filename: 요청한 파일명 (예: 001_I.webp)
+
+        Returns:
+            커버 파일 경로 (허용되지 않는 이름이면 None)
+        """
+        if (not filename or filename.startswith(".") or "/" in filename or "\\" in filename
+                or "\x00" in filename or Path(filename).suffix.lower() not in COVER_MEDIA_TYPES):
+            return None
+
+        path = self.covers_dir / filename
+        try:
+            if path.resolve().parent != self.covers_dir.resolve():
+                return None
+        except (OSError, RuntimeError):
+            return None
+        return path
+
+    def cached(self, filename: str, size: str = ORIGINAL_SIZE) -> Optional[CoverImage]:
+        """
+        파일 시스템을 보지 않고 캐시에서 커버 반환 (이벤트 루프에서 바로 호출 가능)
+
+        Args:
+            filename: 커버 파일명
+            size: 크기 (original, small, medium)
+
+        Returns:
+            최근에 확인한 캐시 항목 (없거나 다시 확인할 때가 되었으면 None → load 사용)
+        """
+        key = (filename, size)
+        with self._lock:
+            cover = self._cache.get(key)
+            if cover is None or time.monotonic() - cover.checked_at >= self.revalidate_seconds:
+                return None
+            self._cache.move_to_end(key)
+            self.hits += 1
+        return cover
+
+    def load(self, filename: str, size: str = ORIGINAL_SIZE) -> Optional[CoverImage]:
+        """
+        커버 반환 (원본이 바뀌었으면 다시 읽고 축소본도 다시 생성, 파일 I/O가 있으므로 스레드에서 호출)
+
+        Args:
+            filename: 커버 파일명
+            size: 크기 (original, small, medium)
+
+        Returns:
+            CoverImage (파일이 없거나 허용되지 않는 이름이면 None)
+
+        Raises:
+            ValueError: 지원하지 않는 크기
+        """
+        if size != ORIGINAL_SIZE and size not in COVER_SIZES:
+            raise ValueError(f"지원하지 않는 커버 크기: {size} ({', '.join([ORIGINAL_SIZE, *COVER_SIZES])})")
+
+        path = self.resolve_path(filename)
+        if path is None:
+            return None
+        try:
+            st = path.stat()
+        except OSError:
+            self._discard((filename, size))
+            return None
+        if not stat.S_ISREG(st.st_mode):
+            return None
+
+        key = (filename, size)
+        source_stat = (st.st_mtime_ns, st.st_size)
+        with self._lock:
+            cover = self._cache.get(key)
+            if cover is not None and cover.source_stat == source_stat:
+                cover.checked_at = time.monotonic()
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return cover
+            self.misses += 1
+
+        if size == ORIGINAL_SIZE:
+            body = path.read_bytes()
+        else:
+            body = self._variant_bytes(path, st, size)
+        cover = CoverImage(
+            body,
+            COVER_MEDIA_TYPES[path.suffix.lower()],
+            make_etag("cover", filename, size, st.st_mtime_ns, st.st_size, len(body)),
+            st.st_mtime,
+            source_stat
+        )
+        self._store(key, cover)
+        return cover
+
+    def _store(self, key: Tuple[str, str], cover: CoverImage) -> None:
+        if len(cover.body) > self.max_bytes:
+            # 캐시 전체보다 큰 이미지는 보관하지 않음 (매번 디스크에서 읽음)
+            self._discard(key)
+            return
+        with self._lock:
+            previous = self._cache.pop(key, None)
+            if previous is not None:
+                self._cache_bytes -= len(previous.body)
+            self._cache[key] = cover
+            self._cache_bytes += len(cover.body)
+            while self._cache_bytes > self.max_bytes:
+                _, evicted = self._cache.popitem(last=False)
+                self._cache_bytes -= len(evicted.body)
+
+    def _discard(self, key: Tuple[str, str]) -> None:
+        with self._lock:
+            previous = self._cache.pop(key, None)
+            if previous is not None:
+                self._cache_bytes -= len(previous.body)
+
+    def _variant_path(self, path: Path, size: str) -> Path:
+        return self.covers_dir / VARIANTS_DIRNAME / size / path.name
+
+    def _variant_bytes(self, path: Path, st: os.stat_result, size: str) -> bytes:
+        """디스크에 만들어 둔 축소본 (없거나 원본보다 오래되었으면 생성, Pillow가 없으면 원본)"""
+        if Image is None:
+            return path.read_bytes()
+
+        variant_path = self._variant_path(path, size)
+        try:
+            if variant_path.stat().st_mtime_ns >= st.st_mtime_ns:
+                return variant_path.read_bytes()
+        except OSError:
+            pass
+
+        body = resize_cover(path.read_bytes(), COVER_SIZES[size])
+        if body is None:
+            return path.read_bytes()
+
+        try:
+            variant_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = variant_path.with_name(f".{variant_path.name}.{os.getpid()}.tmp")
+            tmp_path.write_bytes(body)
+            os.replace(tmp_path, variant_path)
+        except OSError as e:
+            # 읽기 전용 디렉토리 등 (메모리 캐시만 사용)
+            logger.warning(f"커버 축소본 저장 실패 ({variant_path}): {e}")
+        return body
+
+    def iter_filenames(self) -> Iterable[str]:
+        """커버 디렉토리의 이미지 파일명 (정렬)"""
+        if not self.covers_dir.is_dir():
+            return []
+        return sorted(
+            entry.name for entry in self.covers_dir.iterdir()
+            if entry.is_file() and self.resolve_path(entry.name) is not None
+        )
+
+    def build_variants(self, sizes: Optional[Iterable[str]] = None) -> Dict[str, int]:
+        """
+        모든 커버의 축소본을 미리 생성 (배포 시 한 번 실행해 첫 요청의 생성 비용을 없앰)
+
+        Args:
+            sizes: 생성할 크기 목록 (None이면 COVER_SIZES 전체)
+
+        Returns:
+            {"covers": 커버 수, "variants": 생성하거나 확인한 축소본 수}
+
+        Raises:
+            RuntimeError: Pillow가 설치되어 있지 않음
+        """
+        if Image is None:
+            raise RuntimeError("커버 축소본 생성에는 Pillow가 필요합니다 (pip install Pillow)")
+
+        sizes = list(sizes or COVER_SIZES)
+        filenames = list(self.iter_filenames())
+        variants = 0
+        for filename in filenames:
+            path = self.covers_dir / filename
+            st = path.stat()
+            for size in sizes:
+                self._variant_bytes(path, st, size)
+                variants += 1
+        return {"covers": len(filenames), "variants": variants}
+
+    def clear(self) -> None:
+        """메모리 캐시 비우기"""
+        with self._lock:
+            self._cache.clear()
+            self._cache_bytes = 0
+
+    def memory_bytes(self) -> int:
+        """캐시된 이미지 바이트 수"""
+        return self._cache_bytes
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+def resize_cover(data: bytes, max_edge: int) -> Optional[bytes]:
+    """
+    긴 변이 max_edge 픽셀 이하가 되도록 비율을 유지해 축소 (원본 형식 유지, 확대는 하지 않음)
+
+    Args:
+        data: 원본 이미지 바이트
+        max_edge: 긴 변의 최대 픽셀 수
+
+    Returns:
+        축소한 이미지 바이트 (Pillow가 없거나 이미지를 읽을 수 없으면 None)
+    """
+    if Image is None:
+        return None
+
+    try:
+        with Image.open(BytesIO(data)) as image:
+            image_format = image.format or "WEBP"
+            if max(image.size) <= max_edge:
+                return data
+            image.thumbnail((max_edge, max_edge), Image.LANCZOS)
+            if image_format == "JPEG" and image.mode not in ("RGB", "L"):
+                image = image.convert("RGB")
+            output = BytesIO()
+            image.save(output, format=image_format, **_SAVE_OPTIONS.get(image_format, {}))
+            return output.getvalue()
+    except Exception as e:
+        logger.warning(f"커버 축소 실패: {e}")
+        return None
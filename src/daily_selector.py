@@ -3,50 +3,344 @@
 날짜와 시간 주기를 시드로 사용하여 일관된 가사를 선택합니다.
 """
 
-import random
-from datetime import date, datetime
-from typing import Dict, List, Optional, Literal
+import math
+import re
+from datetime import date, datetime, timedelta, tzinfo
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:  # Python 3.8
+    try:
+        from backports.zoneinfo import ZoneInfo
+    except ImportError:
+        ZoneInfo = None
+
+from src.selection import DEFAULT_ALGORITHM, get_hash_ring, rotation_index, select_index
+from src.weights import RANDOM_SOURCE, SelectionWeights, get_alias_table
+
+# 기존 시드(YYYYMMDD * 100 + 하루 안의 블록 번호)를 유지하는 시간 주기와 블록 길이 (시간)
+INTERVAL_HOURS = {"1h": 1, "3h": 3, "6h": 6, "12h": 12, "24h": 24}
+
+# 블록 번호 기준 시각 (이 날 0시가 0번 블록의 시작, rotation 알고리즘의 블록 번호도 같음)
+BLOCK_EPOCH = date(2000, 1, 1)
+
+# 시간 주기 형식: 숫자 + 단위 (m = 분, h = 시간, d = 일, w = 주), 예: 15m, 90m, 2h, 1w
+_INTERVAL_PATTERN = re.compile(r'^([1-9][0-9]*)([mhdw])$')
+_UNIT_SECONDS = {'m': 60, 'h': 3600, 'd': 86400, 'w': 7 * 86400}
+MAX_INTERVAL_SECONDS = 366 * 86400
+
+_EPOCH_ORDINAL = BLOCK_EPOCH.toordinal()
+_EPOCH_DATETIME = datetime(BLOCK_EPOCH.year, BLOCK_EPOCH.month, BLOCK_EPOCH.day)
+# 주 단위 주기는 월요일 0시에 맞춤 (2000-01-01은 토요일)
+_WEEK_ANCHOR = 2 * 86400
+# 실제 시각(POSIX 초) 계산용: 기준 시각의 벽시계 POSIX 초, UTC 오프셋 전환을 찾을 때 한 번에 건너뛰는 길이
+_EPOCH_WALL_POSIX = (_EPOCH_ORDINAL - date(1970, 1, 1).toordinal()) * 86400
+_TRANSITION_SCAN = 86400
+
+
+class BlockInterval:
+    """파싱된 시간 주기 (parse_interval 결과)"""
+
+    __slots__ = ('name', 'seconds', 'anchor', 'legacy_hours')
+
+    def __init__(self, name: str, seconds: int):
+        """
+        Args:
+            name: 시간 주기 문자열
+            seconds: 블록 길이 (초)
+        """
+        self.name = name
+        self.seconds = seconds
+        # 블록 경계 = 기준 시각 + anchor + 블록 번호 × seconds
+        self.anchor = _WEEK_ANCHOR if seconds % (7 * 86400) == 0 else 0
+        # 기존 주기와 길이가 같으면 기존 시드를 그대로 사용 (60m = 1h, 1d = 24h)
+        hours, rest = divmod(seconds, 3600)
+        self.legacy_hours = hours if rest == 0 and hours in INTERVAL_HOURS.values() else None
+
+
+@lru_cache(maxsize=256)
+def parse_interval(interval: str) -> BlockInterval:
+    """
+    시간 주기 문자열 파싱
+
+    Args:
+        interval: 숫자 + 단위 (m, h, d, w), 예: 15m, 90m, 3h, 24h, 1w
+
+    Returns:
+        BlockInterval
+
+    Raises:
+        ValueError: 형식이 올바르지 않거나 1분 미만/366일 초과인 경우
+    """
+    match = _INTERVAL_PATTERN.match(interval)
+    if match is None:
+        raise ValueError(f"지원하지 않는 시간 주기: {interval} (예: 15m, 90m, 3h, 24h, 1w)")
+    seconds = int(match.group(1)) * _UNIT_SECONDS[match.group(2)]
+    if seconds > MAX_INTERVAL_SECONDS:
+        raise ValueError(f"시간 주기가 너무 깁니다: {interval} (최대 366일)")
+    return BlockInterval(interval, seconds)
+
+
+@lru_cache(maxsize=64)
+def resolve_timezone(name: str) -> tzinfo:
+    """
+    IANA 시간대 이름을 tzinfo로 변환
+
+    Args:
+        name: 시간대 이름 (예: Asia/Seoul, America/New_York, UTC)
+
+    Returns:
+        tzinfo
+
+    Raises:
+        ValueError: 알 수 없는 시간대이거나 zoneinfo를 사용할 수 없는 경우
+    """
+    if ZoneInfo is None:
+        raise ValueError("시간대 지정에는 zoneinfo가 필요합니다 (Python 3.9 이상 또는 pip install backports.zoneinfo)")
+    try:
+        return ZoneInfo(name)
+    except (KeyError, ValueError, OSError) as e:
+        # ZoneInfoNotFoundError는 KeyError의 하위 클래스, 잘못된 경로 형식은 ValueError
+        raise ValueError(f"알 수 없는 시간대: {name}") from e
+
+
+def _wall_seconds(target_datetime: datetime) -> int:
+    """기준 시각부터 벽시계 시간으로 센 초 (시간대가 있으면 그 시간대의 현지 시각 기준)"""
+    return ((target_datetime.toordinal() - _EPOCH_ORDINAL) * 86400 + target_datetime.hour * 3600
+            + target_datetime.minute * 60 + target_datetime.second)
+
+
+def get_block_number(target_datetime: datetime, interval: str = "24h") -> int:
+    """
+    기준 시각(BLOCK_EPOCH 0시)부터 센 연속 블록 번호
+
+    Args:
+        target_datetime: 시간 (시간대가 있으면 그 시간대의 현지 시각으로 블록을 나눔)
+        interval: 시간 주기
+
+    Returns:
+        블록 번호 (다음 블록은 +1)
+    """
+    spec = parse_interval(interval)
+    return (_wall_seconds(target_datetime) - spec.anchor) // spec.seconds
+
+
+def get_block_start(target_datetime: datetime, interval: str = "24h") -> datetime:
+    """
+    시간이 속한 블록의 벽시계 시작 시각 (날짜별 일정처럼 벽시계로 블록을 셀 때 사용)
+    서머타임 전환일에는 없는 시각이거나 두 번 있는 시각일 수 있으므로, 응답에 실을 실제 경계는
+    get_block_bounds를 사용하세요.
+
+    Args:
+        target_datetime: 시간
+        interval: 시간 주기
+
+    Returns:
+        블록 시작 datetime (target_datetime과 같은 시간대, fold=0)
+    """
+    spec = parse_interval(interval)
+    block = (_wall_seconds(target_datetime) - spec.anchor) // spec.seconds
+    return _EPOCH_DATETIME.replace(tzinfo=target_datetime.tzinfo) + timedelta(
+        seconds=spec.anchor + block * spec.seconds)
+
+
+def _local_at(timestamp: int, tz: Optional[tzinfo]) -> datetime:
+    """POSIX 초의 현지 시각 (tz가 None이면 서버 현지 시각의 naive datetime, fold 포함)"""
+    return datetime.fromtimestamp(timestamp, tz) if tz is not None else datetime.fromtimestamp(timestamp)
+
+
+def _utc_offset(timestamp: int, tz: Optional[tzinfo]) -> int:
+    """그 시각의 UTC 오프셋 (초, 벽시계 POSIX 초 - 실제 POSIX 초)"""
+    local = _local_at(timestamp, tz)
+    return (_wall_seconds(local) + _EPOCH_WALL_POSIX) - timestamp
+
+
+def _first_transition(tz: Optional[tzinfo], lower: int, upper: int, offset: int) -> Optional[int]:
+    """(lower, upper] 안에서 UTC 오프셋이 offset이 아니게 되는 첫 시각 (없으면 None)"""
+    while lower < upper:
+        step = min(lower + _TRANSITION_SCAN, upper)
+        if _utc_offset(step, tz) != offset:
+            while step - lower > 1:
+                middle = (lower + step) // 2
+                if _utc_offset(middle, tz) == offset:
+                    lower = middle
+                else:
+                    step = middle
+            return step
+        lower = step
+    return None
+
+
+def _last_transition(tz: Optional[tzinfo], lower: int, upper: int, offset: int) -> Optional[int]:
+    """[lower, upper] 안에서 UTC 오프셋이 offset으로 바뀐 마지막 시각 (upper의 오프셋이 offset, 없으면 None)"""
+    while upper >= lower:
+        step = max(upper - _TRANSITION_SCAN, lower - 1)
+        if _utc_offset(step, tz) != offset:
+            while upper - step > 1:
+                middle = (step + upper) // 2
+                if _utc_offset(middle, tz) == offset:
+                    upper = middle
+                else:
+                    step = middle
+            return upper
+        if step < lower:
+            return None
+        upper = step
+    return None
+
+
+def _block_of(timestamp: int, offset: int, spec: BlockInterval) -> int:
+    """실제 시각이 속한 (벽시계) 블록 번호"""
+    return (timestamp + offset - _EPOCH_WALL_POSIX - spec.anchor) // spec.seconds
+
+
+def _block_start_instant(timestamp: int, tz: Optional[tzinfo], spec: BlockInterval) -> int:
+    """timestamp가 속한 블록이 실제로 시작된 시각 (POSIX 초)"""
+    offset = _utc_offset(timestamp, tz)
+    block = _block_of(timestamp, offset, spec)
+    while True:
+        # 오프셋이 그대로라면 벽시계가 블록 시작 시각이었던 순간
+        start = _EPOCH_WALL_POSIX + spec.anchor + block * spec.seconds - offset
+        transition = _last_transition(tz, start, timestamp, offset)
+        if transition is None:
+            return start
+        # 전환 직전이 다른 블록이면 블록은 전환 시각에 시작 (봄 서머타임으로 건너뛴 벽시계 구간 등)
+        timestamp = transition - 1
+        offset = _utc_offset(timestamp, tz)
+        if _block_of(timestamp, offset, spec) != block:
+            return transition
+
+
+def _block_end_instant(timestamp: int, tz: Optional[tzinfo], spec: BlockInterval) -> int:
+    """timestamp가 속한 블록이 실제로 끝나는 시각 (POSIX 초, 다음 블록 시작)"""
+    offset = _utc_offset(timestamp, tz)
+    block = _block_of(timestamp, offset, spec)
+    while True:
+        end = _EPOCH_WALL_POSIX + spec.anchor + (block + 1) * spec.seconds - offset
+        transition = _first_transition(tz, timestamp, end, offset)
+        if transition is None:
+            return end
+        # 전환 때 벽시계가 다른 블록으로 넘어가면(건너뛰거나 되돌아가면) 그 시각이 경계
+        timestamp = transition
+        offset = _utc_offset(timestamp, tz)
+        if _block_of(timestamp, offset, spec) != block:
+            return transition
+
+
+def get_block_bounds(target_datetime: datetime, interval: str = "24h") -> Tuple[datetime, datetime]:
+    """
+    시간이 속한 블록의 실제 시작/끝 시각
+    블록은 벽시계로 나누지만 경계는 실제 시각(POSIX 초)으로 계산하므로, 서머타임 전환일에도
+    시작은 target_datetime 이전, 끝은 이후이고 현지 시각에 없는 경계는 나오지 않습니다.
+    (봄: 건너뛴 벽시계 구간의 블록은 길이 0이라 사라짐, 가을: 되풀이되는 구간의 블록은 두 번 나옴)
+
+    Args:
+        target_datetime: 시간 (시간대가 없으면 서버 현지 시각)
+        interval: 시간 주기
 
-# 지원하는 시간 주기
-IntervalType = Literal["1h", "3h", "6h", "12h", "24h"]
+    Returns:
+        (블록 시작, 다음 블록 시작) datetime (target_datetime과 같은 시간대, 되풀이되는 시각은 fold로 구분)
+    """
+    spec = parse_interval(interval)
+    tz = target_datetime.tzinfo
+    timestamp = math.floor(target_datetime.timestamp())
+    return (_local_at(_block_start_instant(timestamp, tz, spec), tz),
+            _local_at(_block_end_instant(timestamp, tz, spec), tz))
+
+
+def get_next_block_start(target_datetime: datetime, interval: str = "24h") -> datetime:
+    """
+    다음 블록의 시작 시각 (실제 시각 기준, get_block_bounds의 끝)
+
+    Args:
+        target_datetime: 시간
+        interval: 시간 주기
+
+    Returns:
+        다음 블록 시작 datetime (target_datetime과 같은 시간대, 실제 시각으로 target_datetime 이후)
+    """
+    spec = parse_interval(interval)
+    tz = target_datetime.tzinfo
+    return _local_at(_block_end_instant(math.floor(target_datetime.timestamp()), tz, spec), tz)
 
 
-def _get_time_block(current_time: datetime, interval: str) -> int:
+def get_interval_seed(target_datetime: datetime, interval: str = "24h") -> int:
     """
-    시간 주기에 따라 현재 시간의 블록 번호 계산
+    시간 주기 블록의 시드 계산
 
     Args:
-        current_time: 현재 시간
-        interval: 시간 주기 (1h, 3h, 6h, 12h, 24h)
+        target_datetime: 시간
+        interval: 시간 주기
 
     Returns:
-        시간 블록 번호
+        시드 (기존 주기: 2025120405 = 2025-12-04, 5번째 블록,
+              그 외: 블록 길이(초) << 32 + 블록 번호)
     """
-    hour = current_time.hour
+    spec = parse_interval(interval)
+    if spec.legacy_hours is not None:
+        date_part = (target_datetime.year * 10000 + target_datetime.month * 100
+                     + target_datetime.day)
+        return date_part * 100 + target_datetime.hour // spec.legacy_hours
+
+    # 기존 시드(10자리)와 겹치지 않고 주기마다 다른 시드
+    return (spec.seconds << 32) + (_wall_seconds(target_datetime) - spec.anchor) // spec.seconds
+
+
+def _select_chunk(all_chunks: List[Dict], seed: int, algorithm: str, block_number: int,
+                  weights: Optional[SelectionWeights] = None) -> Dict:
+    """시드와 알고리즘으로 청크 하나 선택 (전역 난수 생성기를 건드리지 않는 순수 함수)"""
+    if weights is not None:
+        # 미리 만든 별칭 테이블로 O(1) 선택 (legacy/hash만 지원)
+        return all_chunks[get_alias_table(all_chunks, weights).sample_seeded(seed, algorithm)]
+    if algorithm == "rotation":
+        # 블록 번호를 순열 위치로 사용하므로 청크 수만큼의 블록 동안 같은 가사가 다시 나오지 않음
+        return all_chunks[rotation_index(block_number, len(all_chunks))]
+    if algorithm == "consistent":
+        # 청크 목록 위치 대신 안정 ID의 해시 링에서 고르므로 카탈로그가 바뀌어도 대부분의 블록이 유지됨
+        return all_chunks[get_hash_ring(all_chunks).lookup(seed)]
+    return all_chunks[select_index(seed, len(all_chunks), algorithm)]
+
+
+def prepare_selection(all_chunks: List[Dict], algorithm: str = DEFAULT_ALGORITHM,
+                      weights: Optional[SelectionWeights] = None) -> None:
+    """
+    선택에 쓰는 파생 데이터(가중치 별칭 테이블, 해시 링)를 미리 만들어 둠
+    생성 비용이 청크 수에 비례하므로 첫 요청 대신 카탈로그를 로드/리로드한 스레드에서 치르도록
+    새 청크 목록을 요청에 내보내기 전에 호출합니다. 만든 데이터는 청크 목록 객체별로 캐시됩니다.
 
-    if interval == "1h":
-        return hour  # 0-23
-    elif interval == "3h":
-        return hour // 3  # 0-7
-    elif interval == "6h":
-        return hour // 6  # 0-3
-    elif interval == "12h":
-        return hour // 12  # 0-1
-    else:  # 24h
-        return 0
+    Args:
+        all_chunks: 모든 가사 청크 리스트
+        algorithm: 선택 알고리즘
+        weights: 청크 가중치
+    """
+    if not all_chunks:
+        return
+    if weights is not None:
+        # 가중치가 있으면 알고리즘과 무관하게 별칭 테이블로 고름 (_select_chunk, get_random_index)
+        get_alias_table(all_chunks, weights)
+    elif algorithm == "consistent":
+        get_hash_ring(all_chunks)
 
 
 def get_interval_lyric(all_chunks: List[Dict],
                        interval: str = "24h",
-                       target_datetime: Optional[datetime] = None) -> Optional[Dict]:
+                       target_datetime: Optional[datetime] = None,
+                       algorithm: str = DEFAULT_ALGORITHM,
+                       weights: Optional[SelectionWeights] = None) -> Optional[Dict]:
     """
     시간 주기별로 일관된 랜덤 청크 선택
     같은 시간 블록 내에서는 항상 같은 가사가 선택됩니다.
 
     Args:
         all_chunks: 모든 가사 청크 리스트
-        interval: 시간 주기 (1h, 3h, 6h, 12h, 24h)
-        target_datetime: 특정 시간 (None이면 현재 시간)
+        interval: 시간 주기 (숫자 + m/h/d/w, 예: 15m, 3h, 24h, 1w)
+        target_datetime: 특정 시간 (None이면 현재 시간, 시간대가 있으면 그 시간대의 현지 시각 기준)
+        algorithm: 선택 알고리즘 (legacy = 기존 선택 결과 유지, hash = 해시 기반,
+                   consistent = 카탈로그가 바뀌어도 대부분의 블록이 같은 가사를 유지,
+                   rotation = 모든 청크가 한 번씩 나오기 전에는 반복 없음)
+        weights: 청크 가중치 (None이면 모든 청크가 같은 확률, legacy/hash에서만 사용 가능)
 
     Returns:
         선택된 가사 청크 또는 None
@@ -57,25 +351,52 @@ def get_interval_lyric(all_chunks: List[Dict],
     if target_datetime is None:
         target_datetime = datetime.now()
 
-    # 날짜 부분 (YYYYMMDD)
-    date_part = int(target_datetime.strftime('%Y%m%d'))
+    seed = get_interval_seed(target_datetime, interval)
 
-    # 시간 블록 계산
-    time_block = _get_time_block(target_datetime, interval)
+    # 전역 난수 생성기를 건드리지 않는 순수 함수로 선택 (스레드 안전)
+    return _select_chunk(all_chunks, seed, algorithm, get_block_number(target_datetime, interval),
+                         weights)
 
-    # 시드 생성: 날짜 + 시간블록
-    # 예: 2025120405 (2025-12-04, 5번째 블록)
-    seed = date_part * 100 + time_block
 
-    # 시드 설정하여 일관된 랜덤 선택
-    random.seed(seed)
-    selected_chunk = random.choice(all_chunks)
-    random.seed()  # 시드 리셋
+def get_interval_timeline(all_chunks: List[Dict],
+                          interval: str = "24h",
+                          start_datetime: Optional[datetime] = None,
+                          count: int = 8,
+                          algorithm: str = DEFAULT_ALGORITHM,
+                          weights: Optional[SelectionWeights] = None) -> List[Tuple[datetime, datetime, Dict]]:
+    """
+    현재 블록부터 연속된 count개 블록의 가사 (위젯 타임라인 용)
+    각 블록의 가사는 그 블록 시각에 get_interval_lyric을 부른 결과와 같습니다.
 
-    return selected_chunk
+    Args:
+        all_chunks: 모든 가사 청크 리스트
+        interval: 시간 주기
+        start_datetime: 첫 블록에 속하는 시간 (None이면 현재 시간)
+        count: 블록 수
+        algorithm: 선택 알고리즘
+        weights: 청크 가중치 (None이면 모든 청크가 같은 확률)
+
+    Returns:
+        [(블록 시작, 블록 끝, 청크), ...] (청크가 없으면 빈 리스트)
+    """
+    if not all_chunks:
+        return []
+
+    if start_datetime is None:
+        start_datetime = datetime.now()
+
+    # 경계는 실제 시각으로 이어 붙이므로 서머타임 전환일에도 항목이 시간순이고 빈틈이 없음
+    timeline = []
+    start, end = get_block_bounds(start_datetime, interval)
+    for _ in range(count):
+        timeline.append((start, end, get_interval_lyric(all_chunks, interval, start, algorithm, weights)))
+        start, end = end, get_next_block_start(end, interval)
+    return timeline
 
 
-def get_daily_lyric(all_chunks: List[Dict], target_date: Optional[date] = None) -> Optional[Dict]:
+def get_daily_lyric(all_chunks: List[Dict], target_date: Optional[date] = None,
+                    algorithm: str = DEFAULT_ALGORITHM,
+                    weights: Optional[SelectionWeights] = None) -> Optional[Dict]:
     """
     날짜를 시드로 사용하여 일관된 랜덤 청크 선택
     같은 날짜에는 항상 같은 가사가 선택됩니다.
@@ -83,6 +404,8 @@ def get_daily_lyric(all_chunks: List[Dict], target_date: Optional[date] = None)
     Args:
         all_chunks: 모든 가사 청크 리스트
         target_date: 특정 날짜 (None이면 오늘)
+        algorithm: 선택 알고리즘 (legacy, hash, consistent, rotation)
+        weights: 청크 가중치 (None이면 모든 청크가 같은 확률)
 
     Returns:
         선택된 가사 청크 (lines, title, album 등 포함) 또는 None
@@ -94,35 +417,54 @@ def get_daily_lyric(all_chunks: List[Dict], target_date: Optional[date] = None)
         target_date = date.today()
 
     # 날짜를 정수 시드로 변환 (예: 20251203)
-    seed = int(target_date.strftime('%Y%m%d'))
+    seed = target_date.year * 10000 + target_date.month * 100 + target_date.day
 
-    # 시드 설정하여 일관된 랜덤 선택
-    random.seed(seed)
-    selected_chunk = random.choice(all_chunks)
-    random.seed()  # 시드 리셋
+    return _select_chunk(all_chunks, seed, algorithm,
+                         target_date.toordinal() - _EPOCH_ORDINAL, weights)
 
-    return selected_chunk
 
-
-def get_random_lyric(all_chunks: List[Dict]) -> Optional[Dict]:
+def get_random_index(all_chunks: List[Dict],
+                     weights: Optional[SelectionWeights] = None) -> Optional[int]:
     """
-    완전 랜덤 가사 청크 선택 (날짜와 무관)
+    완전 랜덤 청크 번호 선택 (날짜와 무관)
 
     Args:
         all_chunks: 모든 가사 청크 리스트
+        weights: 청크 가중치 (None이면 모든 청크가 같은 확률)
 
     Returns:
-        선택된 가사 청크 또는 None
+        선택된 청크 번호 또는 None
     """
     if not all_chunks:
         return None
 
-    return random.choice(all_chunks)
+    # 전역 random 상태를 건드리지 않고, 다른 코드의 random.seed()에도 영향을 받지 않는 OS 난수원 사용
+    if weights is not None:
+        return get_alias_table(all_chunks, weights).sample_random(RANDOM_SOURCE)
+    return RANDOM_SOURCE.randrange(len(all_chunks))
+
+
+def get_random_lyric(all_chunks: List[Dict],
+                     weights: Optional[SelectionWeights] = None) -> Optional[Dict]:
+    """
+    완전 랜덤 가사 청크 선택 (날짜와 무관)
+
+    Args:
+        all_chunks: 모든 가사 청크 리스트
+        weights: 청크 가중치 (None이면 모든 청크가 같은 확률)
+
+    Returns:
+        선택된 가사 청크 또는 None
+    """
+    index = get_random_index(all_chunks, weights)
+    return all_chunks[index] if index is not None else None
 
 
 def get_lyric_for_date_range(all_chunks: List[Dict],
                              start_date: date,
-                             end_date: date) -> List[Dict]:
+                             end_date: date,
+                             algorithm: str = DEFAULT_ALGORITHM,
+                             weights: Optional[SelectionWeights] = None) -> List[Dict]:
     """
     특정 날짜 범위의 가사들을 반환 (테스트/미리보기 용)
 
@@ -130,6 +472,8 @@ def get_lyric_for_date_range(all_chunks: List[Dict],
         all_chunks: 모든 가사 청크 리스트
         start_date: 시작 날짜
         end_date: 종료 날짜
+        algorithm: 선택 알고리즘 (legacy, hash, consistent, rotation)
+        weights: 청크 가중치 (None이면 모든 청크가 같은 확률)
 
     Returns:
         각 날짜의 가사 리스트
@@ -141,7 +485,7 @@ def get_lyric_for_date_range(all_chunks: List[Dict],
     current_date = start_date
 
     while current_date <= end_date:
-        lyric = get_daily_lyric(all_chunks, current_date)
+        lyric = get_daily_lyric(all_chunks, current_date, algorithm, weights)
         if lyric:
             results.append({
                 'date': current_date.strftime('%Y-%m-%d'),
@@ -0,0 +1,149 @@
+"""
+HTTP 캐시 헤더 도우미
+시간 블록 안에서는 응답이 바뀌지 않으므로 ETag와 블록 경계까지의 만료 시각을 붙여
+위젯의 HTTP 스택이나 앞단 리버스 프록시가 대부분의 요청을 흡수하게 합니다.
+"""
+
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from hashlib import blake2b
+from typing import Dict, Optional, Tuple
+
+
+def make_etag(*parts) -> str:
+    """
+    응답을 결정하는 값들로 강한 ETag 생성
+
+    Args:
+        *parts: 응답 본문을 결정하는 값들 (카탈로그 버전, 주기, 블록 시드 등)
+
+    Returns:
+        따옴표로 감싼 ETag 문자열
+    """
+    key = "\x1f".join(str(part) for part in parts)
+    return f'"{blake2b(key.encode("utf-8"), digest_size=12).hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    If-None-Match 헤더가 ETag와 일치하는지 확인 (약한 비교, RFC 9110 13.1.2)
+
+    Args:
+        if_none_match: 요청의 If-None-Match 헤더 값
+        etag: 현재 응답의 ETag
+
+    Returns:
+        일치하면 True (304 응답 가능)
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def block_cache_headers(etag: str, now: datetime, expires_at: datetime) -> Dict[str, str]:
+    """
+    블록 경계에서 만료되는 캐시 헤더
+
+    Args:
+        etag: 응답 ETag
+        now: 요청 시각
+        expires_at: 다음 블록 시작 시각 (now와 같은 시간대, 시간대가 없으면 서버 현지 시각)
+
+    Returns:
+        ETag, Cache-Control, Expires 헤더 딕셔너리
+    """
+    # 벽시계 차이가 아니라 절대 시각(POSIX 초) 차이로 계산해야 서머타임이 바뀌는 날에도 정확함
+    # (같은 tzinfo의 aware datetime끼리 빼면 UTC 오프셋 변화가 무시됨)
+    # timestamp()는 시간대가 없는 datetime을 서버 현지 시각으로 해석
+    expires_ts = expires_at.timestamp()
+    max_age = max(0, int(expires_ts - now.timestamp()))
+    return {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={max_age}",
+        "Expires": format_datetime(datetime.fromtimestamp(expires_ts, timezone.utc), usegmt=True)
+    }
+
+
+def http_date(timestamp: float) -> str:
+    """
+    Last-Modified 등에 쓰는 HTTP 날짜 문자열
+
+    Args:
+        timestamp: POSIX 시각 (초)
+
+    Returns:
+        RFC 9110 IMF-fixdate 문자열 (예: Thu, 04 Dec 2025 09:00:00 GMT)
+    """
+    return format_datetime(datetime.fromtimestamp(int(timestamp), timezone.utc), usegmt=True)
+
+
+def not_modified_since(if_modified_since: Optional[str], timestamp: float) -> bool:
+    """
+    If-Modified-Since 이후로 바뀌지 않았는지 확인 (If-None-Match가 없을 때만 사용)
+
+    Args:
+        if_modified_since: 요청의 If-Modified-Since 헤더 값
+        timestamp: 리소스 수정 시각 (POSIX 초)
+
+    Returns:
+        바뀌지 않았으면 True (304 응답 가능, 날짜 형식이 잘못되었으면 False)
+    """
+    if not if_modified_since:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError, IndexError):
+        return False
+    if since is None or since.tzinfo is None:
+        return False
+    # HTTP 날짜는 초 단위이므로 수정 시각의 소수점 이하는 버림
+    return int(timestamp) <= since.timestamp()
+
+
+def parse_range(range_header: Optional[str], length: int) -> Optional[Tuple[int, int]]:
+    """
+    Range 헤더에서 바이트 범위 하나를 해석 (RFC 9110 14.2)
+    여러 범위(multipart/byteranges)는 지원하지 않으며, 이때는 전체 응답을 보내도록 None을 반환합니다.
+
+    Args:
+        range_header: 요청의 Range 헤더 값 (예: bytes=0-1023, bytes=1024-, bytes=-512)
+        length: 전체 본문 길이
+
+    Returns:
+        (시작, 끝) 바이트 위치 (끝 포함), Range를 무시하고 전체를 보내야 하면 None
+
+    Raises:
+        ValueError: 범위가 본문을 벗어나 만족시킬 수 없음 (416 응답)
+    """
+    if not range_header:
+        return None
+    unit, _, ranges = range_header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in ranges:
+        return None
+
+    first, sep, last = ranges.strip().partition("-")
+    if not sep or not (first.isdigit() or last.isdigit()) or (first and not first.isdigit()) \
+            or (last and not last.isdigit()):
+        return None
+
+    if not first:
+        # bytes=-N: 마지막 N 바이트
+        suffix = int(last)
+        if suffix == 0 or length == 0:
+            raise ValueError(f"만족시킬 수 없는 범위: {range_header}")
+        return max(0, length - suffix), length - 1
+
+    start = int(first)
+    if last and int(last) < start:
+        return None
+    if start >= length:
+        raise ValueError(f"만족시킬 수 없는 범위: {range_header}")
+    return start, min(int(last), length - 1) if last else length - 1
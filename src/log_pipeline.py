@@ -0,0 +1,197 @@
+"""
+비동기 로깅 파이프라인
+요청을 처리하는 스레드는 로그 레코드를 크기가 정해진 큐에 넣기만 하고, 포맷과 파일/터미널 출력은
+리스너 스레드 하나가 맡습니다. 큐가 가득 차면 요청을 기다리게 하지 않고 레코드를 버린 뒤 개수를 셉니다.
+자주 불리는 엔드포인트의 접근 로그는 N건 중 1건만 남기고, 일정 주기로 라우트별 건수를 요약합니다.
+"""
+
+import logging
+import os
+import queue
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+class BoundedQueueHandler(QueueHandler):
+    """큐가 가득 차면 기다리지 않고 버리는 QueueHandler (버린 개수는 dropped)"""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # 같은 프로세스의 리스너 스레드가 처리하므로 포맷(메시지 합치기, 트레이스백 문자열화)은 리스너에서
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class _DrainingQueueListener(QueueListener):
+    """종료 신호를 큐가 비워질 때까지 기다렸다 넣는 QueueListener (가득 찬 큐에서 stop해도 실패하지 않도록)"""
+
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel)
+
+
+class LogPipeline:
+    """
+    루트 로거의 핸들러를 리스너 스레드 뒤로 옮기는 파이프라인
+    fork한 자식 프로세스(src.prefork 워커)에서는 리스너 스레드가 없으므로 자동으로 새로 띄웁니다.
+    """
+
+    def __init__(self, max_queue: int = 10000, logger: Optional[logging.Logger] = None):
+        """
+        Args:
+            max_queue: 큐에 쌓아 둘 최대 레코드 수
+            logger: 파이프라인을 설치할 로거 (None이면 루트 로거)
+        """
+        self.max_queue = max_queue
+        self.logger = logger or logging.getLogger()
+        self.handlers: List[logging.Handler] = []
+        self.handler: Optional[BoundedQueueHandler] = None
+        self.listener: Optional[QueueListener] = None
+        self._dropped_before = 0  # fork 이전 핸들러에서 버린 개수
+
+    def start(self) -> 'LogPipeline':
+        """
+        로거의 현재 핸들러를 리스너로 옮기고 큐 핸들러로 교체
+
+        Returns:
+            self
+        """
+        if self.handler is not None:
+            return self
+        self.handlers = list(self.logger.handlers)
+        for handler in self.handlers:
+            self.logger.removeHandler(handler)
+        self._install()
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=self._after_fork_in_child)
+        return self
+
+    def _install(self) -> None:
+        self.handler = BoundedQueueHandler(queue.Queue(self.max_queue))
+        self.logger.addHandler(self.handler)
+        self.listener = _DrainingQueueListener(self.handler.queue, *self.handlers, respect_handler_level=True)
+        self.listener.start()
+
+    def _after_fork_in_child(self) -> None:
+        if self.handler is None:
+            return
+        # 부모의 리스너 스레드는 자식에 없으므로 새 큐와 리스너로 교체 (부모 큐에 남은 레코드는 부모가 출력)
+        self._dropped_before += self.handler.dropped
+        self.logger.removeHandler(self.handler)
+        for handler in self.handlers:
+            handler.createLock()
+        self._install()
+
+    def stop(self) -> None:
+        """큐에 남은 레코드를 모두 출력하고 원래 핸들러로 되돌림 (서버 종료 시)"""
+        if self.handler is None:
+            return
+        self.logger.removeHandler(self.handler)
+        self.listener.stop()
+        for handler in self.handlers:
+            self.logger.addHandler(handler)
+        self._dropped_before += self.handler.dropped
+        self.handler = None
+        self.listener = None
+
+    @property
+    def dropped(self) -> int:
+        """큐가 가득 차서 버린 레코드 수"""
+        return self._dropped_before + (self.handler.dropped if self.handler is not None else 0)
+
+    @property
+    def queue_size(self) -> int:
+        """아직 출력하지 않은 레코드 수"""
+        return self.handler.queue.qsize() if self.handler is not None else 0
+
+
+class AccessLogMiddleware:
+    """
+    접근 로그 ASGI 미들웨어 (uvicorn 접근 로그 대신 사용, uvicorn은 --no-access-log로 실행)
+    hot_paths의 성공 응답은 sample_rate건 중 1건만 남기고, 오류 응답과 나머지 라우트는 모두 남깁니다.
+    summary_seconds마다 그동안의 라우트별 건수를 한 줄로 요약합니다.
+    """
+
+    def __init__(self, app, logger: logging.Logger, hot_paths: Iterable[str] = (),
+                 sample_rate: int = 100, summary_seconds: float = 60.0):
+        """
+        Args:
+            app: 감쌀 ASGI 앱
+            logger: 접근 로그를 남길 로거
+            hot_paths: 샘플링할 라우트 (첫 경로 단위, 예: /current-lyric, /covers)
+            sample_rate: hot_paths 성공 응답을 몇 건에 1건 남길지 (1이면 모두, 0이면 남기지 않음)
+            summary_seconds: 요약 로그 주기 (초, 0이면 요약하지 않음)
+        """
+        self.app = app
+        self.logger = logger
+        self.hot_paths = frozenset(hot_paths)
+        self.sample_rate = sample_rate
+        self.summary_seconds = summary_seconds
+        self._seen: Dict[str, int] = {}
+        self._counts: Dict[str, int] = {}
+        self._summary_at = time.monotonic() + summary_seconds
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _route(path: str) -> str:
+        # 요약 키가 무한히 늘어나지 않도록 첫 경로 단위로 묶음 (/covers/a.webp → /covers)
+        head = path.split("/", 2)[1] if path.startswith("/") else ""
+        return f"/{head}" if head else "/"
+
+    def _record(self, path: str, status: int) -> Tuple[bool, Optional[Dict[str, int]]]:
+        """(이 요청을 남길지, 요약할 건수)"""
+        route = self._route(path)
+        summary = None
+        with self._lock:
+            self._counts[route] = self._counts.get(route, 0) + 1
+            if route in self.hot_paths and status < 400:
+                seen = self._seen[route] = self._seen.get(route, 0) + 1
+                log = self.sample_rate > 0 and (seen - 1) % self.sample_rate == 0
+            else:
+                log = True
+            if self.summary_seconds and time.monotonic() >= self._summary_at:
+                summary, self._counts = self._counts, {}
+                self._summary_at = time.monotonic() + self.summary_seconds
+        return log, summary
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status = 500
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            path = scope.get("path", "")
+            log, summary = self._record(path, status)
+            if log:
+                client = scope.get("client")
+                query = scope.get("query_string", b"")
+                self.logger.info(
+                    '%s - "%s %s%s" %d %.1fms',
+                    client[0] if client else "-", scope.get("method", "-"), path,
+                    f"?{query.decode('latin-1')}" if query else "", status, (time.perf_counter() - start) * 1000
+                )
+            if summary:
+                self.logger.info(
+                    "접근 요약 (%g초): %s", self.summary_seconds,
+                    ", ".join(f"{route} {count}건" for route, count in sorted(summary.items()))
+                )
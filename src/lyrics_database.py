@@ -5,73 +5,661 @@
 
 import json
 import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Executor, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Iterable, Optional, Sequence, Set, Tuple
+
+from src.lyrics_models import ChunkList, LazyLyricChunk, LyricChunk, TrackInfo
+from src.search_index import LyricsSearchIndex
+from src.catalog_snapshot import (
+    CatalogSnapshot, SnapshotChunks, SnapshotError, SnapshotLyricChunk, SnapshotTrack,
+    compute_fingerprint, file_digest, write_snapshot
+)
+
+# data/ 안에 저장되는 기본 스냅샷 파일명 (점으로 시작하므로 앨범 스캔에서 제외됨)
+SNAPSHOT_FILENAME = ".catalog.snapshot"
+
+
+def _read_track_file(track_file: Path) -> Tuple[Optional[os.stat_result], Optional[Dict], bytes, Optional[str]]:
+    """
+    트랙 JSON 파일 하나를 읽고 파싱 (스레드 풀에서도 호출됨)
+    stat을 먼저 읽으므로, 읽는 도중 파일이 바뀌어도 다음 리로드에서 변경이 감지됩니다.
+
+    Args:
+        track_file: 트랙 JSON 파일 경로
+
+    Returns:
+        (stat 또는 None, 트랙 데이터 또는 None, 원본 바이트, 오류 메시지 또는 None)
+    """
+    st = None
+    raw = b""
+    try:
+        st = track_file.stat()
+        raw = track_file.read_bytes()
+        return st, json.loads(raw.decode('utf-8')), raw, None
+    except json.JSONDecodeError as e:
+        return st, None, raw, f"❌ JSON 파싱 오류: {track_file.name} - {e}"
+    except Exception as e:
+        return st, None, raw, f"❌ 파일 로드 오류: {track_file.name} - {e}"
+
+
+class TrackEntry:
+    """트랙 파일 하나의 매니페스트 항목 (stat, 내용 해시, 파싱 결과)"""
+
+    __slots__ = ('mtime_ns', 'size', 'digest', 'track', 'chunks', 'chunk_range')
+
+    def __init__(self, mtime_ns: int, size: int, digest: bytes,
+                 track: Optional[TrackInfo], chunks: Optional[List[LyricChunk]],
+                 chunk_range: Optional[Tuple[int, int]] = None):
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.digest = digest
+        self.track = track  # 파싱 실패한 파일이면 None
+        self.chunks = chunks
+        # 스냅샷에서 만든 항목은 청크를 바로 디코딩하지 않고 범위만 기억
+        self.chunk_range = chunk_range
+
+    @property
+    def chunk_count(self) -> int:
+        """이 트랙의 청크 수 (스냅샷 항목도 디코딩 없이 계산)"""
+        return len(self.chunks) if self.chunks is not None else self.chunk_range[1]
+
+    def with_stat(self, mtime_ns: int, size: int) -> 'TrackEntry':
+        """내용은 같고 stat만 바뀐 항목 (touch 등)"""
+        return TrackEntry(mtime_ns, size, self.digest, self.track, self.chunks, self.chunk_range)
+
+
+def _summarize_albums(entries: Iterable[TrackEntry],
+                      previous: Optional[Dict[str, Dict]] = None,
+                      dirty: Optional[Set[str]] = None) -> Dict[str, Dict]:
+    """
+    트랙 항목들로 앨범별 통계 계산 (트랙 단위로 집계하므로 청크를 순회하지 않음)
+    dirty가 주어지면 dirty 앨범만 집계하고, previous도 주어지면 나머지 앨범은 previous를 재사용합니다.
+
+    Args:
+        entries: 로드 순서대로 정렬된 트랙 항목들
+        previous: 이전 앨범 통계
+        dirty: 다시 집계할 앨범명 집합
+
+    Returns:
+        앨범명을 키로 하는 딕셔너리 (청크 순서상 처음 등장한 순서)
+    """
+    albums: Dict[str, Optional[Dict]] = {}
+    for entry in entries:
+        track = entry.track
+        if track is None:
+            continue
+        chunk_count = entry.chunk_count
+        if chunk_count == 0:
+            continue
+
+        album_name = track.album
+        if dirty is not None and album_name not in dirty:
+            if previous is not None:
+                albums.setdefault(album_name, None)
+            continue
+
+        info = albums.get(album_name)
+        if info is None:
+            info = albums[album_name] = {
+                'year': track.year,
+                'chunk_count': 0,
+                'tracks': set()
+            }
+        info['chunk_count'] += chunk_count
+        info['tracks'].add(track.title)
+
+    result = {}
+    for album_name, info in albums.items():
+        if info is None:
+            result[album_name] = previous[album_name]
+            continue
+        # set을 리스트로 변환
+        info['tracks'] = sorted(info['tracks'])
+        info['track_count'] = len(info['tracks'])
+        result[album_name] = info
+    return result
+
+
+class CatalogState:
+    """
+    한 시점의 카탈로그 전체
+    리로드는 새 CatalogState를 따로 만든 뒤 참조 하나만 바꿔 끼우므로,
+    요청 처리 중에 반쯤 로드된 목록이 보이지 않습니다.
+    """
+
+    __slots__ = ('chunks', 'albums_count', 'tracks_count', 'version', 'entries', 'snapshot',
+                 'albums', 'search_index')
+
+    def __init__(self, chunks: Sequence[LyricChunk], albums_count: int, tracks_count: int,
+                 version: str, entries: Optional[Dict[str, TrackEntry]] = None,
+                 snapshot: Optional[CatalogSnapshot] = None):
+        self.chunks = chunks
+        self.albums_count = albums_count
+        self.tracks_count = tracks_count
+        self.version = version
+        self.entries = entries  # 상대 경로 -> TrackEntry (로드 순서), 스냅샷이면 필요할 때 생성
+        self.snapshot = snapshot
+        self.albums: Optional[Dict[str, Dict]] = None  # 앨범별 통계 (처음 조회할 때 집계)
+        self.search_index: Optional[LyricsSearchIndex] = None
+
+
+_EMPTY_STATE = CatalogState([], 0, 0, "empty", {})
+
+
+class LazyLineStore:
+    """
+    lazy 모드에서 청크 라인을 트랙 파일에서 읽어오는 저장소
+    최근 사용한 트랙의 라인만 LRU로 보관하므로 상주 메모리가 max_tracks에 묶입니다.
+    """
+
+    def __init__(self, data_dir: Path, max_tracks: int = 256):
+        """
+        Args:
+            data_dir: 가사 데이터 디렉토리
+            max_tracks: 라인을 캐시할 최대 트랙 수
+        """
+        self.data_dir = data_dir
+        self.max_tracks = max_tracks
+        self.hits = 0
+        self.misses = 0
+        self._cache: "OrderedDict[TrackInfo, List[Tuple[str, ...]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_lines(self, track: TrackInfo, position: int) -> Tuple[str, ...]:
+        """
+        청크 라인 반환
+
+        Args:
+            track: 청크가 속한 트랙
+            position: 트랙 안에서 청크 위치 (0부터)
+
+        Returns:
+            가사 라인 튜플 (파일이 사라졌거나 위치가 없으면 빈 튜플)
+        """
+        with self._lock:
+            chunk_lines = self._cache.get(track)
+            if chunk_lines is not None:
+                self._cache.move_to_end(track)
+                self.hits += 1
+
+        if chunk_lines is None:
+            chunk_lines = self._read_track(track)
+            with self._lock:
+                self.misses += 1
+                self._cache[track] = chunk_lines
+                while len(self._cache) > self.max_tracks:
+                    self._cache.popitem(last=False)
+
+        return chunk_lines[position] if position < len(chunk_lines) else ()
+
+    def _read_track(self, track: TrackInfo) -> List[Tuple[str, ...]]:
+        track_file = self.data_dir / track.album_folder / track.track_file
+        _, track_data, _, error = _read_track_file(track_file)
+        if error:
+            print(error)
+            return []
+        return [tuple(chunk.get('lines', [])) for chunk in track_data.get('chunks', [])]
+
+    def clear(self) -> None:
+        """캐시 비우기"""
+        with self._lock:
+            self._cache.clear()
+
+    def memory_bytes(self) -> int:
+        """캐시된 라인이 차지하는 메모리 추정치 (바이트)"""
+        with self._lock:
+            cached = list(self._cache.values())
+        size = 0
+        for chunk_lines in cached:
+            size += sys.getsizeof(chunk_lines)
+            for lines in chunk_lines:
+                size += sys.getsizeof(lines) + sum(map(sys.getsizeof, lines))
+        return size
+
+
+def _make_entry(album_folder: Path, track_file: Path, st: Optional[os.stat_result],
+                track_data: Optional[Dict], raw: bytes,
+                line_store: Optional[LazyLineStore] = None) -> TrackEntry:
+    """
+    파싱 결과로 TrackEntry 생성 (트랙 메타데이터는 한 번만 만들고 각 청크가 참조)
+    line_store가 있으면 라인 없이 위치만 가진 LazyLyricChunk를 만듭니다.
+    """
+    mtime_ns, size = (st.st_mtime_ns, st.st_size) if st else (0, 0)
+    if track_data is None:
+        return TrackEntry(mtime_ns, size, file_digest(raw), None, [])
+
+    # album_folder는 앨범 커버용
+    track = TrackInfo.from_json(track_data, album_folder.name, track_file.name)
+    if line_store is not None:
+        chunks = [
+            LazyLyricChunk(line_store, track, position, chunk.get('id', position + 1))
+            for position, chunk in enumerate(track_data.get('chunks', []))
+        ]
+    else:
+        chunks = [
+            LyricChunk(chunk.get('lines', []), track, chunk.get('id', position + 1))
+            for position, chunk in enumerate(track_data.get('chunks', []))
+        ]
+    return TrackEntry(mtime_ns, size, file_digest(raw), track, chunks)
+
+
+def _track_bytes(tracks: Iterable[TrackInfo], seen: Set[int]) -> int:
+    """트랙 메타데이터 메모리 추정치 (intern으로 공유되는 문자열은 한 번만 셈)"""
+    size = 0
+    for track in tracks:
+        size += sys.getsizeof(track)
+        for value in (track.title, track.album, track.artist, track.album_folder, track.track_file):
+            if id(value) not in seen:
+                seen.add(id(value))
+                size += sys.getsizeof(value)
+    return size
+
+
+def _version_of(manifest: List[Tuple[str, int, int]]) -> str:
+    """매니페스트 stat 지문으로 카탈로그 버전 문자열 생성 (스냅샷 지문과 같은 값)"""
+    return compute_fingerprint(manifest).hex()[:16]
 
 
 class LyricsDatabase:
     """가사 데이터베이스 관리 클래스"""
 
-    def __init__(self, data_dir: str = "data"):
+    def __init__(self, data_dir: str = "data",
+                 snapshot_path: Optional[str] = None,
+                 use_snapshot: bool = True,
+                 verify_snapshot: bool = True,
+                 load_workers: int = 0,
+                 lazy: bool = False,
+                 lazy_cache_tracks: int = 256,
+                 search_index: bool = False,
+                 exclude_folders: Sequence[str] = ('example',),
+                 executor: Optional[Executor] = None):
         """
         Args:
             data_dir: 가사 데이터가 저장된 디렉토리 경로
+            snapshot_path: 스냅샷 파일 경로 (None이면 data_dir/.catalog.snapshot)
+            use_snapshot: 스냅샷이 있으면 폴더 스캔 대신 mmap으로 로드
+            verify_snapshot: 트랙 파일 stat으로 스냅샷이 최신인지 확인
+                             (False면 검사 없이 스냅샷을 신뢰)
+            load_workers: 폴더 스캔 시 병렬 로드 스레드 수 (0/1이면 순차 로드)
+                          네트워크 스토리지처럼 파일 I/O가 느린 환경에서 사용
+            lazy: 시작 시 인덱스(트랙 파일, 청크 위치, 메타데이터)만 만들고
+                  가사 라인은 청크가 선택될 때 읽음 (폴더 스캔 로드에 적용,
+                  스냅샷 로드는 원래 mmap에서 필요할 때만 디코딩)
+            lazy_cache_tracks: lazy 모드에서 라인을 캐시할 최대 트랙 수
+            search_index: 전문 검색 인덱스를 미리 만들 카탈로그인지 (start_search_index()가
+                          백그라운드 스레드에서 만듦, False거나 부르기 전이면 search()를 처음 호출할 때
+                          만들어짐, 수만 청크에서 수 초와 수십 MB가 들므로 검색을 쓰지 않으면 False로 두세요)
+            exclude_folders: 이름에 이 문자열(대소문자 무시)이 들어간 앨범 폴더는 건너뜀
+                             (기본 'example'로 example_album 제외, 빈 튜플이면 모두 로드)
+            executor: 병렬 로드에 쓸 공유 스레드 풀 (여러 카탈로그가 풀 하나를 공유,
+                      None이면 load_workers만큼 로드할 때마다 새로 만듦)
         """
         self.data_dir = Path(data_dir)
-        self.all_chunks: List[Dict] = []
-        self.albums_count = 0
-        self.tracks_count = 0
+        self.load_workers = load_workers
+        self.snapshot_path = Path(snapshot_path) if snapshot_path else self.data_dir / SNAPSHOT_FILENAME
+        self.reload_count = 0
+        self.line_store = LazyLineStore(self.data_dir, lazy_cache_tracks) if lazy else None
+        self._state = _EMPTY_STATE
+        self._reload_lock = threading.Lock()
+        # 리로드 후 검색 인덱스 재생성: 작업 스레드 하나가 가장 최근 상태만 만듦
+        self._index_lock = threading.Lock()
+        self._index_target: Optional[CatalogState] = None
+        self._index_worker_running = False
+        self._search_build_lock = threading.Lock()  # 첫 검색 요청이 몰려도 인덱스는 한 번만 생성
+        self.search_enabled = search_index
+        self.exclude_folders = tuple(pattern.lower() for pattern in exclude_folders)
+        self.executor = executor
+        self.load_duration = 0.0  # 시작 로드(스냅샷 또는 폴더 스캔)에 걸린 시간 (초)
+        self.last_reload_duration = 0.0  # 마지막 reload()에 걸린 시간 (초)
 
+        start = time.perf_counter()
         if self.data_dir.exists():
-            self.load_all_lyrics()
+            if not (use_snapshot and self.load_snapshot(verify=verify_snapshot)):
+                self.load_all_lyrics()
         else:
             print(f"⚠️  경고: '{data_dir}' 디렉토리가 존재하지 않습니다.")
+        self.load_duration = time.perf_counter() - start
 
-    def load_all_lyrics(self) -> None:
-        """모든 앨범 폴더를 스캔하고 모든 청크를 로드"""
-        self.all_chunks = []
-        self.albums_count = 0
-        self.tracks_count = 0
+    @property
+    def all_chunks(self) -> Sequence[LyricChunk]:
+        """현재 카탈로그의 모든 청크"""
+        return self._state.chunks
 
-        # data/ 안의 모든 앨범 폴더 찾기 (example_album 제외)
-        album_folders = sorted([
+    @property
+    def albums_count(self) -> int:
+        """앨범 폴더 수"""
+        return self._state.albums_count
+
+    @property
+    def tracks_count(self) -> int:
+        """로드된 트랙 수"""
+        return self._state.tracks_count
+
+    @property
+    def version(self) -> str:
+        """카탈로그 버전 (트랙 파일 stat 지문, 리로드로 내용이 바뀌면 달라짐)"""
+        return self._state.version
+
+    @property
+    def snapshot(self) -> Optional[CatalogSnapshot]:
+        """현재 카탈로그가 스냅샷에서 왔다면 그 스냅샷"""
+        return self._state.snapshot
+
+    def _scan_album_folders(self) -> List[Path]:
+        """data/ 안의 앨범 폴더 목록 (숨김 폴더와 exclude_folders 제외, 정렬됨)"""
+        return sorted([
             f for f in self.data_dir.iterdir()
-            if f.is_dir() and not f.name.startswith('.') and 'example' not in f.name.lower()
+            if f.is_dir() and not f.name.startswith('.')
+            and not any(pattern in f.name.lower() for pattern in self.exclude_folders)
         ])
 
+    def _scan_manifest(self) -> Tuple[int, List[Tuple[str, int, int]]]:
+        """
+        트랙 파일을 열지 않고 stat 정보만 수집
+
+        Returns:
+            (앨범 폴더 수, [(상대 경로, mtime_ns, size), ...])
+        """
+        album_folders = self._scan_album_folders()
+        manifest = []
+        for album_folder in album_folders:
+            for track_file in sorted(album_folder.glob("*.json")):
+                st = track_file.stat()
+                manifest.append((f"{album_folder.name}/{track_file.name}", st.st_mtime_ns, st.st_size))
+        return len(album_folders), manifest
+
+    def load_snapshot(self, verify: bool = True) -> bool:
+        """
+        스냅샷 파일을 mmap으로 열어 청크를 제공
+
+        Args:
+            verify: 현재 트랙 파일들의 stat 지문과 비교하여 오래된 스냅샷은 거부
+
+        Returns:
+            스냅샷 로드 성공 여부 (없거나 오래되었으면 False)
+        """
+        if not self.snapshot_path.exists():
+            return False
+
+        try:
+            snapshot = CatalogSnapshot(self.snapshot_path)
+        except (OSError, SnapshotError) as e:
+            print(f"⚠️  스냅샷 로드 실패: {self.snapshot_path.name} - {e}")
+            return False
+
+        if verify:
+            _, manifest = self._scan_manifest()
+            if compute_fingerprint(manifest) != snapshot.fingerprint:
+                print(f"⚠️  스냅샷이 오래되었습니다. 폴더를 다시 스캔합니다: {self.snapshot_path.name}")
+                snapshot.close()
+                return False
+
+        # 이전 스냅샷은 참조 중인 요청이 끝나면 GC가 mmap을 해제
+        self._state = CatalogState(SnapshotChunks(snapshot), snapshot.albums_count,
+                                   snapshot.tracks_count, snapshot.fingerprint.hex()[:16],
+                                   snapshot=snapshot)
+        return True
+
+    def build_snapshot(self, snapshot_path: Optional[str] = None) -> Optional[Path]:
+        """
+        data/ 트리 전체를 스냅샷 파일로 컴파일
+
+        Args:
+            snapshot_path: 출력 경로 (None이면 self.snapshot_path)
+
+        Returns:
+            기록된 스냅샷 파일 경로 또는 None (스냅샷에 담을 수 없는 값이 있어 건너뜀, 기존 파일은 그대로)
+        """
+        path = Path(snapshot_path) if snapshot_path else self.snapshot_path
+        album_folders = self._scan_album_folders()
+        tracks = []
+        manifest = []
+
+        for album_folder, track_file, st, track_data, raw, error in self._iter_tracks(album_folders):
+            if st is not None:
+                manifest.append((f"{album_folder.name}/{track_file.name}", st.st_mtime_ns, st.st_size))
+            if error:
+                print(error)
+                continue
+            tracks.append(SnapshotTrack(album_folder.name, track_file.name,
+                                        st.st_mtime_ns, st.st_size,
+                                        file_digest(raw), track_data))
+
+        try:
+            write_snapshot(path, tracks, len(album_folders), compute_fingerprint(manifest))
+        except SnapshotError as e:
+            print(f"⚠️  스냅샷을 만들지 않습니다: {e}")
+            return None
+        return path
+
+    def load_all_lyrics(self, workers: Optional[int] = None) -> None:
+        """
+        모든 앨범 폴더를 스캔하고 모든 청크를 로드
+
+        Args:
+            workers: 병렬 로드 스레드 수 (None이면 생성 시 지정한 load_workers)
+        """
+        # data/ 안의 모든 앨범 폴더 찾기 (example_album 제외)
+        album_folders = self._scan_album_folders()
+
         if not album_folders:
             print(f"⚠️  '{self.data_dir}' 폴더에 앨범이 없습니다.")
+            self._state = _EMPTY_STATE
             return
 
-        self.albums_count = len(album_folders)
+        entries = {}
+        manifest = []
+        for album_folder, track_file, st, track_data, raw, error in self._iter_tracks(album_folders, workers):
+            if error:
+                print(error)
+            rel_path = f"{album_folder.name}/{track_file.name}"
+            entry = _make_entry(album_folder, track_file, st, track_data, raw, self.line_store)
+            entries[rel_path] = entry
+            manifest.append((rel_path, entry.mtime_ns, entry.size))
 
-        for album_folder in album_folders:
-            # 각 앨범 폴더 안의 모든 JSON 파일 찾기
-            track_files = sorted(album_folder.glob("*.json"))
-
-            for track_file in track_files:
-                try:
-                    with open(track_file, 'r', encoding='utf-8') as f:
-                        track_data = json.load(f)
-                        self.tracks_count += 1
-
-                        # 각 청크에 메타데이터 추가
-                        for chunk in track_data.get('chunks', []):
-                            self.all_chunks.append({
-                                'lines': chunk.get('lines', []),
-                                'title': track_data.get('title', 'Unknown'),
-                                'album': track_data.get('album', 'Unknown'),
-                                'year': track_data.get('year', 0),
-                                'track_number': track_data.get('track_number', 0),
-                                'artist': track_data.get('artist', '태연 (TAEYEON)'),
-                                'album_folder': album_folder.name  # 앨범 커버용 폴더명
-                            })
-                except json.JSONDecodeError as e:
-                    print(f"❌ JSON 파싱 오류: {track_file.name} - {e}")
-                except Exception as e:
-                    print(f"❌ 파일 로드 오류: {track_file.name} - {e}")
-
-    def get_all_chunks(self) -> List[Dict]:
+        state = self._build_state(len(album_folders), entries, _version_of(manifest), None)
+        state.albums = _summarize_albums(entries.values())
+        self._state = state
+
+    def _build_state(self, albums_count: int, entries: Dict[str, TrackEntry], version: str,
+                     previous: Optional[CatalogState]) -> CatalogState:
+        """
+        매니페스트 항목들을 이어 붙여 새 CatalogState 생성
+        스냅샷에서 온 항목은 라인을 디코딩하지 않고 스냅샷 청크를 가리키는 청크로 채웁니다
+        (lazy 모드면 트랙 파일에서 라인을 읽는 LazyLyricChunk).
+        """
+        chunks: List[LyricChunk] = ChunkList()
+        tracks_count = 0
+        for entry in entries.values():
+            if entry.chunks is None:
+                entry.chunks = self._snapshot_entry_chunks(previous.chunks.snapshot, *entry.chunk_range)
+            chunks.extend(entry.chunks)
+            if entry.track is not None:
+                tracks_count += 1
+        return CatalogState(chunks, albums_count, tracks_count, version, entries)
+
+    def _snapshot_entry_chunks(self, snapshot: CatalogSnapshot, start: int, count: int) -> List[LyricChunk]:
+        """스냅샷 트랙 하나의 청크 (청크 테이블만 읽고 가사 라인은 디코딩하지 않음)"""
+        refs = [snapshot.get_chunk_ref(index) for index in range(start, start + count)]
+        if self.line_store is not None:
+            return [LazyLyricChunk(self.line_store, track, position, number)
+                    for position, (track, number) in enumerate(refs)]
+        return [SnapshotLyricChunk(snapshot, start + position, track, number)
+                for position, (track, number) in enumerate(refs)]
+
+    def _entries_from_snapshot(self, state: CatalogState) -> Dict[str, TrackEntry]:
+        """스냅샷 트랙 테이블로 매니페스트 항목 생성 (청크는 디코딩하지 않음)"""
+        snapshot = state.snapshot
+        entries = {}
+        for track_index in range(snapshot.tracks_count):
+            record = snapshot.get_track_record(track_index)
+            track = record['track']
+            entries[f"{track.album_folder}/{record['track_file']}"] = TrackEntry(
+                record['mtime_ns'], record['size'], record['digest'], track, None,
+                (record['chunk_start'], record['chunk_count'])
+            )
+        return entries
+
+    def reload(self, prepare: Optional[Callable[[Sequence[LyricChunk]], None]] = None) -> Dict:
+        """
+        바뀐 트랙 파일만 다시 파싱하여 카탈로그를 갱신
+        stat(mtime, size)이 같은 파일은 건너뛰고, stat이 바뀌어도 내용 해시가 같으면
+        다시 파싱하지 않습니다. 새 카탈로그는 따로 만든 뒤 한 번에 교체합니다.
+
+        Args:
+            prepare: 내용이 바뀌었을 때 교체 직전에 새 청크 목록으로 호출할 함수
+                     (해시 링 등 요청 처리에 필요한 파생 데이터를 요청이 보기 전에 만들어 둠)
+
+        Returns:
+            added, changed, removed, unchanged, version, swapped, duration_ms 를 담은 딕셔너리
+        """
+        start = time.perf_counter()
+
+        with self._reload_lock:
+            previous = self._state
+            old_entries = self._state_entries(previous)
+
+            album_folders = self._scan_album_folders() if self.data_dir.exists() else []
+            entries: Dict[str, TrackEntry] = {}
+            manifest = []
+            added = changed = unchanged = 0
+            content_changed = len(album_folders) != previous.albums_count
+            dirty_albums: Set[str] = set()  # 통계를 다시 집계할 앨범명
+
+            for album_folder in album_folders:
+                for track_file in sorted(album_folder.glob("*.json")):
+                    rel_path = f"{album_folder.name}/{track_file.name}"
+                    old = old_entries.get(rel_path)
+                    try:
+                        st = track_file.stat()
+                    except OSError:
+                        continue  # 스캔 직후 삭제된 파일
+
+                    if old is not None and old.mtime_ns == st.st_mtime_ns and old.size == st.st_size:
+                        entries[rel_path] = old
+                        manifest.append((rel_path, old.mtime_ns, old.size))
+                        unchanged += 1
+                        continue
+
+                    st, track_data, raw, error = _read_track_file(track_file)
+                    entry = _make_entry(album_folder, track_file, st, track_data, raw, self.line_store)
+                    manifest.append((rel_path, entry.mtime_ns, entry.size))
+
+                    if old is not None and old.digest == entry.digest:
+                        entries[rel_path] = old.with_stat(entry.mtime_ns, entry.size)
+                        unchanged += 1
+                        continue
+
+                    if error:
+                        print(error)
+                    entries[rel_path] = entry
+                    if old is None:
+                        added += 1
+                    else:
+                        changed += 1
+                    # 파싱 실패 파일이 계속 실패하는 경우는 청크 목록에 영향 없음
+                    if entry.track is not None:
+                        content_changed = True
+                        dirty_albums.add(entry.track.album)
+                    if old is not None and old.track is not None:
+                        content_changed = True
+                        dirty_albums.add(old.track.album)
+
+            removed = 0
+            for rel_path, old in old_entries.items():
+                if rel_path not in entries:
+                    removed += 1
+                    if old.track is not None:
+                        content_changed = True
+                        dirty_albums.add(old.track.album)
+
+            version = _version_of(manifest)
+            if content_changed:
+                state = self._build_state(len(album_folders), entries, version, previous)
+                if previous.albums is not None:
+                    # 바뀐 트랙이 속한 앨범만 다시 집계
+                    state.albums = _summarize_albums(entries.values(), previous.albums, dirty_albums)
+                # 새 인덱스를 만드는 동안에는 이전 인덱스(이전 청크를 가리킴)로 검색
+                state.search_index = previous.search_index
+            else:
+                # 청크 목록은 그대로 두고 매니페스트와 버전만 갱신
+                state = CatalogState(previous.chunks, previous.albums_count, previous.tracks_count,
+                                     version, entries, previous.snapshot)
+                state.albums = previous.albums
+                state.search_index = previous.search_index
+
+            swapped = state.version != previous.version or content_changed
+            if content_changed and prepare is not None:
+                prepare(state.chunks)
+            self._state = state
+            if swapped:
+                self.reload_count += 1
+
+        if content_changed and state.search_index is not None:
+            # 인덱스 재생성은 카탈로그 전체 크기에 비례하므로 리로드 경로 밖에서 수행
+            self._schedule_search_index(state)
+
+        self.last_reload_duration = time.perf_counter() - start
+        return {
+            'added': added,
+            'changed': changed,
+            'removed': removed,
+            'unchanged': unchanged,
+            'version': state.version,
+            'swapped': swapped,
+            'duration_ms': round(self.last_reload_duration * 1000, 2)
+        }
+
+    def _iter_tracks(self, album_folders: List[Path], workers: Optional[int] = None):
+        """
+        앨범 폴더의 트랙 파일들을 파싱하여 정렬된 순서로 반환
+        workers가 2 이상이면 폴더 목록 조회와 파일 파싱을 스레드 풀에 분산하되,
+        결과는 항상 sorted() 순서 그대로 내보냅니다.
+
+        Args:
+            album_folders: 정렬된 앨범 폴더 목록
+            workers: 병렬 로드 스레드 수 (None이면 공유 executor 또는 self.load_workers,
+                     1 이하면 순차 로드)
+
+        Yields:
+            (앨범 폴더, 트랙 파일, stat, 트랙 데이터 또는 None, 원본 바이트, 오류 메시지 또는 None)
+        """
+        if workers is None:
+            if self.executor is not None:
+                yield from self._map_tracks(self.executor, album_folders)
+                return
+            workers = self.load_workers
+
+        if workers <= 1:
+            for album_folder in album_folders:
+                # 각 앨범 폴더 안의 모든 JSON 파일 찾기
+                for track_file in sorted(album_folder.glob("*.json")):
+                    yield (album_folder, track_file) + _read_track_file(track_file)
+            return
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            yield from self._map_tracks(pool, album_folders)
+
+    @staticmethod
+    def _map_tracks(pool: Executor, album_folders: List[Path]):
+        """스레드 풀에서 폴더 목록 조회와 파일 파싱을 수행하고 입력 순서대로 반환"""
+        track_lists = pool.map(lambda folder: sorted(folder.glob("*.json")), album_folders)
+        targets = [
+            (album_folder, track_file)
+            for album_folder, track_files in zip(album_folders, track_lists)
+            for track_file in track_files
+        ]
+        # map은 입력 순서대로 결과를 돌려주므로 순차 로드와 같은 순서가 유지됨
+        results = pool.map(lambda target: _read_track_file(target[1]), targets)
+        for (album_folder, track_file), result in zip(targets, results):
+            yield (album_folder, track_file) + result
+
+    def get_all_chunks(self) -> Sequence[LyricChunk]:
         """
         모든 가사 청크 반환
 
@@ -80,6 +668,16 @@ class LyricsDatabase:
         """
         return self.all_chunks
 
+    def get_versioned_chunks(self) -> Tuple[str, Sequence[LyricChunk]]:
+        """
+        카탈로그 버전과 청크 목록을 한 번에 반환 (리로드와 겹쳐도 둘이 같은 카탈로그를 가리킴)
+
+        Returns:
+            (카탈로그 버전, 모든 가사 청크)
+        """
+        state = self._state
+        return state.version, state.chunks
+
     def get_chunk_count(self) -> int:
         """
         총 청크 수 반환
@@ -89,31 +687,170 @@ class LyricsDatabase:
         """
         return len(self.all_chunks)
 
+    def _state_entries(self, state: CatalogState) -> Dict[str, TrackEntry]:
+        """상태의 매니페스트 항목 (스냅샷 상태면 트랙 테이블에서 만들어 캐시)"""
+        if state.entries is None:
+            state.entries = self._entries_from_snapshot(state)
+        return state.entries
+
     def get_albums_info(self) -> Dict[str, Dict]:
         """
         앨범별 통계 정보 반환
+        로드 시점(스냅샷이면 첫 조회 시점)에 한 번 집계하고, 리로드 때는 바뀐 앨범만
+        다시 집계하므로 호출 비용은 조회 한 번입니다. 반환값은 공유되므로 수정하지 마세요.
 
         Returns:
-            앨범명을 키로 하는 딕셔너리 (year, chunk_count 포함)
-        """
-        albums = {}
-        for chunk in self.all_chunks:
-            album_name = chunk['album']
-            if album_name not in albums:
-                albums[album_name] = {
-                    'year': chunk['year'],
-                    'chunk_count': 0,
-                    'tracks': set()
-                }
-            albums[album_name]['chunk_count'] += 1
-            albums[album_name]['tracks'].add(chunk['title'])
+            앨범명을 키로 하는 딕셔너리 (year, chunk_count, tracks, track_count 포함)
+        """
+        state = self._state
+        if state.albums is None:
+            state.albums = _summarize_albums(self._state_entries(state).values())
+        return state.albums
 
-        # set을 리스트로 변환
-        for album in albums.values():
-            album['tracks'] = sorted(list(album['tracks']))
-            album['track_count'] = len(album['tracks'])
+    def get_album_info(self, album_name: str) -> Optional[Dict]:
+        """
+        앨범 하나의 통계 정보 반환 (전체 통계가 아직 없으면 해당 앨범만 집계)
+
+        Args:
+            album_name: 앨범명
+
+        Returns:
+            year, chunk_count, tracks, track_count 딕셔너리 또는 None (없는 앨범)
+        """
+        state = self._state
+        if state.albums is not None:
+            return state.albums.get(album_name)
+        entries = self._state_entries(state).values()
+        return _summarize_albums(entries, dirty={album_name}).get(album_name)
+
+    @staticmethod
+    def _build_search_index(state: CatalogState) -> LyricsSearchIndex:
+        index = LyricsSearchIndex(state.chunks)
+        state.search_index = index
+        return index
+
+    def _schedule_search_index(self, state: CatalogState) -> None:
+        """
+        리로드된 상태의 검색 인덱스를 백그라운드에서 재생성
+        리로드가 연달아 와도 작업 스레드는 하나이고, 기다리는 동안 더 새 상태가 오면 이전 상태는 건너뜁니다.
+        """
+        with self._index_lock:
+            self._index_target = state
+            if self._index_worker_running:
+                return
+            self._index_worker_running = True
+        threading.Thread(target=self._search_index_worker, name="search-index", daemon=True).start()
+
+    def _search_index_worker(self) -> None:
+        while True:
+            with self._index_lock:
+                target, self._index_target = self._index_target, None
+                if target is None:
+                    self._index_worker_running = False
+                    return
+            if target.chunks is not self._state.chunks:
+                continue  # 그사이 청크 목록이 바뀐 상태 (그 상태가 다시 예약됨)
+            # 인덱스가 아직 없는 상태면 그동안 들어온 search()는 이 락에서 완성을 기다림
+            with self._search_build_lock:
+                index = target.search_index
+                if index is None or index.chunks is not target.chunks:
+                    index = LyricsSearchIndex(target.chunks)
+                    target.search_index = index
+            # 만드는 동안 내용 변경 없는 리로드가 있었다면 새 상태는 이전 인덱스를 물려받았으므로 같이 교체
+            current = self._state
+            if current.chunks is index.chunks:
+                current.search_index = index
+
+    def start_search_index(self) -> None:
+        """검색 인덱스를 백그라운드 스레드에서 만들기 시작 (이미 있으면 무시, 만드는 동안 search()는 완성을 기다림)"""
+        state = self._state
+        if state.search_index is None:
+            self._schedule_search_index(state)
+
+    def after_fork(self) -> None:
+        """
+        fork로 만든 워커 프로세스에서 호출 (CatalogRegistry.after_fork)
+        부모의 검색 인덱스 작업 스레드는 자식에 복사되지 않으므로 작업 상태와 락을 새로 만들고,
+        미리 만들 카탈로그인데 인덱스가 없으면 자식에서 다시 시작합니다.
+        """
+        self._index_lock = threading.Lock()
+        self._index_target = None
+        self._index_worker_running = False
+        self._search_build_lock = threading.Lock()
+        if self.search_enabled:
+            self.start_search_index()
+
+    def get_search_index(self) -> LyricsSearchIndex:
+        """
+        현재 카탈로그의 검색 인덱스 (없으면 지금 만듦)
+
+        Returns:
+            LyricsSearchIndex 인스턴스
+        """
+        state = self._state
+        if state.search_index is None:
+            with self._search_build_lock:
+                if state.search_index is None:
+                    self._build_search_index(state)
+        return state.search_index
+
+    def search(self, query: str, limit: int = 10, offset: int = 0) -> Tuple[int, List[Tuple[LyricChunk, int]]]:
+        """
+        가사 전문 검색
+
+        Args:
+            query: 검색어 (띄어쓰기 무시, 부분 일치)
+            limit: 한 페이지 결과 수
+            offset: 건너뛸 결과 수
+
+        Returns:
+            (전체 결과 수, [(청크, 점수), ...])
+        """
+        return self.get_search_index().search(query, limit, offset)
+
+    def memory_usage(self) -> Dict[str, int]:
+        """
+        현재 카탈로그의 메모리 사용량 추정치 (sys.getsizeof 합계, 바이트)
+        스냅샷 mmap은 프로세스 힙이 아니라 페이지 캐시에 올라가므로 mapped로 따로 보고하고
+        total에는 넣지 않습니다. 청크 수에 비례하는 비용이므로 요청마다 부르지 마세요.
+
+        Returns:
+            chunks, tracks, search_index, line_cache, mapped, total 딕셔너리
+        """
+        state = self._state
+        seen: Set[int] = set()
+        chunks_size = tracks_size = mapped = 0
+
+        if isinstance(state.chunks, SnapshotChunks):
+            # 스냅샷 청크는 인덱싱할 때만 만들어지므로 디코딩된 트랙만 힙에 남음
+            tracks_size = _track_bytes(state.snapshot.decoded_tracks(), seen)
+        else:
+            chunks_size = sys.getsizeof(state.chunks)
+            tracks = {}
+            for chunk in state.chunks:
+                chunks_size += sys.getsizeof(chunk)
+                text = chunk._text
+                if text is not None and id(text) not in seen:
+                    # 같은 가사 청크는 intern된 문자열 하나를 공유
+                    seen.add(id(text))
+                    chunks_size += sys.getsizeof(text)
+                tracks[id(chunk.track)] = chunk.track
+            tracks_size = _track_bytes(tracks.values(), seen)
+
+        if state.snapshot is not None:
+            mapped = state.snapshot.mapped_bytes
+
+        index_size = state.search_index.memory_bytes() if state.search_index is not None else 0
+        line_cache = self.line_store.memory_bytes() if self.line_store is not None else 0
 
-        return albums
+        return {
+            'chunks': chunks_size,
+            'tracks': tracks_size,
+            'search_index': index_size,
+            'line_cache': line_cache,
+            'mapped': mapped,
+            'total': chunks_size + tracks_size + index_size + line_cache
+        }
 
     def is_empty(self) -> bool:
         """
@@ -124,7 +861,7 @@ class LyricsDatabase:
         """
         return len(self.all_chunks) == 0
 
-    def get_random_chunk(self) -> Optional[Dict]:
+    def get_random_chunk(self) -> Optional[LyricChunk]:
         """
         임의의 청크 하나를 반환 (테스트용)
 
@@ -0,0 +1,165 @@
+"""
+가사 카탈로그 데이터 모델
+트랙 메타데이터는 트랙당 한 번만 저장하고, 청크는 자기 트랙을 가리킵니다.
+"""
+
+import sys
+from typing import Any, Dict, Iterable, Tuple
+
+DEFAULT_ARTIST = '태연 (TAEYEON)'
+
+# 청크 딕셔너리로 읽을 때 트랙에서 가져오는 키
+TRACK_FIELDS = ('title', 'album', 'year', 'track_number', 'artist', 'album_folder')
+CHUNK_KEYS = ('lines',) + TRACK_FIELDS
+
+
+def _intern(value):
+    return sys.intern(value) if type(value) is str else value
+
+
+class TrackInfo:
+    """트랙 메타데이터 (같은 트랙의 모든 청크가 공유)"""
+
+    __slots__ = ('title', 'album', 'year', 'track_number', 'artist', 'album_folder', 'track_file')
+
+    def __init__(self, title: str, album: str, year: int, track_number: int,
+                 artist: str, album_folder: str, track_file: str = ''):
+        # 앨범명/아티스트/폴더명은 여러 트랙에 반복되므로 intern으로 한 객체를 공유
+        self.title = title
+        self.album = _intern(album)
+        self.year = year
+        self.track_number = track_number
+        self.artist = _intern(artist)
+        self.album_folder = _intern(album_folder)
+        self.track_file = track_file
+
+    @classmethod
+    def from_json(cls, track_data: Dict, album_folder: str, track_file: str = '') -> 'TrackInfo':
+        """
+        트랙 JSON 데이터로 TrackInfo 생성
+
+        Args:
+            track_data: 트랙 JSON 딕셔너리
+            album_folder: 앨범 폴더명 (앨범 커버용)
+            track_file: 트랙 파일명
+
+        Returns:
+            TrackInfo 인스턴스
+        """
+        return cls(
+            track_data.get('title', 'Unknown'),
+            track_data.get('album', 'Unknown'),
+            track_data.get('year', 0),
+            track_data.get('track_number', 0),
+            track_data.get('artist', DEFAULT_ARTIST),
+            album_folder,
+            track_file
+        )
+
+
+class LyricChunk:
+    """
+    가사 청크 하나
+    기존 청크 딕셔너리와 같은 방식(chunk['title'], chunk.get('artist'))으로 읽을 수 있습니다.
+
+    라인들은 줄바꿈으로 이어 붙인 문자열 하나로 intern하여 저장합니다.
+    라인마다 str 객체와 리스트를 두는 것보다 청크당 오버헤드가 훨씬 작고,
+    같은 가사 청크(반복되는 후렴 등)는 하나의 문자열을 공유합니다.
+    """
+
+    __slots__ = ('_text', 'track', 'number')
+
+    def __init__(self, lines: Iterable[str], track: TrackInfo, number: int = 0):
+        lines = tuple(lines)
+        if lines and not any('\n' in line for line in lines):
+            self._text = sys.intern('\n'.join(lines))
+        else:
+            # 빈 청크이거나 라인 안에 줄바꿈이 있으면 튜플 그대로 보관
+            self._text = tuple(_intern(line) for line in lines)
+        self.track = track
+        self.number = number
+
+    @property
+    def lines(self) -> Tuple[str, ...]:
+        """가사 라인 튜플"""
+        text = self._text
+        if type(text) is str:
+            return tuple(text.split('\n'))
+        return text
+
+    def __getitem__(self, key: str) -> Any:
+        if key == 'lines':
+            return self.lines
+        if key in TRACK_FIELDS:
+            return getattr(self.track, key)
+        raise KeyError(key)
+
+    def __contains__(self, key: str) -> bool:
+        return key in CHUNK_KEYS
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """딕셔너리 호환 get"""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self) -> Tuple[str, ...]:
+        """딕셔너리 호환 keys"""
+        return CHUNK_KEYS
+
+    @property
+    def stable_id(self) -> str:
+        """
+        카탈로그가 바뀌어도 유지되는 청크 식별자 (앨범 폴더/트랙 파일#청크 번호)
+        청크 목록에서의 위치와 달리 다른 트랙이 추가/삭제되어도 변하지 않습니다.
+        """
+        return f"{self.track.album_folder}/{self.track.track_file}#{self.number}"
+
+    def to_dict(self) -> Dict:
+        """
+        기존 7개 키 청크 딕셔너리로 변환
+
+        Returns:
+            lines, title, album, year, track_number, artist, album_folder 딕셔너리
+        """
+        track = self.track
+        return {
+            'lines': list(self.lines),
+            'title': track.title,
+            'album': track.album,
+            'year': track.year,
+            'track_number': track.track_number,
+            'artist': track.artist,
+            'album_folder': track.album_folder
+        }
+
+    def __repr__(self) -> str:
+        return f"LyricChunk({self.track.album_folder}/{self.track.title} #{self.number})"
+
+
+class LazyLyricChunk(LyricChunk):
+    """
+    가사 라인을 필요할 때만 읽는 청크 (lazy 모드)
+    인덱스에는 트랙과 청크 위치만 두고, lines를 읽는 순간 라인 저장소에서 가져옵니다.
+    """
+
+    __slots__ = ('_store', '_position')
+
+    def __init__(self, store, track: TrackInfo, position: int, number: int = 0):
+        self._text = None
+        self._store = store
+        self._position = position
+        self.track = track
+        self.number = number
+
+    @property
+    def lines(self) -> Tuple[str, ...]:
+        """가사 라인 튜플 (라인 저장소의 LRU 캐시를 거쳐 로드)"""
+        return self._store.get_lines(self.track, self._position)
+
+
+class ChunkList(list):
+    """약한 참조를 걸 수 있는 청크 리스트 (청크 목록별 파생 인덱스 캐시용)"""
+
+    __slots__ = ('__weakref__',)
@@ -0,0 +1,264 @@
+"""
+서비스 메트릭 (Prometheus 텍스트 형식)
+요청 수, 상태 코드, 라우트/주기별 지연 시간 히스토그램을 ASGI 미들웨어에서 기록하고,
+카탈로그 규모나 캐시 적중률처럼 조회 시점에 읽으면 되는 값은 /metrics 요청 때 콜백으로 모읍니다.
+기록은 딕셔너리 조회와 정수 덧셈뿐이라 운영 환경에서 켜 두어도 됩니다.
+"""
+
+import re
+import threading
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from urllib.parse import parse_qsl
+
+# 지연 시간 히스토그램 버킷 (초)
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+# Starlette가 text/ 형식에 charset=utf-8을 붙임
+CONTENT_TYPE = "text/plain; version=0.0.4"
+
+# 라벨 값이 클라이언트 입력에 따라 무한히 늘어나지 않도록 제한
+OTHER_LABEL = "other"
+MAX_INTERVAL_LABELS = 32
+MAX_LABEL_CACHE = 4096
+_INTERVAL_LABEL = re.compile(r"^[1-9][0-9]{0,5}[mhdw]$")
+
+_INF_LABEL = 'le="+Inf"'
+
+Labels = Tuple[Tuple[str, str], ...]
+# 콜백 게이지: () → [(라벨, 값), ...]
+GaugeCallback = Callable[[], Iterable[Tuple[Dict[str, str], float]]]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: Labels, extra: str = "") -> str:
+    parts = [f'{key}="{_escape(value)}"' for key, value in labels]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+
+class Histogram:
+    """라벨 조합별 누적 히스토그램"""
+
+    def __init__(self, name: str, help_text: str, buckets: Sequence[float] = LATENCY_BUCKETS):
+        """
+        Args:
+            name: 메트릭 이름
+            help_text: HELP 설명
+            buckets: 버킷 상한 (오름차순, +Inf는 자동 추가)
+        """
+        self.name = name
+        self.help_text = help_text
+        self.buckets = tuple(buckets)
+        # 라벨 → [버킷별 개수..., +Inf 개수, 합계]
+        self._series: Dict[Labels, List[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, labels: Labels = ()) -> None:
+        """
+        값 하나 기록
+
+        Args:
+            value: 관측값 (지연 시간이면 초)
+            labels: 라벨 튜플 ((이름, 값), ...)
+        """
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [0] * (len(self.buckets) + 2)
+            series[bisect_left(self.buckets, value)] += 1
+            series[-1] += value
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            snapshot = [(labels, list(series)) for labels, series in self._series.items()]
+        for labels, series in sorted(snapshot):
+            cumulative = 0
+            for bound, count in zip(self.buckets, series):
+                cumulative += count
+                le_label = 'le="%s"' % bound
+                lines.append(f"{self.name}_bucket{_format_labels(labels, le_label)} {cumulative}")
+            cumulative += series[len(self.buckets)]
+            lines.append(f"{self.name}_bucket{_format_labels(labels, _INF_LABEL)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(labels)} {_format_value(series[-1])}")
+            lines.append(f"{self.name}_count{_format_labels(labels)} {cumulative}")
+        return lines
+
+
+class Counter:
+    """라벨 조합별 누적 카운터"""
+
+    def __init__(self, name: str, help_text: str):
+        """
+        Args:
+            name: 메트릭 이름 (_total로 끝나도록)
+            help_text: HELP 설명
+        """
+        self.name = name
+        self.help_text = help_text
+        self._series: Dict[Labels, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, labels: Labels = (), amount: float = 1) -> None:
+        """카운터 증가"""
+        with self._lock:
+            self._series[labels] = self._series.get(labels, 0) + amount
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            snapshot = sorted(self._series.items())
+        lines.extend(f"{self.name}{_format_labels(labels)} {_format_value(value)}" for labels, value in snapshot)
+        return lines
+
+
+class MetricsRegistry:
+    """카운터, 히스토그램, 콜백 게이지 모음"""
+
+    def __init__(self, prefix: str = "daily_lyrics"):
+        """
+        Args:
+            prefix: 모든 메트릭 이름 앞에 붙일 접두어
+        """
+        self.prefix = prefix
+        self._metrics: Dict[str, object] = {}
+        self._gauges: List[Tuple[str, str, str, GaugeCallback]] = []
+
+    def counter(self, name: str, help_text: str) -> Counter:
+        """카운터 생성 (같은 이름이면 기존 카운터 반환)"""
+        name = f"{self.prefix}_{name}"
+        if name not in self._metrics:
+            self._metrics[name] = Counter(name, help_text)
+        return self._metrics[name]
+
+    def histogram(self, name: str, help_text: str, buckets: Sequence[float] = LATENCY_BUCKETS) -> Histogram:
+        """히스토그램 생성 (같은 이름이면 기존 히스토그램 반환)"""
+        name = f"{self.prefix}_{name}"
+        if name not in self._metrics:
+            self._metrics[name] = Histogram(name, help_text, buckets)
+        return self._metrics[name]
+
+    def gauge(self, name: str, help_text: str, callback: GaugeCallback, metric_type: str = "gauge") -> None:
+        """
+        /metrics 요청 때 값을 읽는 게이지 등록
+
+        Args:
+            name: 메트릭 이름
+            help_text: HELP 설명
+            callback: [(라벨 딕셔너리, 값), ...]을 반환하는 함수
+            metric_type: gauge 또는 counter (이미 다른 곳에서 세고 있는 누적값을 노출할 때)
+        """
+        self._gauges.append((f"{self.prefix}_{name}", help_text, metric_type, callback))
+
+    def render(self) -> str:
+        """
+        Prometheus 텍스트 형식 (0.0.4)
+
+        Returns:
+            /metrics 응답 본문
+        """
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        for name, help_text, metric_type, callback in self._gauges:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {metric_type}")
+            for labels, value in callback():
+                lines.append(f"{name}{_format_labels(tuple(labels.items()))} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+class MetricsMiddleware:
+    """
+    요청 수와 응답 헤더를 보내기까지의 시간을 라우트/주기/상태 코드별로 기록하는 ASGI 미들웨어
+    라우트 라벨은 경로 템플릿(/covers/{filename})을 쓰고, 라우트에 맞지 않는 요청은 other로 묶습니다.
+    스트리밍 응답(/stream)도 헤더를 보낸 시점까지만 재므로 연결 시간이 섞이지 않습니다.
+    """
+
+    def __init__(self, app, metrics: MetricsRegistry):
+        """
+        Args:
+            app: 감쌀 ASGI 앱
+            metrics: 기록할 레지스트리
+        """
+        self.app = app
+        self.requests = metrics.counter("http_requests_total", "HTTP 요청 수 (라우트, 주기, 상태 코드별)")
+        self.latency = metrics.histogram(
+            "http_request_duration_seconds", "응답 헤더를 보내기까지 걸린 시간 (초, 라우트와 주기별)"
+        )
+        self._route_paths: Dict[object, str] = {}
+        self._intervals: set = set()
+        # (endpoint, 쿼리 문자열) → 라벨 (위젯 요청은 쿼리가 몇 가지뿐이라 대부분 여기서 끝남)
+        self._labels: Dict[Tuple[object, bytes], Labels] = {}
+
+    def _route_label(self, scope) -> str:
+        endpoint = scope.get("endpoint")
+        if endpoint is None:
+            return OTHER_LABEL
+        path = self._route_paths.get(endpoint)
+        if path is None:
+            # 라우터가 scope에 남긴 endpoint로 경로 템플릿 찾기 (엔드포인트마다 한 번)
+            router = scope.get("router")
+            for route in getattr(router, "routes", ()):
+                if getattr(route, "endpoint", None) is endpoint:
+                    path = route.path
+                    break
+            path = self._route_paths[endpoint] = path or OTHER_LABEL
+        return path
+
+    def _interval_label(self, query_string: bytes) -> str:
+        if b"interval=" not in query_string:
+            return ""
+        for key, value in parse_qsl(query_string.decode("latin-1")):
+            if key == "interval":
+                if value in self._intervals:
+                    return value
+                if _INTERVAL_LABEL.match(value) and len(self._intervals) < MAX_INTERVAL_LABELS:
+                    self._intervals.add(value)
+                    return value
+                return OTHER_LABEL
+        return ""
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status = 500
+        elapsed: Optional[float] = None
+
+        async def send_wrapper(message):
+            nonlocal status, elapsed
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                elapsed = time.perf_counter() - start
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            if elapsed is None:
+                elapsed = time.perf_counter() - start
+            key = (scope.get("endpoint"), scope.get("query_string", b""))
+            labels = self._labels.get(key)
+            if labels is None:
+                if len(self._labels) >= MAX_LABEL_CACHE:
+                    self._labels.clear()
+                labels = self._labels[key] = (
+                    ("route", self._route_label(scope)), ("interval", self._interval_label(key[1]))
+                )
+            self.latency.observe(elapsed, labels)
+            self.requests.inc(labels + (("status", str(status)),))
@@ -0,0 +1,175 @@
+"""
+멀티 워커 실행 (pre-fork)
+uvicorn --workers N은 워커마다 새 인터프리터를 띄워(spawn) 워커마다 카탈로그를 따로 로드합니다.
+이 모듈은 부모 프로세스에서 카탈로그를 한 번 로드하고 gc.freeze()로 GC 대상에서 뺀 뒤 워커를 fork하므로,
+워커들이 카탈로그가 올라간 메모리 페이지를 copy-on-write로 공유합니다.
+(GC가 객체 헤더를 건드려 페이지가 복사되는 일을 막고, 스냅샷 mmap은 원래 페이지 캐시를 공유합니다.)
+
+사용법:
+    python3 -m src.prefork --workers 4 --host 0.0.0.0 --port 58384
+
+fork를 쓰므로 Linux/macOS 전용입니다. 카탈로그 리로드는 요청을 받은 워커에만 적용되므로
+멀티 워커에서는 DAILY_LYRICS_WATCH_INTERVAL로 워커마다 변경을 감시하세요.
+"""
+
+import argparse
+import gc
+import logging
+import os
+import signal
+import socket
+import sys
+import time
+from datetime import datetime
+from typing import Dict
+
+logger = logging.getLogger("src.prefork")
+
+# 워커가 이 시간(초) 안에 죽으면 다시 띄우기 전에 기다림 (시작하자마자 죽는 워커가 무한 재시작하지 않도록)
+MIN_WORKER_LIFETIME = 1.0
+
+
+def bind_socket(host: str, port: int, backlog: int = 2048) -> socket.socket:
+    """
+    워커들이 함께 accept할 리슨 소켓
+
+    Args:
+        host: 바인드 주소
+        port: 포트
+        backlog: listen 대기열 길이
+
+    Returns:
+        리슨 중인 소켓
+    """
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    sock.set_inheritable(True)
+    return sock
+
+
+def prepare_shared_state(widget_service) -> None:
+    """
+    fork 전에 부모에서 워커들이 공유할 상태를 만들어 둠
+    카탈로그와 선택 알고리즘의 파생 데이터(해시 링, 가중치 별칭 테이블)는 main()의 catalog_warmup.run()에서 만들어져 있고,
+    여기서는 기본 주기의 응답 캐시를 채운 뒤 지금까지 만든 객체를 모두 GC의 영구 세대로 옮깁니다.
+    """
+    registry = widget_service.registry
+    for name, catalog_db in registry.items():
+        if catalog_db.is_empty():
+            continue
+        widget_service.lyric_cache.get_entry(name, catalog_db, "24h", datetime.now(),
+                                             widget_service.SELECTION_ALGORITHM, registry.weights_for(name))
+        if catalog_db.search_enabled:
+            # 준비 완료 후 백그라운드에서 만들기 시작한 검색 인덱스를 기다림 (스레드는 fork로 복사되지 않으므로
+            # 여기서 끝내 두어야 워커가 인덱스를 공유함)
+            catalog_db.get_search_index()
+
+    gc.collect()
+    gc.freeze()
+
+
+def run_worker(sock: socket.socket, config) -> None:
+    """fork한 자식에서 uvicorn 서버 실행 (종료할 때까지 반환하지 않음)"""
+    import uvicorn
+
+    from src import widget_service
+
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    widget_service.registry.after_fork()
+    uvicorn.Server(config).run(sockets=[sock])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='카탈로그를 공유하는 멀티 워커 위젯 서비스')
+    parser.add_argument('--host', default='0.0.0.0')
+    parser.add_argument('--port', type=int, default=58384)
+    parser.add_argument('--workers', type=int, default=int(os.environ.get('WEB_CONCURRENCY', os.cpu_count() or 1)),
+                        help='워커 프로세스 수 (기본: WEB_CONCURRENCY 또는 CPU 수)')
+    parser.add_argument('--loop', default='asyncio')
+    parser.add_argument('--http', default='h11')
+    parser.add_argument('--log-level', default='info')
+    parser.add_argument('--timeout-keep-alive', type=int, default=5)
+    args = parser.parse_args()
+
+    if not hasattr(os, 'fork'):
+        print("이 플랫폼은 fork를 지원하지 않습니다. uvicorn --workers를 사용하세요.", file=sys.stderr)
+        return 1
+
+    import uvicorn
+
+    # 카탈로그 로드, 부모에서 한 번만
+    # (단일 프로세스는 포트를 먼저 열고 백그라운드에서 로드하지만, 여기서는 fork 전에 끝내야 워커가 공유하므로
+    #  로드 중에는 포트를 열지 않음. 워커의 시작 이벤트는 이미 준비된 상태를 보고 다시 로드하지 않음)
+    from src import widget_service
+    if not widget_service.catalog_warmup.run():
+        print(f"카탈로그 로드 실패: {widget_service.catalog_warmup.error}", file=sys.stderr)
+        return 1
+
+    # uvicorn 설정 로드(이벤트 루프, HTTP 프로토콜 모듈 import)도 부모에서 해 두어 워커가 공유
+    config = uvicorn.Config(
+        widget_service.app,
+        loop=args.loop,
+        http=args.http,
+        log_level=args.log_level,
+        timeout_keep_alive=args.timeout_keep_alive,
+        access_log=False  # 접근 로그는 AccessLogMiddleware가 샘플링해서 남김
+    )
+    config.load()
+    prepare_shared_state(widget_service)
+    sock = bind_socket(args.host, args.port)
+    logger.info(f"pre-fork: {args.workers}개 워커, http://{args.host}:{args.port} (부모 pid {os.getpid()})")
+
+    workers: Dict[int, float] = {}  # pid → 시작 시각
+    stopping = False
+
+    def spawn() -> None:
+        pid = os.fork()
+        if pid == 0:
+            try:
+                run_worker(sock, config)
+            except BaseException:
+                logger.exception("워커 오류")
+                os._exit(1)
+            os._exit(0)
+        workers[pid] = time.monotonic()
+
+    def stop(signum, frame) -> None:
+        nonlocal stopping
+        stopping = True
+        for pid in list(workers):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    for _ in range(max(1, args.workers)):
+        spawn()
+
+    while workers:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        started = workers.pop(pid, None)
+        if started is None or stopping:
+            continue
+
+        logger.warning(f"워커 종료 (pid {pid}, 상태 {status}), 다시 시작합니다")
+        if time.monotonic() - started < MIN_WORKER_LIFETIME:
+            time.sleep(MIN_WORKER_LIFETIME)
+        spawn()
+
+    sock.close()
+    logger.info("pre-fork: 모든 워커 종료")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
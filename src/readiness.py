@@ -0,0 +1,143 @@
+"""
+시작 시 카탈로그 백그라운드 로드와 준비 상태
+서버는 포트를 먼저 열고 카탈로그(스냅샷 포함)는 시작 후 별도 스레드에서 로드합니다.
+준비 완료는 카탈로그 로드와 on_ready(선택용 파생 데이터 생성 등)까지를 뜻하고,
+요청 처리에 없어도 되는 작업(검색 인덱스 등)은 after_ready로 준비 완료 뒤에 시작합니다.
+로드가 끝나기 전에는 ReadinessGate가 가사 엔드포인트에 503과 Retry-After를 바로 돌려주고,
+/livez(프로세스가 응답하는지)와 /readyz(가사를 제공할 수 있는지)로 상태를 나눠 확인합니다.
+"""
+
+import json
+import logging
+import threading
+import time
+from typing import Callable, Dict, Iterable, Optional
+
+from src.catalog_registry import CatalogRegistry
+
+logger = logging.getLogger(__name__)
+
+
+class CatalogWarmup:
+    """CatalogRegistry.load_pending()을 한 번 실행하고 결과를 기록"""
+
+    def __init__(self, registry: CatalogRegistry, on_ready: Optional[Callable[[], None]] = None,
+                 after_ready: Optional[Callable[[], None]] = None):
+        """
+        Args:
+            registry: 카탈로그를 등록만 해 둔 레지스트리 (defer=True 또는 add())
+            on_ready: 로드가 끝난 뒤 준비 완료 전에 로드한 스레드에서 호출할 함수
+                      (첫 요청이 기다리지 않도록 미리 만들 것, 실패하면 준비 실패)
+            after_ready: 준비 완료 직후 호출할 함수 (백그라운드 작업 시작 등, 오래 걸리면 안 됨)
+        """
+        self.registry = registry
+        self.on_ready = on_ready
+        self.after_ready = after_ready
+        self.created_at = time.monotonic()
+        self.ready = False  # 요청마다 읽으므로 속성 하나로 둠
+        self.duration: Optional[float] = None  # 생성부터 준비 완료까지 (초)
+        self.error: Optional[str] = None
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def state(self) -> str:
+        """loading, ready, failed 중 하나"""
+        if self.ready:
+            return "ready"
+        return "failed" if self.error is not None else "loading"
+
+    def run(self) -> bool:
+        """
+        등록된 카탈로그를 지금 스레드에서 로드 (이미 준비됐으면 바로 반환)
+        src.prefork는 fork 전에 부모에서 이 함수를 직접 호출합니다.
+
+        Returns:
+            준비 완료 여부 (로드 실패 시 False, 원인은 error)
+        """
+        with self._lock:
+            if self.ready:
+                return True
+            self.error = None
+            try:
+                self.registry.load_pending()
+                if self.on_ready is not None:
+                    self.on_ready()
+            except Exception as e:
+                self.error = f"{type(e).__name__}: {e}"
+                logger.error(f"카탈로그 로드 실패: {self.error}", exc_info=True)
+                return False
+            self.duration = time.monotonic() - self.created_at
+            self.ready = True
+            if self.after_ready is not None:
+                try:
+                    self.after_ready()
+                except Exception as e:
+                    logger.error(f"준비 완료 후 작업 실패: {type(e).__name__}: {e}", exc_info=True)
+            return True
+
+    def start(self) -> None:
+        """백그라운드 스레드에서 run() (이미 준비됐거나 로드 중이면 무시)"""
+        if self.ready or (self._thread is not None and self._thread.is_alive()):
+            return
+        self._thread = threading.Thread(target=self.run, name="catalog-warmup", daemon=True)
+        self._thread.start()
+
+    def status(self) -> Dict:
+        """
+        /readyz 응답 본문
+
+        Returns:
+            상태, 로드한/남은 카탈로그, 준비까지 걸린 시간, 실패 원인
+        """
+        return {
+            "status": self.state,
+            "catalogs": list(self.registry),
+            "pending": self.registry.pending,
+            "startup_ms": round(self.duration * 1000, 1) if self.duration is not None else None,
+            "error": self.error
+        }
+
+
+class ReadinessGate:
+    """
+    카탈로그가 준비되기 전 요청에 503을 바로 돌려주는 ASGI 미들웨어
+    라우팅, 검증, 직렬화를 거치지 않으므로 로드 중에도 응답이 빠르고, 준비된 뒤에는 속성 하나만 확인합니다.
+    """
+
+    def __init__(self, app, warmup: CatalogWarmup, open_paths: Iterable[str] = (), retry_after: int = 2):
+        """
+        Args:
+            app: 감쌀 ASGI 앱
+            warmup: 준비 상태
+            open_paths: 준비 전에도 통과시킬 라우트 (첫 경로 단위, 예: /livez, /covers)
+            retry_after: 503 응답의 Retry-After (초)
+        """
+        self.app = app
+        self.warmup = warmup
+        self.open_paths = frozenset(open_paths)
+        self.retry_after = retry_after
+        self._loading_body = json.dumps(
+            {"success": False, "error": "Catalog is loading", "retry_after": retry_after}
+        ).encode("utf-8")
+
+    async def __call__(self, scope, receive, send):
+        if self.warmup.ready or scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path = scope.get("path", "/")
+        route = "/" + path.split("/", 2)[1] if path.startswith("/") else path
+        if route in self.open_paths:
+            await self.app(scope, receive, send)
+            return
+
+        headers = [(b"content-type", b"application/json"), (b"cache-control", b"no-store")]
+        if self.warmup.error is None:
+            body = self._loading_body
+            headers.append((b"retry-after", str(self.retry_after).encode("latin-1")))
+        else:
+            body = json.dumps({"success": False, "error": f"Catalog load failed: {self.warmup.error}"}).encode("utf-8")
+        headers.append((b"content-length", str(len(body)).encode("latin-1")))
+        await send({"type": "http.response.start", "status": 503, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
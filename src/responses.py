@@ -0,0 +1,103 @@
+"""
+미리 직렬화한 가사 응답
+가사 응답 본문은 청크마다 한 번만 직렬화해 두고, 요청마다 달라지는 timestamp만 바이트 사이에 끼워 넣습니다.
+orjson이 설치되어 있으면 직렬화에 사용합니다 (pip install orjson).
+"""
+
+import json
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict
+
+try:
+    import orjson
+except ImportError:  # orjson은 선택 의존성 (없으면 표준 json)
+    orjson = None
+
+JSON_MEDIA_TYPE = "application/json"
+
+# 직렬화 후 timestamp 자리를 찾기 위한 표식 (가사에 나올 수 없는 제어 문자 포함)
+_TIMESTAMP_MARK = "\x00timestamp\x00"
+
+
+def dumps(obj) -> bytes:
+    """
+    FastAPI JSONResponse와 같은 형식(ensure_ascii=False, 공백 없음)의 UTF-8 JSON
+
+    Args:
+        obj: 직렬화할 객체
+
+    Returns:
+        JSON 바이트
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+
+class PreparedLyric:
+    """timestamp 자리만 비워 두고 미리 직렬화한 {"success": true, "data": {...}} 응답"""
+
+    __slots__ = ('title', 'head', 'tail')
+
+    def __init__(self, data: Dict):
+        """
+        Args:
+            data: 응답 data 딕셔너리 (timestamp 값은 무시하고 render에서 채움)
+        """
+        body = dumps({"success": True, "data": {**data, "timestamp": _TIMESTAMP_MARK}})
+        self.head, _, self.tail = body.partition(dumps(_TIMESTAMP_MARK))
+        self.title = data['title']
+
+    def render(self, timestamp: str) -> bytes:
+        """
+        timestamp를 끼워 넣은 응답 본문
+
+        Args:
+            timestamp: ISO 8601 시각 문자열 (이스케이프가 필요 없는 ASCII)
+
+        Returns:
+            JSON 바이트
+        """
+        return b'"'.join((self.head, timestamp.encode('ascii'), self.tail))
+
+
+class PreparedCache:
+    """
+    청크 번호 → PreparedLyric 캐시 (/random-lyric 용)
+    최대 개수를 넘으면 가장 먼저 넣은 항목부터 지웁니다 (lazy 모드에서 모든 가사를 붙잡지 않도록).
+    """
+
+    def __init__(self, max_entries: int = 4096):
+        """
+        Args:
+            max_entries: 보관할 최대 응답 수
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[int, PreparedLyric]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, index: int, build: Callable[[], PreparedLyric]) -> PreparedLyric:
+        """
+        캐시된 응답 반환 (없으면 build로 만들어 저장)
+
+        Args:
+            index: 청크 번호
+            build: 응답 생성 함수
+
+        Returns:
+            PreparedLyric
+        """
+        prepared = self._entries.get(index)
+        if prepared is not None:
+            return prepared
+
+        prepared = build()
+        with self._lock:
+            self._entries[index] = prepared
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return prepared
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,141 @@
+"""
+가사 일정 일괄 계산
+날짜 범위와 시간 주기의 모든 블록에 대해 선택될 청크 번호를 한 번에 계산합니다.
+결과는 블록마다 딕셔너리를 만드는 대신 청크 번호 배열 하나로 보관합니다.
+"""
+
+from datetime import date, datetime, time, timedelta
+from typing import Iterator, Optional, Sequence, Tuple
+
+from src.daily_selector import get_block_number, get_block_start, parse_interval
+from src.selection import DEFAULT_ALGORITHM, ConsistentHashRing, np, rotation_indices, select_indices
+from src.weights import AliasTable
+
+
+class LyricSchedule:
+    """
+    연속된 시간 블록별 청크 번호
+    i번째 블록은 first_start부터 i × 블록 길이만큼 뒤에 시작합니다.
+    """
+
+    __slots__ = ('first_start', 'interval', 'block_seconds', 'indices')
+
+    def __init__(self, first_start: datetime, interval: str, indices):
+        """
+        Args:
+            first_start: 첫 블록의 시작 시각
+            interval: 시간 주기 (예: 15m, 3h, 24h, 1w)
+            indices: 블록별 청크 번호 배열 (NumPy uint32 배열 또는 array('I'))
+        """
+        self.first_start = first_start
+        self.interval = interval
+        self.block_seconds = parse_interval(interval).seconds
+        self.indices = indices
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    def block_start(self, block: int) -> datetime:
+        """
+        블록의 시작 시각
+
+        Args:
+            block: 블록 번호 (0부터)
+
+        Returns:
+            블록 시작 datetime
+        """
+        return self.first_start + timedelta(seconds=block * self.block_seconds)
+
+    def iter_lyrics(self, all_chunks: Sequence) -> Iterator[Tuple[datetime, object]]:
+        """
+        (블록 시작 시각, 청크)를 차례로 반환 (미리보기/내보내기 용)
+
+        Args:
+            all_chunks: 일정을 계산할 때 사용한 청크 목록
+
+        Yields:
+            (블록 시작 datetime, 청크)
+        """
+        for block, index in enumerate(self.indices):
+            yield self.block_start(block), all_chunks[int(index)]
+
+
+def _date_numbers(start_date: date, end_date: date) -> list:
+    """날짜 범위의 YYYYMMDD 정수 목록"""
+    first, last = start_date.toordinal(), end_date.toordinal()
+    numbers = []
+    for ordinal in range(first, last + 1):
+        d = date.fromordinal(ordinal)
+        numbers.append(d.year * 10000 + d.month * 100 + d.day)
+    return numbers
+
+
+def compute_schedule(chunk_count: int,
+                     start_date: date,
+                     end_date: date,
+                     interval: str = "24h",
+                     algorithm: str = DEFAULT_ALGORITHM,
+                     use_numpy: bool = True,
+                     ring: Optional[ConsistentHashRing] = None,
+                     alias_table: Optional[AliasTable] = None) -> Optional[LyricSchedule]:
+    """
+    날짜 범위(양 끝 포함)에 걸친 모든 시간 블록에 대해 get_interval_lyric과 같은 청크 번호 계산
+    start_date 0시가 속한 블록부터 end_date 23:59가 속한 블록까지 계산합니다.
+
+    Args:
+        chunk_count: 카탈로그 청크 수
+        start_date: 시작 날짜
+        end_date: 종료 날짜
+        interval: 시간 주기 (예: 15m, 3h, 24h, 1w)
+        algorithm: 선택 알고리즘 (legacy, hash, consistent, rotation)
+        use_numpy: NumPy가 설치되어 있으면 배열 연산으로 계산
+        ring: consistent 알고리즘에 쓸 청크 목록의 해시 링 (get_hash_ring(all_chunks))
+        alias_table: 가중치 선택에 쓸 별칭 테이블 (get_alias_table(all_chunks, weights),
+                     legacy/hash만 지원)
+
+    Returns:
+        LyricSchedule 또는 None (청크가 없는 경우)
+
+    Raises:
+        ValueError: 지원하지 않는 시간 주기, 또는 consistent인데 ring이 없는 경우
+    """
+    spec = parse_interval(interval)
+    if algorithm == "consistent" and ring is None:
+        raise ValueError("consistent 알고리즘에는 해시 링(ring)이 필요합니다")
+    if chunk_count <= 0:
+        return None
+
+    first_moment = datetime.combine(start_date, time.min)
+    first = get_block_number(first_moment, interval)
+    last = get_block_number(datetime.combine(end_date, time.max), interval)
+    first_start = get_block_start(first_moment, interval)
+
+    if algorithm == "rotation":
+        # 기준 시각부터 센 연속 블록 번호 (get_block_number와 같음)
+        return LyricSchedule(first_start, interval,
+                             rotation_indices(range(first, last + 1), chunk_count, use_numpy))
+
+    if spec.legacy_hours is not None:
+        # 기존 주기: 시드 = YYYYMMDD * 100 + 하루 안의 블록 번호 (get_interval_seed와 같음)
+        blocks_per_day = 24 // spec.legacy_hours
+        date_numbers = _date_numbers(start_date, end_date)
+        if use_numpy and np is not None:
+            seeds = (np.asarray(date_numbers, dtype=np.int64)[:, None] * 100
+                     + np.arange(blocks_per_day, dtype=np.int64)).ravel()
+        else:
+            seeds = [number * 100 + block for number in date_numbers for block in range(blocks_per_day)]
+    else:
+        # 그 외 주기: 시드 = 블록 길이(초) << 32 + 블록 번호
+        base = spec.seconds << 32
+        if use_numpy and np is not None:
+            seeds = np.arange(base + first, base + last + 1, dtype=np.int64)
+        else:
+            seeds = range(base + first, base + last + 1)
+
+    if alias_table is not None:
+        return LyricSchedule(first_start, interval, alias_table.sample_many(seeds, algorithm, use_numpy))
+    if algorithm == "consistent":
+        return LyricSchedule(first_start, interval, ring.lookup_many(seeds))
+    return LyricSchedule(first_start, interval,
+                         select_indices(seeds, chunk_count, algorithm, use_numpy))
@@ -0,0 +1,139 @@
+"""
+가사 전문 검색 인덱스
+문자 n-gram(1-gram, 2-gram) 역색인으로 띄어쓰기가 없는 한국어 가사도 부분 일치로 찾습니다.
+인덱스에는 역색인만 두고, 후보 청크의 원문 확인은 청크 라인을 다시 읽어 정규화합니다
+(정규화된 원문 사본을 들고 있으면 인덱스가 카탈로그보다 커지고, lazy/스냅샷 카탈로그의 이점이 사라짐).
+"""
+
+import sys
+import unicodedata
+from array import array
+from collections import Counter
+from typing import Dict, List, Sequence, Tuple
+
+from src.lyrics_models import LyricChunk
+
+
+_POSTING_TUPLE_SIZE = sys.getsizeof((None, None))
+
+
+def normalize_text(text: str) -> str:
+    """
+    검색용 정규화 (NFKC, 소문자, 공백 제거)
+
+    Args:
+        text: 원본 문자열
+
+    Returns:
+        정규화된 문자열
+    """
+    return "".join(unicodedata.normalize('NFKC', text).lower().split())
+
+
+def chunk_search_text(chunk: LyricChunk) -> str:
+    """청크 라인을 정규화해 이은 검색 대상 문자열 (라인 경계는 \\n으로 남겨 다른 라인끼리 이어진 검색어는 매치되지 않음)"""
+    return "\n".join(normalize_text(line) for line in chunk.lines)
+
+
+def _gram_counts(text: str) -> Counter:
+    """텍스트의 1-gram + 2-gram 출현 횟수 (라인 경계 \\n을 포함한 gram 제외)"""
+    counts = Counter(text)
+    counts.update(text[i:i + 2] for i in range(len(text) - 1))
+    return counts
+
+
+class LyricsSearchIndex:
+    """
+    청크 목록 하나에 대한 n-gram 역색인 (만든 뒤에는 읽기 전용)
+    gram마다 청크 번호 배열과 같은 길이의 출현 횟수 배열을 둡니다.
+    """
+
+    def __init__(self, chunks: Sequence[LyricChunk]):
+        """
+        Args:
+            chunks: 색인할 청크 목록 (인덱스가 이 목록을 붙잡고 결과로 돌려줌)
+        """
+        self.chunks = chunks
+        self._postings: Dict[str, Tuple[array, array]] = {}
+
+        postings = self._postings
+        for chunk_index, chunk in enumerate(chunks):
+            text = chunk_search_text(chunk)
+            for gram, count in _gram_counts(text).items():
+                if '\n' in gram:
+                    continue
+                posting = postings.get(gram)
+                if posting is None:
+                    posting = postings[gram] = (array('I'), array('H'))
+                posting[0].append(chunk_index)
+                posting[1].append(min(count, 0xFFFF))
+
+    def __len__(self) -> int:
+        return len(self.chunks)
+
+    def memory_bytes(self) -> int:
+        """
+        인덱스가 차지하는 메모리 추정치 (sys.getsizeof 합계)
+
+        Returns:
+            바이트 수
+        """
+        size = sys.getsizeof(self._postings)
+        for gram, (ids, counts) in self._postings.items():
+            size += sys.getsizeof(gram) + sys.getsizeof(ids) + sys.getsizeof(counts) + _POSTING_TUPLE_SIZE
+        return size
+
+    def search(self, query: str, limit: int = 10, offset: int = 0) -> Tuple[int, List[Tuple[LyricChunk, int]]]:
+        """
+        검색어가 포함된 청크를 점수순으로 반환
+        점수는 청크 가사 안에서 검색어가 나온 횟수이고, 점수가 같으면 카탈로그 순서를 따릅니다.
+
+        Args:
+            query: 검색어 (공백은 무시)
+            limit: 한 페이지 결과 수
+            offset: 건너뛸 결과 수
+
+        Returns:
+            (전체 결과 수, [(청크, 점수), ...])
+        """
+        q = normalize_text(query)
+        if not q:
+            return 0, []
+
+        if len(q) <= 2:
+            # 검색어 자체가 gram이면 역색인이 곧 정답 (출현 횟수도 색인에 있음)
+            posting = self._postings.get(q)
+            if posting is None:
+                return 0, []
+            ids, counts = posting
+            # 안정 정렬이므로 점수가 같으면 청크 번호 오름차순이 유지됨
+            order = sorted(range(len(ids)), key=counts.__getitem__, reverse=True)
+            page = order[offset:offset + limit] if limit > 0 else []
+            return len(ids), [(self.chunks[ids[i]], counts[i]) for i in page]
+
+        postings = []
+        for gram in {q[i:i + 2] for i in range(len(q) - 1)}:
+            posting = self._postings.get(gram)
+            if posting is None:
+                return 0, []
+            postings.append(posting[0])
+        postings.sort(key=len)
+
+        # 가장 짧은 목록에서 시작해 나머지와 교집합 (C 레벨 집합 연산)
+        candidates = set(postings[0])
+        for ids in postings[1:]:
+            candidates.intersection_update(ids)
+            if not candidates:
+                return 0, []
+
+        # n-gram이 모두 있어도 이어져 있는지는 원문으로 확인 (교집합을 통과한 후보만 라인을 읽음)
+        chunks = self.chunks
+        scored = []
+        for chunk_index in sorted(candidates):
+            count = chunk_search_text(chunks[chunk_index]).count(q)
+            if count:
+                scored.append((chunk_index, count))
+        scored.sort(key=lambda item: item[1], reverse=True)
+
+        page = scored[offset:offset + limit] if limit > 0 else []
+        return len(scored), [(self.chunks[chunk_index], count) for chunk_index, count in page]
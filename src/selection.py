@@ -0,0 +1,432 @@
+"""
+시드 → 청크 번호 선택 엔진
+(시드, 카탈로그 크기)를 청크 번호로 바꾸는 순수 함수들입니다.
+공유 상태가 없으므로 여러 스레드에서 동시에 호출해도 안전합니다.
+
+알고리즘:
+    legacy:     기존 random.seed(seed) + random.choice와 같은 결과
+                (전역 난수 생성기 대신 요청마다 독립된 random.Random 사용)
+    hash:       splitmix64 해시 한 번 + 곱셈 축소 (정수 연산 몇 번, 객체 할당 없음)
+    consistent: 청크 안정 ID 위의 해시 링 (트랙을 추가/삭제해도 그 몫의 블록만 바뀜)
+    rotation:   블록 번호를 청크 수 크기의 의사 난수 순열로 대응 (한 주기 안에서 반복 없음)
+"""
+
+import random
+import threading
+import weakref
+from array import array
+from bisect import bisect_left
+from concurrent.futures import Future
+from hashlib import blake2b
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Literal, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy는 선택 의존성 (없으면 순수 파이썬으로 계산)
+    np = None
+
+SelectionAlgorithm = Literal["legacy", "hash", "consistent", "rotation"]
+
+ALGORITHMS = ("legacy", "hash", "consistent", "rotation")
+
+# 시드와 청크 수만으로 고를 수 있는 알고리즘
+# (consistent는 청크 ID, rotation은 시드 대신 연속된 블록 번호가 필요)
+INDEX_ALGORITHMS = ("legacy", "hash")
+
+# rotation 순열의 Feistel 라운드 수와 키 (키를 바꾸면 모든 순열이 바뀜)
+ROTATION_ROUNDS = 4
+ROTATION_KEY = 0x4461696C794C7972
+
+# 해시 링에서 청크 하나가 차지하는 점 수 (많을수록 청크별 선택 확률이 고르지만 메모리가 늘어남)
+DEFAULT_RING_REPLICAS = 16
+
+# 기존 선택 결과를 유지하도록 기본값은 legacy
+DEFAULT_ALGORITHM = "legacy"
+
+_MASK64 = (1 << 64) - 1
+_MASK32 = (1 << 32) - 1
+
+
+def splitmix64(value: int) -> int:
+    """
+    splitmix64 마무리 함수 (64비트 정수 → 고르게 섞인 64비트 정수)
+
+    Args:
+        value: 입력 정수 (하위 64비트만 사용)
+
+    Returns:
+        0 이상 2^64 미만 정수
+    """
+    z = (value + 0x9E3779B97F4A7C15) & _MASK64
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return z ^ (z >> 31)
+
+
+def hash_index(seed: int, size: int) -> int:
+    """
+    카운터 기반 해시로 청크 번호 선택
+
+    Args:
+        seed: 시드 (예: 2025120405)
+        size: 청크 수 (1 이상)
+
+    Returns:
+        0 이상 size 미만 번호
+    """
+    # 모듈로 대신 곱셈 후 상위 비트를 취해 편향을 2^-64 수준으로 줄임
+    return (splitmix64(seed) * size) >> 64
+
+
+def legacy_index(seed: int, size: int) -> int:
+    """
+    기존 random.seed(seed); random.choice(...)와 같은 청크 번호 선택
+
+    Args:
+        seed: 시드
+        size: 청크 수 (1 이상)
+
+    Returns:
+        0 이상 size 미만 번호
+    """
+    # choice(seq)는 seq[_randbelow(len(seq))]이고 randrange(n)도 같은 _randbelow(n)를 사용
+    return random.Random(seed).randrange(size)
+
+
+_SELECTORS = {
+    "legacy": legacy_index,
+    "hash": hash_index,
+}
+
+
+def select_index(seed: int, size: int, algorithm: str = DEFAULT_ALGORITHM) -> int:
+    """
+    알고리즘을 골라 청크 번호 선택
+
+    Args:
+        seed: 시드
+        size: 청크 수 (1 이상)
+        algorithm: 선택 알고리즘 (legacy, hash)
+
+    Returns:
+        0 이상 size 미만 번호
+
+    Raises:
+        ValueError: 지원하지 않는 알고리즘 (consistent는 ConsistentHashRing 사용)
+    """
+    try:
+        selector = _SELECTORS[algorithm]
+    except KeyError:
+        raise ValueError(f"청크 수만으로 선택할 수 없는 알고리즘: {algorithm}") from None
+    return selector(seed, size)
+
+
+def splitmix64_numpy(z):
+    """splitmix64의 NumPy uint64 배열 버전 (NumPy가 있을 때만 호출)"""
+    # uint64 배열 연산은 2^64에서 자연스럽게 wrap되므로 스칼라 버전의 마스킹과 같음
+    z = z + np.uint64(0x9E3779B97F4A7C15)
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return z ^ (z >> np.uint64(31))
+
+
+def reduce_numpy(z, size: int):
+    """uint64 해시 배열을 [0, size) 번호로 축소 (hash_index의 곱셈 축소와 같음)"""
+    # (z * size) >> 64를 32비트 두 조각으로 계산 (size < 2^32이면 중간값이 넘치지 않음)
+    n = np.uint64(size)
+    high = (z >> np.uint64(32)) * n
+    low = (z & np.uint64(_MASK32)) * n
+    return ((high + (low >> np.uint64(32))) >> np.uint64(32)).astype(np.uint32)
+
+
+def _hash_indices_numpy(seeds, size: int):
+    return reduce_numpy(splitmix64_numpy(np.asarray(seeds, dtype=np.int64).astype(np.uint64)), size)
+
+
+def select_indices(seeds: Sequence[int], size: int, algorithm: str = DEFAULT_ALGORITHM,
+                   use_numpy: bool = True):
+    """
+    여러 시드의 청크 번호를 한 번에 선택 (select_index를 시드마다 부른 것과 같은 결과)
+    hash 알고리즘은 NumPy가 있으면 배열 연산 한 번으로 계산합니다.
+    legacy는 메르센 트위스터 상태를 시드마다 만들어야 하므로 시드당 수 µs가 듭니다.
+
+    Args:
+        seeds: 시드 목록 (NumPy 배열 또는 정수 시퀀스)
+        size: 청크 수 (1 이상, 2^32 미만)
+        algorithm: 선택 알고리즘 (legacy, hash)
+        use_numpy: NumPy가 설치되어 있으면 사용
+
+    Returns:
+        청크 번호 배열 (NumPy uint32 배열 또는 array('I'))
+
+    Raises:
+        ValueError: 지원하지 않는 알고리즘 또는 범위를 벗어난 청크 수
+    """
+    if algorithm not in _SELECTORS:
+        raise ValueError(f"청크 수만으로 선택할 수 없는 알고리즘: {algorithm}")
+    if not 0 < size <= _MASK32:
+        raise ValueError(f"청크 수가 범위를 벗어났습니다: {size}")
+
+    if algorithm == "hash" and use_numpy and np is not None:
+        return _hash_indices_numpy(seeds, size)
+
+    if algorithm == "hash":
+        indices = array('I', [hash_index(int(seed), size) for seed in seeds])
+    else:
+        # Random 객체 하나를 다시 시드하며 재사용 (시드마다 새로 만드는 것보다 빠름)
+        rng = random.Random()
+        indices = array('I')
+        for seed in seeds:
+            rng.seed(int(seed))
+            indices.append(rng.randrange(size))
+
+    if use_numpy and np is not None:
+        return np.frombuffer(indices, dtype=np.uint32)
+    return indices
+
+
+def _feistel_params(size: int) -> Tuple[int, int]:
+    # 2^(2 * half_bits) >= size인 가장 작은 짝수 비트 도메인 (순회 걷기 평균 4회 미만)
+    half_bits = max(1, ((size - 1).bit_length() + 1) // 2)
+    return half_bits, (1 << half_bits) - 1
+
+
+def _feistel(value: int, key: int, half_bits: int, mask: int) -> int:
+    left, right = value >> half_bits, value & mask
+    for round_number in range(ROTATION_ROUNDS):
+        # 라운드 함수가 무엇이든 Feistel 구조 자체가 전단사를 보장
+        left, right = right, left ^ (splitmix64(key ^ ((right << 8) | round_number)) & mask)
+    return (left << half_bits) | right
+
+
+def rotation_index(block_number: int, size: int) -> int:
+    """
+    연속된 블록 번호를 반복 없는 청크 번호로 대응
+    블록 k는 k // size번째 주기 순열의 k % size번째 자리이므로, 한 주기(size개 블록) 안에서
+    모든 청크가 정확히 한 번씩 나옵니다. 저장하는 이력 없이 어느 블록이든 바로 계산됩니다.
+
+    Args:
+        block_number: 기준 시각부터 센 블록 번호 (0 이상)
+        size: 청크 수 (1 이상)
+
+    Returns:
+        0 이상 size 미만 번호
+    """
+    if size <= 1:
+        return 0
+    cycle, position = divmod(block_number, size)
+    key = splitmix64(ROTATION_KEY ^ cycle)
+    half_bits, mask = _feistel_params(size)
+    # 순회 걷기: 2^(2 * half_bits) 도메인의 순열을 [0, size)로 좁힘
+    value = _feistel(position, key, half_bits, mask)
+    while value >= size:
+        value = _feistel(value, key, half_bits, mask)
+    return value
+
+
+def _feistel_numpy(values, keys, half_bits: int, mask: int):
+    shift, mask = np.uint64(half_bits), np.uint64(mask)
+    left, right = values >> shift, values & mask
+    for round_number in range(ROTATION_ROUNDS):
+        mixed = splitmix64_numpy(keys ^ ((right << np.uint64(8)) | np.uint64(round_number)))
+        left, right = right, left ^ (mixed & mask)
+    return (left << shift) | right
+
+
+def rotation_indices(block_numbers, size: int, use_numpy: bool = True):
+    """
+    여러 블록 번호의 rotation 청크 번호 (rotation_index를 블록마다 부른 것과 같은 결과)
+
+    Args:
+        block_numbers: 블록 번호 목록 (0 이상)
+        size: 청크 수 (1 이상, 2^32 미만)
+        use_numpy: NumPy가 설치되어 있으면 배열 연산으로 계산
+
+    Returns:
+        청크 번호 배열 (NumPy uint32 배열 또는 array('I'))
+    """
+    if not (use_numpy and np is not None):
+        return array('I', [rotation_index(int(block), size) for block in block_numbers])
+
+    blocks = np.asarray(block_numbers, dtype=np.int64).astype(np.uint64)
+    if size <= 1:
+        return np.zeros(len(blocks), dtype=np.uint32)
+    n = np.uint64(size)
+    keys = splitmix64_numpy(np.uint64(ROTATION_KEY) ^ (blocks // n))
+    half_bits, mask = _feistel_params(size)
+    values = _feistel_numpy(blocks % n, keys, half_bits, mask)
+    # 도메인 밖으로 나간 값만 다시 돌림 (매 회 대부분이 빠지므로 몇 번 안에 끝남)
+    pending = np.nonzero(values >= n)[0]
+    while len(pending):
+        values[pending] = _feistel_numpy(values[pending], keys[pending], half_bits, mask)
+        pending = pending[values[pending] >= n]
+    return values.astype(np.uint32)
+
+
+def stable_chunk_id(chunk) -> str:
+    """
+    청크의 안정 식별자 (LyricChunk.stable_id, 딕셔너리 청크는 앨범 폴더/제목#id)
+
+    Args:
+        chunk: LyricChunk 또는 청크 딕셔너리
+
+    Returns:
+        식별자 문자열
+    """
+    stable_id = getattr(chunk, 'stable_id', None)
+    if stable_id is not None:
+        return stable_id
+    return f"{chunk.get('album_folder', '')}/{chunk.get('title', '')}#{chunk.get('id', 0)}"
+
+
+def _id_hash(chunk_id: str) -> int:
+    return int.from_bytes(blake2b(chunk_id.encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+class ConsistentHashRing:
+    """
+    청크 안정 ID로 만든 해시 링
+    청크마다 replicas개의 점을 2^64 원 위에 두고, 블록 시드의 해시에서 시계 방향으로
+    가장 가까운 점의 청크를 고릅니다. 청크가 추가되면 새 점 바로 앞 구간의 블록만,
+    삭제되면 그 청크가 맡던 블록만 다른 청크로 옮겨 갑니다.
+    """
+
+    def __init__(self, chunk_ids: Iterable[str], replicas: int = DEFAULT_RING_REPLICAS,
+                 use_numpy: bool = True):
+        """
+        Args:
+            chunk_ids: 청크 목록 순서대로의 안정 식별자
+            replicas: 청크당 점 수
+            use_numpy: NumPy가 설치되어 있으면 점 계산과 정렬에 사용
+        """
+        bases = [_id_hash(chunk_id) for chunk_id in chunk_ids]
+        self.replicas = replicas
+        self.size = len(bases)
+
+        if use_numpy and np is not None and bases:
+            base = np.asarray(bases, dtype=np.uint64)
+            points = splitmix64_numpy(
+                (base[:, None] + np.arange(replicas, dtype=np.uint64)).ravel())
+            owners = np.repeat(np.arange(len(bases), dtype=np.uint32), replicas)
+            # 점이 겹치면 청크 순서로 정렬 (순수 파이썬 정렬과 같은 결과)
+            order = np.lexsort((owners, points))
+            self._points = points[order]
+            self._owners = owners[order]
+        else:
+            ring = sorted(
+                (splitmix64((base + replica) & _MASK64), owner)
+                for owner, base in enumerate(bases)
+                for replica in range(replicas)
+            )
+            self._points = array('Q', [point for point, _ in ring])
+            self._owners = array('I', [owner for _, owner in ring])
+
+    def __len__(self) -> int:
+        return self.size
+
+    def lookup(self, seed: int) -> int:
+        """
+        시드에 해당하는 청크 번호
+
+        Args:
+            seed: 블록 시드
+
+        Returns:
+            0 이상 size 미만 번호
+        """
+        position = bisect_left(self._points, splitmix64(seed))
+        if position == len(self._points):
+            position = 0  # 원을 한 바퀴 돌아 첫 점
+        return int(self._owners[position])
+
+    def lookup_many(self, seeds):
+        """
+        여러 시드의 청크 번호 (NumPy 링이면 searchsorted 한 번으로 계산)
+
+        Args:
+            seeds: 시드 목록
+
+        Returns:
+            청크 번호 배열 (NumPy uint32 배열 또는 array('I'))
+        """
+        if np is not None and isinstance(self._points, np.ndarray):
+            keys = splitmix64_numpy(np.asarray(seeds, dtype=np.int64).astype(np.uint64))
+            positions = np.searchsorted(self._points, keys, side='left')
+            positions[positions == len(self._points)] = 0
+            return self._owners[positions]
+        return array('I', [self.lookup(int(seed)) for seed in seeds])
+
+
+# 청크 목록 객체별 파생 데이터 캐시 (청크 목록이 사라지면 약한 참조 콜백으로 함께 제거)
+# 값은 Future로 두어 전역 락은 조회/등록에만 쓰고, 생성은 락 밖에서 키마다 한 번만 수행
+_DERIVED_CACHE: Dict[Tuple[int, Hashable], Tuple[weakref.ref, Future]] = {}
+_DERIVED_LOCK = threading.Lock()
+
+
+def cached_for_chunks(all_chunks: Sequence, key: Hashable, build: Callable[[], Any]) -> Any:
+    """
+    청크 목록 객체에서 만든 데이터(해시 링, 별칭 테이블 등)를 목록 객체별로 캐시
+    카탈로그가 리로드되면 새 청크 목록 객체가 생기므로 다시 만들어집니다.
+    같은 키를 동시에 요청하면 먼저 온 호출만 만들고 나머지는 그 결과를 기다리며,
+    다른 키(다른 카탈로그, 다른 종류의 데이터)의 조회는 생성 중에도 막히지 않습니다.
+
+    Args:
+        all_chunks: 청크 목록 (약한 참조를 걸 수 없는 일반 list면 캐시하지 않음)
+        key: 같은 목록에서 만든 데이터끼리 구분하는 키
+        build: 캐시에 없을 때 호출할 생성 함수
+
+    Returns:
+        캐시된 값 또는 새로 만든 값
+
+    Raises:
+        build()가 던진 예외 (기다리던 호출에도 전달되고, 캐시에는 남기지 않아 다음 호출이 다시 시도)
+    """
+    cache_key = (id(all_chunks), key)
+    with _DERIVED_LOCK:
+        cached = _DERIVED_CACHE.get(cache_key)
+        if cached is not None and cached[0]() is all_chunks:
+            future, owner = cached[1], False
+        else:
+            try:
+                ref = weakref.ref(all_chunks, lambda _, cache_key=cache_key: _DERIVED_CACHE.pop(cache_key, None))
+            except TypeError:
+                ref = None
+            future, owner = Future(), True
+            if ref is not None:
+                entry = (ref, future)
+                _DERIVED_CACHE[cache_key] = entry
+
+    if not owner:
+        return future.result()
+    if ref is None:
+        return build()
+
+    try:
+        value = build()
+    except BaseException as e:
+        with _DERIVED_LOCK:
+            if _DERIVED_CACHE.get(cache_key) is entry:
+                del _DERIVED_CACHE[cache_key]
+        future.set_exception(e)
+        raise
+    future.set_result(value)
+    return value
+
+
+def get_hash_ring(all_chunks: Sequence, replicas: int = DEFAULT_RING_REPLICAS) -> ConsistentHashRing:
+    """
+    청크 목록의 해시 링 (같은 목록 객체면 처음 만든 링을 재사용)
+
+    Args:
+        all_chunks: 청크 목록 (stable_ids()가 있으면 그것으로 ID를 읽음)
+        replicas: 청크당 점 수
+
+    Returns:
+        ConsistentHashRing 인스턴스
+    """
+    def build() -> ConsistentHashRing:
+        stable_ids = getattr(all_chunks, 'stable_ids', None)
+        chunk_ids: List[str] = stable_ids() if stable_ids else [stable_chunk_id(c) for c in all_chunks]
+        return ConsistentHashRing(chunk_ids, replicas)
+
+    return cached_for_chunks(all_chunks, ('ring', replicas), build)
@@ -0,0 +1,149 @@
+"""
+시간 블록별 가사 선택 캐시
+같은 블록 안에서는 모든 클라이언트가 같은 가사를 받으므로 블록마다 한 번만 고르고,
+다음 블록도 미리 계산해 두어 블록 경계에 몰리는 위젯 요청을 메모리에서 바로 응답합니다.
+"""
+
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from src.daily_selector import get_interval_lyric, get_interval_seed, get_next_block_start
+from src.lyrics_database import LyricsDatabase
+from src.lyrics_models import LyricChunk
+from src.selection import DEFAULT_ALGORITHM
+from src.weights import SelectionWeights
+
+
+class _BlockGroup:
+    """(카탈로그, 주기, 알고리즘, 가중치, 시간대) 하나의 캐시 항목들"""
+
+    __slots__ = ('version', 'entries', 'latest')
+
+    def __init__(self, version: str):
+        self.version = version
+        self.entries: Dict[int, Any] = {}  # 시드 → 렌더링 결과
+        self.latest = -1  # 미리 계산해 둔 가장 늦은 블록의 시드
+
+
+class BlockSelectionCache:
+    """
+    (카탈로그, 주기, 날짜+블록, 카탈로그 버전) → 선택 결과 캐시
+
+    - 블록이 넘어가면 지난 블록 항목을 지움
+    - 카탈로그가 리로드되어 버전이 바뀌면 그 카탈로그의 항목을 모두 버림
+    - 현재 블록이 미리 계산된 마지막 블록이면 다음 블록을 계산해 둠
+    """
+
+    def __init__(self, render: Callable[[LyricChunk, str], Any] = None, max_groups: int = 64):
+        """
+        Args:
+            render: 선택된 청크를 캐시할 값으로 바꾸는 함수 (청크, 주기) → 값
+                    (None이면 청크 자체를 캐시)
+            max_groups: 보관할 (카탈로그, 주기, 알고리즘, 가중치, 시간대) 조합 수
+                        (넘치면 오래 안 쓴 것부터 제거)
+        """
+        self.render = render or (lambda chunk, interval: chunk)
+        self.max_groups = max_groups
+        self.hits = 0
+        self.misses = 0
+        self._groups: "OrderedDict[Tuple, _BlockGroup]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_entry(self, catalog: str, db: LyricsDatabase, interval: str,
+                  when: Optional[datetime] = None, algorithm: str = DEFAULT_ALGORITHM,
+                  weights: Optional[SelectionWeights] = None) -> Optional[Tuple[str, int, Any]]:
+        """
+        시간 블록의 선택 결과와 그 결과를 만든 카탈로그 버전, 블록 시드 반환
+        (캐시에 없으면 선택하고 저장)
+
+        Args:
+            catalog: 카탈로그 이름
+            db: 카탈로그의 LyricsDatabase
+            interval: 시간 주기
+            when: 시간 (None이면 현재 시간, 시간대가 있으면 그 시간대의 현지 시각으로 블록을 나눔)
+            algorithm: 선택 알고리즘
+            weights: 청크 가중치 (None이면 균등 선택)
+
+        Returns:
+            (카탈로그 버전, 블록 시드, render 결과) 또는 None (카탈로그가 빈 경우)
+        """
+        version, chunks = db.get_versioned_chunks()
+        if not chunks:
+            return None
+        if when is None:
+            when = datetime.now()
+
+        seed = get_interval_seed(when, interval)
+        # 시간대마다 블록 경계가 달라 지난 블록을 지우는 기준도 다르므로 따로 보관
+        group_key = (catalog, interval, algorithm, weights.version if weights is not None else None,
+                     when.tzinfo)
+
+        with self._lock:
+            group = self._groups.get(group_key)
+            value = None
+            if group is not None and group.version == version:
+                value = group.entries.get(seed)
+            if value is not None:
+                self.hits += 1
+                self._groups.move_to_end(group_key)
+                if seed < group.latest:
+                    return version, seed, value
+            else:
+                self.misses += 1
+
+        # 현재 블록(미스일 때)과 다음 블록을 락 밖에서 계산
+        # 동시에 미스가 나면 같은 값을 두 번 계산할 수 있지만 결과는 같음
+        computed = {}
+        if value is None:
+            value = self.render(get_interval_lyric(chunks, interval, when, algorithm, weights), interval)
+            computed[seed] = value
+        next_when = get_next_block_start(when, interval)
+        computed[get_interval_seed(next_when, interval)] = self.render(
+            get_interval_lyric(chunks, interval, next_when, algorithm, weights), interval)
+
+        with self._lock:
+            group = self._groups.get(group_key)
+            if group is None or group.version != version:
+                # 처음 보는 조합이거나 리로드로 버전이 바뀜
+                group = self._groups[group_key] = _BlockGroup(version)
+            # 지난 블록 항목 제거
+            group.entries = {s: v for s, v in group.entries.items() if s >= seed}
+            group.entries.update(computed)
+            group.latest = max(group.entries)
+            self._groups.move_to_end(group_key)
+            while len(self._groups) > self.max_groups:
+                self._groups.popitem(last=False)
+
+        return version, seed, value
+
+    def get(self, catalog: str, db: LyricsDatabase, interval: str,
+            when: Optional[datetime] = None, algorithm: str = DEFAULT_ALGORITHM,
+            weights: Optional[SelectionWeights] = None) -> Optional[Any]:
+        """
+        시간 블록의 선택 결과 반환 (get_entry의 render 결과만)
+
+        Returns:
+            render 결과 또는 None (카탈로그가 빈 경우)
+        """
+        entry = self.get_entry(catalog, db, interval, when, algorithm, weights)
+        return entry[2] if entry is not None else None
+
+    def invalidate(self, catalog: Optional[str] = None) -> None:
+        """
+        캐시 비우기 (버전이 키에 들어가므로 리로드 후 호출하지 않아도 오래된 값은 쓰이지 않음)
+
+        Args:
+            catalog: 이 카탈로그의 항목만 비움 (None이면 전체)
+        """
+        with self._lock:
+            if catalog is None:
+                self._groups.clear()
+            else:
+                for key in [key for key in self._groups if key[0] == catalog]:
+                    del self._groups[key]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(group.entries) for group in self._groups.values())
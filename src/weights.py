@@ -0,0 +1,303 @@
+"""
+가중치 기반 가사 선택
+앨범, 연도 구간, 트랙, 청크별 가중치로 청크 선택 확률을 조정합니다.
+가중치는 Walker/Vose 별칭 테이블로 미리 바꾸어 두므로 선택 한 번은 O(1)입니다.
+
+가중치 설정 예시 (JSON):
+    {
+        "default": 1.0,
+        "balance_albums": true,
+        "albums": {"Purpose": 2.0},
+        "years": [{"from": 2015, "to": 2017, "weight": 1.5}],
+        "tracks": {"003_Purpose/01_Fine.json": 3.0},
+        "chunks": {"001_I/01_I.json#2": 0}
+    }
+
+최종 가중치 = default × albums[앨범명] × years[연도 구간] × tracks[트랙 경로]
+(balance_albums면 앨범마다 청크 수로 나누어 앨범별 총합을 같게 함)
+chunks[청크 안정 ID]가 있으면 위 계산 대신 그 값을 그대로 사용합니다.
+"""
+
+import json
+import random
+from array import array
+from hashlib import blake2b
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+from src.selection import reduce_numpy, splitmix64_numpy, cached_for_chunks, np, splitmix64
+
+# 별칭 테이블 열을 고르는 해시와 겹치지 않도록 동전 던지기 해시에 섞는 값
+_COIN_SALT = 0xA5A5A5A5A5A5A5A5
+
+# /random-lyric용 난수원: OS 엔트로피를 읽으므로 공유 상태가 없어 스레드/워커 사이에 잠금이나
+# 시드 간섭이 없음 (random 모듈 전역 생성기는 다른 코드의 random.seed()에 영향을 받음)
+RANDOM_SOURCE = random.SystemRandom()
+
+
+class SelectionWeights:
+    """청크 가중치 규칙 (만든 뒤에는 읽기 전용)"""
+
+    def __init__(self, default: float = 1.0,
+                 albums: Optional[Dict[str, float]] = None,
+                 years: Optional[List[Dict]] = None,
+                 tracks: Optional[Dict[str, float]] = None,
+                 chunks: Optional[Dict[str, float]] = None,
+                 balance_albums: bool = False):
+        """
+        Args:
+            default: 기본 가중치
+            albums: 앨범명 → 배수
+            years: [{"from": 시작 연도, "to": 끝 연도, "weight": 배수}, ...] (처음 맞는 구간 적용)
+            tracks: "앨범 폴더/트랙 파일" → 배수
+            chunks: 청크 안정 ID("앨범 폴더/트랙 파일#청크 번호") → 최종 가중치
+            balance_albums: 앨범마다 청크 수로 나누어 청크가 많은 앨범이 더 자주 나오지 않게 함
+
+        Raises:
+            ValueError: 음수 가중치 또는 잘못된 연도 구간
+        """
+        self.default = float(default)
+        self.albums = {name: float(w) for name, w in (albums or {}).items()}
+        self.years: List[Tuple[int, int, float]] = []
+        for rule in years or []:
+            try:
+                self.years.append((int(rule['from']), int(rule['to']), float(rule['weight'])))
+            except (KeyError, TypeError, ValueError) as e:
+                raise ValueError(f"연도 가중치 형식이 올바르지 않습니다: {rule}") from e
+        self.tracks = {path: float(w) for path, w in (tracks or {}).items()}
+        self.chunks = {chunk_id: float(w) for chunk_id, w in (chunks or {}).items()}
+        self.balance_albums = bool(balance_albums)
+
+        values = [self.default, *self.albums.values(), *(w for _, _, w in self.years),
+                  *self.tracks.values(), *self.chunks.values()]
+        if any(w < 0 for w in values):
+            raise ValueError("가중치는 0 이상이어야 합니다")
+
+        # 규칙이 같으면 같은 버전 (별칭 테이블/블록 캐시 키)
+        canonical = json.dumps(self.to_dict(), sort_keys=True, ensure_ascii=False)
+        self.version = blake2b(canonical.encode('utf-8'), digest_size=8).hexdigest()
+
+    @classmethod
+    def from_config(cls, config: Union[str, Path, Dict]) -> 'SelectionWeights':
+        """
+        JSON 설정 파일(또는 딕셔너리)로 가중치 생성
+
+        Args:
+            config: 설정 파일 경로 또는 같은 구조의 딕셔너리
+
+        Returns:
+            SelectionWeights 인스턴스
+        """
+        if not isinstance(config, dict):
+            with open(config, 'r', encoding='utf-8') as f:
+                config = json.load(f)
+        return cls(
+            config.get('default', 1.0),
+            config.get('albums'),
+            config.get('years'),
+            config.get('tracks'),
+            config.get('chunks'),
+            config.get('balance_albums', False)
+        )
+
+    def to_dict(self) -> Dict:
+        """설정 딕셔너리로 변환"""
+        return {
+            'default': self.default,
+            'albums': self.albums,
+            'years': [{'from': start, 'to': end, 'weight': w} for start, end, w in self.years],
+            'tracks': self.tracks,
+            'chunks': self.chunks,
+            'balance_albums': self.balance_albums
+        }
+
+    def _year_weight(self, year: Optional[int]) -> float:
+        # 연도가 없거나(null) 정수가 아닌 트랙은 연도 규칙을 적용하지 않음
+        if not isinstance(year, int) or isinstance(year, bool):
+            return 1.0
+        for start, end, weight in self.years:
+            if start <= year <= end:
+                return weight
+        return 1.0
+
+    def chunk_weights(self, all_chunks: Sequence) -> List[float]:
+        """
+        청크 목록 순서대로의 가중치
+
+        Args:
+            all_chunks: 청크 목록 (chunk_refs()가 있으면 가사 라인을 디코딩하지 않고 읽음)
+
+        Returns:
+            가중치 리스트
+        """
+        chunk_refs = getattr(all_chunks, 'chunk_refs', None)
+        if chunk_refs is not None:
+            metas = [(track.album, track.year, f"{track.album_folder}/{track.track_file}", number)
+                     for track, number in chunk_refs()]
+        else:
+            metas = [_chunk_meta(chunk) for chunk in all_chunks]
+
+        album_sizes: Dict[str, int] = {}
+        if self.balance_albums:
+            for album, _, _, _ in metas:
+                album_sizes[album] = album_sizes.get(album, 0) + 1
+
+        weights = []
+        for album, year, track_path, number in metas:
+            override = self.chunks.get(f"{track_path}#{number}")
+            if override is not None:
+                weights.append(override)
+                continue
+            weight = (self.default * self.albums.get(album, 1.0) * self._year_weight(year)
+                      * self.tracks.get(track_path, 1.0))
+            if self.balance_albums:
+                weight /= album_sizes[album]
+            weights.append(weight)
+        return weights
+
+
+def _chunk_meta(chunk) -> Tuple[str, Optional[int], str, int]:
+    """청크의 (앨범명, 연도, 트랙 경로, 청크 번호) (LyricChunk 또는 청크 딕셔너리)"""
+    track = getattr(chunk, 'track', None)
+    if track is not None:
+        return track.album, track.year, f"{track.album_folder}/{track.track_file}", chunk.number
+    return (chunk.get('album', ''), chunk.get('year', 0),
+            f"{chunk.get('album_folder', '')}/{chunk.get('title', '')}", chunk.get('id', 0))
+
+
+class AliasTable:
+    """
+    Walker/Vose 별칭 테이블
+    열 하나를 균등하게 고른 뒤 동전 한 번으로 그 열의 청크 또는 별칭 청크를 고릅니다.
+    """
+
+    __slots__ = ('size', '_prob', '_alias')
+
+    def __init__(self, weights: Sequence[float]):
+        """
+        Args:
+            weights: 청크별 가중치 (0 이상, 합이 0보다 커야 함)
+
+        Raises:
+            ValueError: 가중치가 없거나 모두 0인 경우
+        """
+        n = len(weights)
+        total = float(sum(weights))
+        if n == 0 or total <= 0:
+            raise ValueError("선택할 수 있는 청크가 없습니다 (가중치 합이 0)")
+
+        scaled = [w * n / total for w in weights]
+        prob = array('d', [0.0]) * n
+        alias = array('I', [0]) * n
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+
+        while small and large:
+            less, more = small.pop(), large.pop()
+            prob[less] = scaled[less]
+            alias[less] = more
+            scaled[more] = (scaled[more] + scaled[less]) - 1.0
+            (small if scaled[more] < 1.0 else large).append(more)
+
+        # 부동소수점 오차로 남은 열은 자기 자신을 확률 1로 선택
+        for i in large + small:
+            prob[i] = 1.0
+            alias[i] = i
+
+        self.size = n
+        self._prob = prob
+        self._alias = alias
+
+    def __len__(self) -> int:
+        return self.size
+
+    def pick(self, column: int, coin: float) -> int:
+        """
+        열 번호와 [0, 1) 동전 값으로 청크 번호 선택
+
+        Args:
+            column: 0 이상 size 미만 열 번호
+            coin: 0 이상 1 미만 실수
+
+        Returns:
+            청크 번호
+        """
+        return column if coin < self._prob[column] else self._alias[column]
+
+    def sample_seeded(self, seed: int, algorithm: str = "hash") -> int:
+        """
+        시드로 결정되는 청크 번호 (같은 시드면 항상 같은 결과)
+
+        Args:
+            seed: 블록 시드
+            algorithm: 균등 난수를 만드는 방식 (legacy = random.Random(seed), hash = splitmix64)
+
+        Returns:
+            청크 번호
+
+        Raises:
+            ValueError: legacy/hash가 아닌 알고리즘
+        """
+        if algorithm == "hash":
+            bits = splitmix64(seed)
+            column = (bits * self.size) >> 64
+            coin = (splitmix64(bits ^ _COIN_SALT) >> 11) * (1.0 / (1 << 53))
+        elif algorithm == "legacy":
+            rng = random.Random(seed)
+            column = rng.randrange(self.size)
+            coin = rng.random()
+        else:
+            raise ValueError(f"가중치 선택을 지원하지 않는 알고리즘: {algorithm} (legacy, hash만 지원)")
+        return self.pick(column, coin)
+
+    def sample_many(self, seeds, algorithm: str = "hash", use_numpy: bool = True):
+        """
+        여러 시드의 청크 번호 (sample_seeded를 시드마다 부른 것과 같은 결과)
+
+        Args:
+            seeds: 시드 목록
+            algorithm: legacy 또는 hash (hash는 NumPy가 있으면 배열 연산)
+            use_numpy: NumPy가 설치되어 있으면 사용
+
+        Returns:
+            청크 번호 배열 (NumPy uint32 배열 또는 array('I'))
+        """
+        if algorithm == "hash" and use_numpy and np is not None:
+            bits = splitmix64_numpy(np.asarray(seeds, dtype=np.int64).astype(np.uint64))
+            columns = reduce_numpy(bits, self.size)
+            coins = (splitmix64_numpy(bits ^ np.uint64(_COIN_SALT)) >> np.uint64(11)) * (1.0 / (1 << 53))
+            prob = np.frombuffer(self._prob, dtype=np.float64)
+            alias = np.frombuffer(self._alias, dtype=np.uint32)
+            return np.where(coins < prob[columns], columns, alias[columns]).astype(np.uint32)
+        indices = array('I', [self.sample_seeded(int(seed), algorithm) for seed in seeds])
+        if use_numpy and np is not None:
+            return np.frombuffer(indices, dtype=np.uint32)
+        return indices
+
+    def sample_random(self, rng: Optional[random.Random] = None) -> int:
+        """
+        시드와 무관한 임의의 청크 번호 (/random-lyric)
+
+        Args:
+            rng: 난수 생성기 (None이면 RANDOM_SOURCE)
+
+        Returns:
+            청크 번호
+        """
+        rng = rng or RANDOM_SOURCE
+        return self.pick(rng.randrange(self.size), rng.random())
+
+
+def get_alias_table(all_chunks: Sequence, weights: SelectionWeights) -> AliasTable:
+    """
+    청크 목록과 가중치의 별칭 테이블 (카탈로그나 가중치가 바뀔 때만 다시 만듦)
+
+    Args:
+        all_chunks: 청크 목록
+        weights: 가중치 규칙
+
+    Returns:
+        AliasTable 인스턴스
+    """
+    return cached_for_chunks(all_chunks, ('alias', weights.version),
+                             lambda: AliasTable(weights.chunk_weights(all_chunks)))
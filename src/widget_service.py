@@ -9,23 +9,114 @@ Daily Lyrics Widget Service
     uvicorn src.widget_service:app --host 0.0.0.0 --port 58384
 """
 
-from fastapi import FastAPI, Query
+from fastapi import FastAPI, Header, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from datetime import datetime
-from typing import Optional
+from functools import partial
+from typing import Optional, Tuple
 from pathlib import Path
+import atexit
+import ipaddress
 import logging
+import os
+import secrets
+import time
 
-from src.lyrics_database import LyricsDatabase
-from src.daily_selector import get_interval_lyric, get_random_lyric
+from src.broadcaster import BlockBroadcaster, sse_frame
+from src.catalog_registry import DEFAULT_CATALOG, CatalogRegistry
+from src.catalog_watcher import CatalogWatcher
+from src.daily_selector import (get_block_bounds, get_interval_seed, get_interval_timeline, get_random_index,
+                                parse_interval, prepare_selection, resolve_timezone)
+from src.covers import COVER_SIZES, ORIGINAL_SIZE, CoverStore, Image
+from src.http_cache import block_cache_headers, etag_matches, make_etag, not_modified_since, parse_range
+from src.log_pipeline import AccessLogMiddleware, LogPipeline
+from src.metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, MetricsMiddleware, MetricsRegistry
+from src.readiness import CatalogWarmup, ReadinessGate
+from src.responses import JSON_MEDIA_TYPE, PreparedCache, PreparedLyric, dumps, orjson
+from src.selection_cache import BlockSelectionCache
+from src.selection import ALGORITHMS, DEFAULT_ALGORITHM, INDEX_ALGORITHMS, cached_for_chunks
 
 # 로깅 설정
+# DAILY_LYRICS_LOG_QUEUE: 로그 큐 크기 (기본 10000, 0이면 큐 없이 요청 스레드에서 바로 출력)
+#                         가득 차면 요청을 기다리게 하지 않고 버림 (/metrics의 log_records_dropped_total)
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
+LOG_QUEUE_SIZE = int(os.environ.get("DAILY_LYRICS_LOG_QUEUE", "10000"))
+log_pipeline = LogPipeline(LOG_QUEUE_SIZE).start() if LOG_QUEUE_SIZE > 0 else None
+if log_pipeline is not None:
+    # 종료 직전까지 큐에 남은 로그를 출력
+    atexit.register(log_pipeline.stop)
+
+# 가사 데이터베이스 초기화
+# DAILY_LYRICS_CATALOGS: 카탈로그 설정 JSON 경로 (여러 data 루트를 한 프로세스에서 제공,
+#                        없으면 data/ 하나를 "default" 카탈로그로 로드)
+# DAILY_LYRICS_LOAD_WORKERS: 폴더 스캔 시 병렬 로드 스레드 수 (기본 0 = 순차 로드)
+# DAILY_LYRICS_LAZY: 1이면 인덱스만 로드하고 가사 라인은 선택될 때 읽음 (저사양 상시 구동용)
+# DAILY_LYRICS_LAZY_CACHE: lazy 모드에서 라인을 캐시할 최대 트랙 수 (기본 256)
+# DAILY_LYRICS_SEARCH_INDEX: 1이면 준비 완료 후 백그라운드에서 검색 인덱스 생성 (기본 0 = 첫 /search 요청 때 생성,
+#                            인덱스는 수만 청크에서 수 초와 수십 MB가 들어 스냅샷/lazy 로드의 이점을 상쇄함)
+# LAZY/LAZY_CACHE/SEARCH_INDEX는 설정 파일의 카탈로그 항목에 없을 때의 기본값으로도 쓰임
+# DAILY_LYRICS_WEIGHTS: 가중치 설정 JSON 경로 (설정 파일이 없을 때 기본 카탈로그에 적용,
+#                       여러 카탈로그는 설정 파일의 "weights" 항목 사용)
+# 여기서는 설정 검증과 카탈로그 등록만 하고, 로드(스냅샷 포함)와 선택용 파생 데이터 생성은 서버 시작 후
+# 백그라운드 스레드에서 함 (catalog_warmup, 끝날 때까지 가사 엔드포인트는 503 + Retry-After)
+CATALOG_DEFAULTS = {
+    "lazy": os.environ.get("DAILY_LYRICS_LAZY", "0") == "1",
+    "lazy_cache_tracks": int(os.environ.get("DAILY_LYRICS_LAZY_CACHE", "256")),
+    "search_index": os.environ.get("DAILY_LYRICS_SEARCH_INDEX", "0") == "1"
+}
+CATALOGS_CONFIG = os.environ.get("DAILY_LYRICS_CATALOGS")
+if CATALOGS_CONFIG:
+    registry = CatalogRegistry.from_config(CATALOGS_CONFIG, defer=True, **CATALOG_DEFAULTS)
+else:
+    registry = CatalogRegistry(
+        DEFAULT_CATALOG,
+        load_workers=int(os.environ.get("DAILY_LYRICS_LOAD_WORKERS", "0"))
+    )
+    registry.add(DEFAULT_CATALOG, data_dir="data",
+                 weights=os.environ.get("DAILY_LYRICS_WEIGHTS") or None, **CATALOG_DEFAULTS)
+
+
+# DAILY_LYRICS_SELECTION: 가사 선택 알고리즘 (legacy = 기존 선택 결과 유지, hash = 해시 기반)
+SELECTION_ALGORITHM = os.environ.get("DAILY_LYRICS_SELECTION", DEFAULT_ALGORITHM)
+if SELECTION_ALGORITHM not in ALGORITHMS:
+    raise ValueError(f"지원하지 않는 선택 알고리즘: {SELECTION_ALGORITHM} ({', '.join(ALGORITHMS)})")
+if SELECTION_ALGORITHM not in INDEX_ALGORITHMS and any(registry.weights_for(name) for name in registry.pending):
+    raise ValueError(f"가중치는 {', '.join(INDEX_ALGORITHMS)} 알고리즘에서만 사용할 수 있습니다")
+
+
+def prepare_catalog(name: str, chunks) -> None:
+    """
+    청크 목록의 선택용 파생 데이터(가중치 별칭 테이블, 해시 링)를 미리 만듦
+    시작 로드와 리로드(/admin/reload, 감시 스레드)에서 새 청크 목록을 내보내기 전에 호출하므로
+    이벤트 루프에서 도는 가사 요청은 청크 수에 비례하는 생성을 하지 않습니다.
+    """
+    prepare_selection(chunks, SELECTION_ALGORITHM, registry.weights_for(name))
+
+
+def finish_catalog_load() -> None:
+    """카탈로그 로드가 끝나면 로드한 스레드에서 호출 (준비 완료 전에 파생 데이터까지 만듦)"""
+    for name, catalog_db in registry.items():
+        prepare_catalog(name, catalog_db.all_chunks)
+        logger.info(f"로드 완료 ({name}): {catalog_db.get_chunk_count()}개 가사 청크, "
+                    f"앨범 {catalog_db.albums_count}개, 트랙 {catalog_db.tracks_count}개 "
+                    f"({catalog_db.load_duration * 1000:.1f}ms)")
+
+
+def start_search_indexes() -> None:
+    """준비 완료 직후 호출: search_index 카탈로그의 검색 인덱스를 백그라운드에서 만들기 시작 (준비 완료를 늦추지 않음)"""
+    for catalog_db in registry.values():
+        if catalog_db.search_enabled:
+            catalog_db.start_search_index()
+
+
+catalog_warmup = CatalogWarmup(registry, on_ready=finish_catalog_load, after_ready=start_search_indexes)
+
 
 # FastAPI 앱 생성
 app = FastAPI(
@@ -34,6 +125,16 @@ app = FastAPI(
     version="2.0.0"
 )
 
+# 카탈로그 로드 전에는 가사 엔드포인트에 503 + Retry-After (라우팅 전에 바로 응답)
+# 로드와 무관한 상태 확인, 메트릭, 커버, API 문서는 통과
+READY_RETRY_AFTER = 2
+app.add_middleware(
+    ReadinessGate,
+    warmup=catalog_warmup,
+    retry_after=READY_RETRY_AFTER,
+    open_paths=("/", "/livez", "/readyz", "/metrics", "/covers", "/docs", "/redoc", "/openapi.json")
+)
+
 # CORS 설정 (모든 origin 허용 - 로컬 전용)
 app.add_middleware(
     CORSMiddleware,
@@ -43,14 +144,78 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# 가사 데이터베이스 초기화
-logger.info("가사 데이터베이스 로딩 중...")
-db = LyricsDatabase()
-logger.info(f"로드 완료: {db.get_chunk_count()}개 가사 청크")
+# 접근 로그 (uvicorn은 --no-access-log로 실행)
+# DAILY_LYRICS_ACCESS_LOG_SAMPLE: 위젯이 자주 부르는 엔드포인트의 성공 응답을 몇 건에 1건 남길지
+#                                 (기본 100, 1이면 모두, 0이면 남기지 않음, 오류 응답은 항상 남김)
+# DAILY_LYRICS_ACCESS_LOG_SUMMARY: 라우트별 요청 수 요약 로그 주기 (초, 기본 60, 0이면 요약 안 함)
+HOT_ROUTES = ("/current-lyric", "/random-lyric", "/timeline", "/covers", "/health", "/metrics")
+app.add_middleware(
+    AccessLogMiddleware,
+    logger=logging.getLogger(f"{__name__}.access"),
+    hot_paths=HOT_ROUTES,
+    sample_rate=int(os.environ.get("DAILY_LYRICS_ACCESS_LOG_SAMPLE", "100")),
+    summary_seconds=float(os.environ.get("DAILY_LYRICS_ACCESS_LOG_SUMMARY", "60"))
+)
+
+# 요청 수/지연 시간 메트릭 (/metrics, 가장 바깥 미들웨어라 CORS 처리까지 포함)
+metrics = MetricsRegistry()
+app.add_middleware(MetricsMiddleware, metrics=metrics)
+# 지연 시간이 어디서 생기는지 구분하기 위한 단계별 시간 (가사 선택/직렬화, 타임라인 생성, 커버 읽기, 리로드)
+stage_latency = metrics.histogram("stage_duration_seconds", "요청 처리 단계별 소요 시간 (초)")
+
+
+def lyric_data(chunk) -> dict:
+    """가사 응답의 data 딕셔너리 (timestamp는 PreparedLyric.render에서 채움)"""
+    return {
+        "lines": chunk['lines'],
+        "title": chunk['title'],
+        "album": chunk['album'],
+        "year": chunk['year'],
+        "artist": chunk.get('artist', '태연 (TAEYEON)'),
+        "timestamp": None,
+        "albumFolder": chunk.get('album_folder', '')
+    }
+
+
+def render_interval_lyric(chunk, interval: str) -> PreparedLyric:
+    """/current-lyric 응답 본문 (블록마다 한 번 직렬화, timestamp는 블록 시작 시각으로 채움)"""
+    return PreparedLyric({**lyric_data(chunk), "interval": interval})
+
+
+def get_random_payloads(chunks) -> PreparedCache:
+    """/random-lyric 응답 본문 캐시 (청크 목록 객체별, 리로드되면 새로 만듦)"""
+    return cached_for_chunks(chunks, 'random_payloads', PreparedCache)
+
+
+def render_timeline(chunks, interval: str, now: datetime, count: int, weights) -> bytes:
+    """/timeline 응답 본문 (항목마다 /current-lyric의 data와 같은 필드 + 블록 끝 시각)"""
+    entries = [
+        {**lyric_data(chunk), "interval": interval, "timestamp": start.isoformat(), "endsAt": end.isoformat()}
+        for start, end, chunk in get_interval_timeline(chunks, interval, now, count, SELECTION_ALGORITHM, weights)
+    ]
+    return dumps({
+        "success": True,
+        "data": {
+            "interval": interval,
+            "count": len(entries),
+            "entries": entries
+        }
+    })
+
+
+# 시간 블록별 /current-lyric 응답 캐시 (블록 경계에 몰리는 위젯 요청을 메모리에서 응답)
+lyric_cache = BlockSelectionCache(render_interval_lyric)
+
+# DAILY_LYRICS_WATCH_INTERVAL: data/ 변경 폴링 주기 (초, 기본 0 = 감시 안 함)
+# DAILY_LYRICS_ADMIN_TOKEN: 설정하면 /admin/* 요청에 X-Admin-Token 헤더가 필요
+#                           (설정하지 않으면 같은 기기에서 브라우저가 아닌 클라이언트(curl, 스크립트)만 허용)
+WATCH_INTERVAL = float(os.environ.get("DAILY_LYRICS_WATCH_INTERVAL", "0"))
+ADMIN_TOKEN = os.environ.get("DAILY_LYRICS_ADMIN_TOKEN")
+watcher = CatalogWatcher(registry, WATCH_INTERVAL, prepare=prepare_catalog) if WATCH_INTERVAL > 0 else None
 
 
 @app.get("/")
-def root():
+async def root():
     """루트 엔드포인트"""
     return {
         "service": "Daily Lyrics Widget Service",
@@ -58,38 +223,149 @@ def root():
         "status": "running",
         "endpoints": {
             "current_lyric": "/current-lyric?interval=3h",
+            "timeline": "/timeline?interval=3h&count=8",
+            "stream": "/stream?interval=3h",
+            "metrics": "/metrics",
             "random_lyric": "/random-lyric",
             "health": "/health",
-            "stats": "/stats"
+            "livez": "/livez",
+            "readyz": "/readyz",
+            "stats": "/stats",
+            "search": "/search?q=가사",
+            "catalogs": "/catalogs",
+            "reload": "POST /admin/reload"
         }
     }
 
 
 @app.get("/health")
-def health_check():
-    """서비스 상태 확인"""
+async def health_check():
+    """서비스 상태 확인 (카탈로그 로드 전에는 503)"""
+    db = registry.default
     return {
         "status": "healthy",
         "timestamp": datetime.now().isoformat(),
         "chunks_count": db.get_chunk_count(),
         "albums_count": db.albums_count,
-        "tracks_count": db.tracks_count
+        "tracks_count": db.tracks_count,
+        "catalog_version": db.version,
+        "catalogs": list(registry)
     }
 
 
-@app.get("/current-lyric")
-def get_current_lyric(
-    interval: str = Query(
-        default="24h",
-        regex="^(1h|3h|6h|12h|24h)$",
-        description="가사 변경 주기 (1h, 3h, 6h, 12h, 24h)"
+@app.get("/livez")
+async def liveness_check():
+    """프로세스가 요청에 응답하는지 (카탈로그 로드 여부와 무관하게 200)"""
+    return {"status": "alive"}
+
+
+@app.get("/readyz")
+async def readiness_check(response: Response):
+    """
+    가사를 제공할 수 있는지 (카탈로그 로드와 선택용 파생 데이터 생성이 끝나면 200, 그 전이나 실패하면 503)
+    검색 인덱스는 준비 완료에 포함하지 않음 (준비 후 백그라운드에서 만들고, 그 전 /search는 완성을 기다림)
+    로드 중, 로드한/남은 카탈로그, 준비까지 걸린 시간, 실패 원인을 함께 반환
+    """
+    if not catalog_warmup.ready:
+        response.status_code = 503
+        if catalog_warmup.error is None:
+            response.headers["Retry-After"] = str(READY_RETRY_AFTER)
+    response.headers["Cache-Control"] = "no-store"
+    return catalog_warmup.status()
+
+
+def catalog_not_found(catalog: str):
+    """없는 카탈로그 요청에 대한 응답"""
+    return {
+        "success": False,
+        "error": f"Catalog not found: {catalog}"
+    }
+
+
+CATALOG_QUERY = Query(default=None, description="카탈로그 이름 (없으면 기본 카탈로그)")
+INTERVAL_QUERY = Query(
+    default="24h",
+    regex="^[1-9][0-9]*[mhdw]$",
+    description="가사 변경 주기 (숫자 + m/h/d/w, 예: 15m, 90m, 3h, 24h, 1w)"
+)
+TZ_QUERY = Query(default=None, description="IANA 시간대 (예: Asia/Seoul, 없으면 서버 시간대)")
+
+
+async def call_catalog(catalog_db, func, *args):
+    """
+    카탈로그를 읽는 함수 실행
+    lazy 카탈로그는 가사 라인을 파일에서 읽을 수 있으므로 스레드 풀에서,
+    그 외에는 메모리 조회뿐이므로 이벤트 루프에서 바로 실행합니다.
+    (해시 링 같은 파생 데이터는 로드/리로드 때 prepare_catalog로 미리 만들어 두므로 여기서 만들지 않음)
+    """
+    if catalog_db.line_store is not None:
+        return await run_in_threadpool(func, *args)
+    return func(*args)
+
+
+def resolve_request_time(interval: str, tz: Optional[str]) -> datetime:
+    """
+    요청의 interval, tz 검증 후 현재 시각 반환
+
+    Raises:
+        ValueError: 지원하지 않는 주기나 알 수 없는 시간대
+    """
+    parse_interval(interval)
+    return datetime.now(resolve_timezone(tz)) if tz else datetime.now()
+
+
+async def select_current_lyric(catalog_db, catalog_name: str, interval: str, now: datetime,
+                               tz: Optional[str]) -> Optional[Tuple[str, PreparedLyric, datetime, datetime]]:
+    """
+    현재 블록의 가사와 ETag (/current-lyric, /stream 공용)
+    본문의 timestamp, ETag, 캐시 만료가 모두 같은 실제 블록 경계(get_block_bounds)를 쓰므로
+    서머타임이 끝나 같은 벽시계 블록이 두 번 오는 날에도 서로 맞습니다.
+
+    Returns:
+        (ETag, PreparedLyric, 블록 시작, 다음 블록 시작) (가사를 고르지 못하면 None)
+    """
+    weights = registry.weights_for(catalog_name)
+    start = time.perf_counter()
+    entry = await call_catalog(
+        catalog_db,
+        lyric_cache.get_entry,
+        catalog_name,
+        catalog_db,
+        interval,
+        now,
+        SELECTION_ALGORITHM,
+        weights
     )
+    stage_latency.observe(time.perf_counter() - start, (("stage", "lyric_select"),))
+    if not entry:
+        return None
+
+    version, seed, prepared = entry
+    block_start, block_end = get_block_bounds(now, interval)
+    # 본문은 (카탈로그, 버전, 주기, 블록, 블록 시작 시각, 알고리즘, 가중치, 시간대)로 정해짐
+    # (되풀이되는 벽시계 블록은 시드가 같아도 timestamp의 UTC 오프셋이 다르므로 시작 시각도 넣음)
+    etag = make_etag(catalog_name, version, interval, seed, int(block_start.timestamp()), SELECTION_ALGORITHM,
+                     weights.version if weights is not None else None, tz)
+    return etag, prepared, block_start, block_end
+
+
+@app.get("/current-lyric")
+async def get_current_lyric(
+    interval: str = INTERVAL_QUERY,
+    tz: Optional[str] = TZ_QUERY,
+    catalog: Optional[str] = CATALOG_QUERY,
+    if_none_match: Optional[str] = Header(default=None)
 ):
     """
     현재 시간에 해당하는 가사 반환
 
+    같은 블록 안에서는 응답이 같으므로 ETag와 다음 블록 시작까지의 Cache-Control/Expires를 붙이고,
+    If-None-Match가 일치하면 본문 없이 304를 반환합니다.
+
     Query Parameters:
-        interval: 가사 변경 주기 (1h, 3h, 6h, 12h, 24h)
+        interval: 가사 변경 주기 (숫자 + m/h/d/w, 예: 15m, 90m, 3h, 24h, 1w)
+        tz: IANA 시간대 (예: Asia/Seoul, 없으면 서버 시간대), 블록 경계를 이 시간대의 현지 시각에 맞춤
+        catalog: 카탈로그 이름 (없으면 기본 카탈로그)
 
     Returns:
         {
@@ -100,13 +376,17 @@ def get_current_lyric(
                 "album": "앨범명",
                 "year": 2019,
                 "artist": "태연 (TAEYEON)",
-                "timestamp": "2025-12-04T..."
+                "timestamp": "2025-12-04T09:00:00"  (블록 시작 시각)
             }
         }
     """
     try:
+        catalog_db = registry.resolve(catalog)
+        if catalog_db is None:
+            return catalog_not_found(catalog)
+
         # 빈 데이터베이스 체크
-        if db.is_empty():
+        if catalog_db.is_empty():
             logger.warning("가사 데이터가 없습니다")
             return {
                 "success": False,
@@ -114,28 +394,26 @@ def get_current_lyric(
                 "message": "data/ 폴더에 가사 JSON 파일을 추가해주세요"
             }
 
-        # 현재 시간의 가사 가져오기
-        chunk = get_interval_lyric(
-            db.get_all_chunks(),
-            interval,
-            datetime.now()
-        )
-
-        if chunk:
-            logger.info(f"가사 반환: {chunk['title']} (interval={interval})")
+        try:
+            now = resolve_request_time(interval, tz)
+        except ValueError as e:
             return {
-                "success": True,
-                "data": {
-                    "lines": chunk['lines'],
-                    "title": chunk['title'],
-                    "album": chunk['album'],
-                    "year": chunk['year'],
-                    "artist": chunk.get('artist', '태연 (TAEYEON)'),
-                    "timestamp": datetime.now().isoformat(),
-                    "interval": interval,
-                    "albumFolder": chunk.get('album_folder', '')
-                }
+                "success": False,
+                "error": str(e)
             }
+
+        # 현재 시간 블록의 가사 가져오기 (블록마다 한 번만 선택, 카탈로그 버전이 바뀌면 다시 선택)
+        entry = await select_current_lyric(catalog_db, catalog or registry.default_name, interval, now, tz)
+
+        if entry:
+            etag, prepared, block_start, block_end = entry
+            headers = block_cache_headers(etag, now, block_end)
+            if etag_matches(if_none_match, etag):
+                return Response(status_code=304, headers=headers)
+
+            logger.debug("가사 반환: %s (interval=%s)", prepared.title, interval)
+            return Response(prepared.render(block_start.isoformat()),
+                            media_type=JSON_MEDIA_TYPE, headers=headers)
         else:
             logger.error("가사 선택 실패")
             return {
@@ -151,11 +429,185 @@ def get_current_lyric(
         }
 
 
+# 타임라인 한 번에 받을 수 있는 최대 블록 수
+TIMELINE_MAX_COUNT = 168
+
+
+@app.get("/timeline")
+async def get_timeline(
+    interval: str = INTERVAL_QUERY,
+    count: int = Query(default=8, ge=1, le=TIMELINE_MAX_COUNT, description="현재 블록부터 받을 블록 수"),
+    tz: Optional[str] = TZ_QUERY,
+    catalog: Optional[str] = CATALOG_QUERY,
+    if_none_match: Optional[str] = Header(default=None)
+):
+    """
+    현재 블록부터 count개 블록의 가사와 블록 경계 시각
+    위젯이 요청 한 번으로 타임라인 전체를 채우고 마지막 블록까지 다시 깨어나지 않아도 됩니다.
+    캐시 헤더는 /current-lyric과 같이 현재 블록이 끝날 때 만료됩니다.
+
+    Query Parameters:
+        interval: 가사 변경 주기 (숫자 + m/h/d/w, 예: 15m, 90m, 3h, 24h, 1w)
+        count: 블록 수 (1-168)
+        tz: IANA 시간대 (예: Asia/Seoul, 없으면 서버 시간대)
+        catalog: 카탈로그 이름 (없으면 기본 카탈로그)
+
+    Returns:
+        {
+            "success": true,
+            "data": {
+                "interval": "3h",
+                "count": 8,
+                "entries": [
+                    {"lines": [...], "title": "곡 제목", ..., "timestamp": "2025-12-04T09:00:00+09:00",
+                     "endsAt": "2025-12-04T12:00:00+09:00"},
+                    ...
+                ]
+            }
+        }
+    """
+    try:
+        catalog_db = registry.resolve(catalog)
+        if catalog_db is None:
+            return catalog_not_found(catalog)
+
+        try:
+            now = resolve_request_time(interval, tz)
+        except ValueError as e:
+            return {
+                "success": False,
+                "error": str(e)
+            }
+
+        version, chunks = catalog_db.get_versioned_chunks()
+        if not chunks:
+            return {
+                "success": False,
+                "error": "No lyrics data available"
+            }
+
+        weights = registry.weights_for(catalog)
+        block_start, block_end = get_block_bounds(now, interval)
+        etag = make_etag("timeline", catalog or registry.default_name, version, interval,
+                         get_interval_seed(now, interval), int(block_start.timestamp()), count, SELECTION_ALGORITHM,
+                         weights.version if weights is not None else None, tz)
+        headers = block_cache_headers(etag, now, block_end)
+        if etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers=headers)
+
+        start = time.perf_counter()
+        body = await call_catalog(catalog_db, render_timeline, chunks, interval, now, count, weights)
+        stage_latency.observe(time.perf_counter() - start, (("stage", "timeline_render"),))
+        logger.debug("타임라인 반환: interval=%s, count=%d", interval, count)
+        return Response(body, media_type=JSON_MEDIA_TYPE, headers=headers)
+
+    except Exception as e:
+        logger.error(f"타임라인 오류: {e}", exc_info=True)
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+# /stream: 연결이 없을 때 keepalive 주석을 보내는 간격, 블록 중간 리로드를 반영하려고 다시 확인하는 간격 (초)
+STREAM_KEEPALIVE_SECONDS = 25.0
+STREAM_REFRESH_SECONDS = 60.0
+
+
+async def produce_stream_event(key: Tuple[str, str, Optional[str]]) -> Tuple[str, bytes, float]:
+    """
+    /stream 채널의 현재 이벤트 (블록 경계마다 스케줄러가 한 번 호출해 모든 구독자에게 전달)
+
+    Args:
+        key: (카탈로그 이름, 주기, 시간대)
+
+    Returns:
+        (이벤트 ID, SSE 프레임, 다음 블록 시작 또는 다음 확인 시각 중 빠른 쪽의 POSIX 시각)
+    """
+    catalog_name, interval, tz = key
+    catalog_db = registry.resolve(catalog_name)
+    now = resolve_request_time(interval, tz)
+    entry = await select_current_lyric(catalog_db, catalog_name, interval, now, tz)
+    if not entry:
+        raise RuntimeError("가사 선택 실패")
+
+    etag, prepared, block_start, block_end = entry
+    event_id = etag.strip('"')
+    frame = sse_frame(event_id, "lyric", prepared.render(block_start.isoformat()))
+    wake_at = min(block_end.timestamp(), time.time() + STREAM_REFRESH_SECONDS)
+    return event_id, frame, wake_at
+
+
+broadcaster = BlockBroadcaster(produce_stream_event)
+
+
+@app.get("/stream")
+async def stream_lyrics(
+    interval: str = INTERVAL_QUERY,
+    tz: Optional[str] = TZ_QUERY,
+    catalog: Optional[str] = CATALOG_QUERY,
+    last_event_id: Optional[str] = Header(default=None)
+):
+    """
+    블록이 바뀔 때마다 가사를 보내는 Server-Sent Events 스트림
+    (카탈로그, 주기, 시간대)마다 서버 스케줄러 하나가 블록 경계에 가사를 한 번 만들어 모든 연결에 보내므로
+    연결된 클라이언트는 폴링할 필요가 없습니다. 연결 직후 현재 블록의 가사를 바로 보냅니다.
+
+    Query Parameters:
+        interval: 가사 변경 주기 (숫자 + m/h/d/w, 예: 15m, 90m, 3h, 24h, 1w)
+        tz: IANA 시간대 (예: Asia/Seoul, 없으면 서버 시간대)
+        catalog: 카탈로그 이름 (없으면 기본 카탈로그)
+
+    Returns:
+        text/event-stream
+            id: <ETag>
+            event: lyric
+            data: {"success": true, "data": {...}}  (/current-lyric 응답 본문과 같음)
+    """
+    catalog_db = registry.resolve(catalog)
+    if catalog_db is None:
+        return catalog_not_found(catalog)
+    if catalog_db.is_empty():
+        return {
+            "success": False,
+            "error": "No lyrics data available"
+        }
+    try:
+        resolve_request_time(interval, tz)
+    except ValueError as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+    key = (catalog or registry.default_name, interval, tz)
+    subscription = broadcaster.subscribe(key, last_event_id)
+
+    async def events():
+        try:
+            # 끊기면 5초 후 다시 연결하도록 (재연결 시 Last-Event-ID로 중복 전송 생략)
+            yield b"retry: 5000\n\n"
+            while True:
+                frame = await subscription.next(STREAM_KEEPALIVE_SECONDS)
+                yield frame if frame is not None else b": keepalive\n\n"
+        finally:
+            broadcaster.unsubscribe(key, subscription)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @app.get("/random-lyric")
-def get_random_lyric_endpoint():
+async def get_random_lyric_endpoint(catalog: Optional[str] = CATALOG_QUERY):
     """
     완전 랜덤 가사 반환 (시간과 무관)
 
+    Query Parameters:
+        catalog: 카탈로그 이름 (없으면 기본 카탈로그)
+
     Returns:
         {
             "success": true,
@@ -169,28 +621,25 @@ def get_random_lyric_endpoint():
         }
     """
     try:
-        if db.is_empty():
+        catalog_db = registry.resolve(catalog)
+        if catalog_db is None:
+            return catalog_not_found(catalog)
+
+        chunks = catalog_db.get_all_chunks()
+        if not chunks:
             return {
                 "success": False,
                 "error": "No lyrics data available"
             }
 
-        chunk = get_random_lyric(db.get_all_chunks())
+        index = get_random_index(chunks, registry.weights_for(catalog))
 
-        if chunk:
-            logger.info(f"랜덤 가사 반환: {chunk['title']}")
-            return {
-                "success": True,
-                "data": {
-                    "lines": chunk['lines'],
-                    "title": chunk['title'],
-                    "album": chunk['album'],
-                    "year": chunk['year'],
-                    "artist": chunk.get('artist', '태연 (TAEYEON)'),
-                    "timestamp": datetime.now().isoformat(),
-                    "albumFolder": chunk.get('album_folder', '')
-                }
-            }
+        if index is not None:
+            # 청크마다 한 번만 직렬화하고 요청 시각만 끼워 넣음
+            prepared = await call_catalog(catalog_db, get_random_payloads(chunks).get,
+                                          index, lambda: PreparedLyric(lyric_data(chunks[index])))
+            logger.debug("랜덤 가사 반환: %s", prepared.title)
+            return Response(prepared.render(datetime.now().isoformat()), media_type=JSON_MEDIA_TYPE)
         else:
             return {
                 "success": False,
@@ -206,9 +655,20 @@ def get_random_lyric_endpoint():
 
 
 @app.get("/stats")
-def get_statistics():
+async def get_statistics(
+    album: Optional[str] = Query(
+        default=None,
+        description="특정 앨범 통계만 조회 (앨범명)"
+    ),
+    catalog: Optional[str] = CATALOG_QUERY
+):
     """
     가사 데이터베이스 통계
+    앨범 통계는 로드/리로드 시점에 미리 집계되므로 조회 비용만 듭니다.
+
+    Query Parameters:
+        album: 앨범명 (지정하면 해당 앨범 통계만 반환)
+        catalog: 카탈로그 이름 (없으면 기본 카탈로그)
 
     Returns:
         {
@@ -219,13 +679,32 @@ def get_statistics():
         }
     """
     try:
+        catalog_db = registry.resolve(catalog)
+        if catalog_db is None:
+            return catalog_not_found(catalog)
+
+        if album is not None:
+            info = catalog_db.get_album_info(album)
+            if info is None:
+                return {
+                    "success": False,
+                    "error": f"Album not found: {album}"
+                }
+            return {
+                "success": True,
+                "data": {
+                    "album": album,
+                    **info
+                }
+            }
+
         return {
             "success": True,
             "data": {
-                "chunks_count": db.get_chunk_count(),
-                "albums_count": db.albums_count,
-                "tracks_count": db.tracks_count,
-                "albums": db.get_albums_info()
+                "chunks_count": catalog_db.get_chunk_count(),
+                "albums_count": catalog_db.albums_count,
+                "tracks_count": catalog_db.tracks_count,
+                "albums": catalog_db.get_albums_info()
             }
         }
     except Exception as e:
@@ -236,32 +715,178 @@ def get_statistics():
         }
 
 
+# 검색은 청크 수에 비례하는 CPU 작업이고 lazy 모드에서는 파일도 읽으므로 스레드 풀에서 실행 (sync def)
+@app.get("/search")
+def search_lyrics(
+    q: str = Query(..., min_length=1, description="검색어 (띄어쓰기 무시, 부분 일치)"),
+    limit: int = Query(default=10, ge=1, le=100, description="페이지당 결과 수"),
+    offset: int = Query(default=0, ge=0, description="건너뛸 결과 수"),
+    catalog: Optional[str] = CATALOG_QUERY
+):
+    """
+    가사 전문 검색 (검색어가 많이 나온 청크 순)
+
+    Query Parameters:
+        q: 검색어
+        limit: 페이지당 결과 수 (1-100)
+        offset: 건너뛸 결과 수
+        catalog: 카탈로그 이름 (없으면 기본 카탈로그)
+
+    Returns:
+        {
+            "success": true,
+            "data": {
+                "query": "사랑",
+                "total": 12,
+                "limit": 10,
+                "offset": 0,
+                "results": [{"lines": [...], "title": "곡 제목", ..., "score": 2}]
+            }
+        }
+    """
+    try:
+        catalog_db = registry.resolve(catalog)
+        if catalog_db is None:
+            return catalog_not_found(catalog)
+
+        total, hits = catalog_db.search(q, limit, offset)
+        return {
+            "success": True,
+            "data": {
+                "query": q,
+                "total": total,
+                "limit": limit,
+                "offset": offset,
+                "results": [
+                    {
+                        "lines": chunk['lines'],
+                        "title": chunk['title'],
+                        "album": chunk['album'],
+                        "year": chunk['year'],
+                        "artist": chunk.get('artist', '태연 (TAEYEON)'),
+                        "albumFolder": chunk.get('album_folder', ''),
+                        "score": score
+                    }
+                    for chunk, score in hits
+                ]
+            }
+        }
+    except Exception as e:
+        logger.error(f"검색 오류: {e}", exc_info=True)
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+# 메모리 추정이 청크 수에 비례하므로 스레드 풀에서 실행 (sync def)
+@app.get("/catalogs")
+def list_catalogs():
+    """
+    카탈로그 목록과 카탈로그별 로드 시간/메모리 사용량
+    메모리 추정은 청크 수에 비례하는 비용이 들므로 모니터링 용도로만 호출하세요.
+
+    Returns:
+        {
+            "success": true,
+            "data": {
+                "default": "default",
+                "catalogs": {"default": {"chunks_count": 787, "load_duration_ms": 41.2,
+                                         "memory_bytes": {...}, ...}}
+            }
+        }
+    """
+    try:
+        return {
+            "success": True,
+            "data": {
+                "default": registry.default_name,
+                "catalogs": registry.get_catalogs_info()
+            }
+        }
+    except Exception as e:
+        logger.error(f"카탈로그 목록 조회 오류: {e}", exc_info=True)
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+# DAILY_LYRICS_COVERS: 앨범 커버 디렉토리 (기본 data/covers)
+# DAILY_LYRICS_COVER_CACHE_MB: 메모리에 보관할 커버 이미지 총 크기 (기본 32MB)
+# DAILY_LYRICS_COVER_MAX_AGE: 커버 응답의 Cache-Control max-age (초, 기본 86400)
+cover_store = CoverStore(
+    os.environ.get("DAILY_LYRICS_COVERS", "data/covers"),
+    max_bytes=int(float(os.environ.get("DAILY_LYRICS_COVER_CACHE_MB", "32")) * 1024 * 1024)
+)
+COVER_MAX_AGE = int(os.environ.get("DAILY_LYRICS_COVER_MAX_AGE", "86400"))
+
+
 @app.get("/covers/{filename}")
-def get_album_cover(filename: str):
+async def get_album_cover(
+    filename: str,
+    size: str = Query(default=ORIGINAL_SIZE, regex=f"^({'|'.join([ORIGINAL_SIZE, *COVER_SIZES])})$",
+                      description="이미지 크기 (original, small, medium)"),
+    range_header: Optional[str] = Header(default=None, alias="Range"),
+    if_range: Optional[str] = Header(default=None),
+    if_none_match: Optional[str] = Header(default=None),
+    if_modified_since: Optional[str] = Header(default=None)
+):
     """
     앨범 커버 이미지 제공
+    자주 쓰는 커버는 메모리에서 바로 보내며 ETag/Last-Modified 조건부 요청(304)과 Range 요청(206)을 지원합니다.
 
     Args:
         filename: 이미지 파일명 (예: 001_I.webp)
 
+    Query Parameters:
+        size: original (원본), small (긴 변 160px), medium (긴 변 480px, 위젯 배경용)
+
     Returns:
         이미지 파일
     """
     try:
-        cover_path = Path("data/covers") / filename
-
-        if not cover_path.exists():
+        cover = cover_store.cached(filename, size)
+        if cover is None:
+            # 원본 확인, 축소본 생성 등 파일 I/O는 이벤트 루프를 막지 않도록 스레드에서
+            start = time.perf_counter()
+            cover = await run_in_threadpool(cover_store.load, filename, size)
+            stage_latency.observe(time.perf_counter() - start, (("stage", "cover_load"),))
+        if cover is None:
             logger.warning(f"앨범 커버 없음: {filename}")
             return {
                 "success": False,
                 "error": f"Cover not found: {filename}"
             }
 
-        # WebP, JPG, PNG 등 지원
-        return FileResponse(
-            cover_path,
-            media_type="image/webp" if filename.endswith(".webp") else "image/jpeg"
-        )
+        headers = {
+            "ETag": cover.etag,
+            "Last-Modified": cover.last_modified,
+            "Cache-Control": f"public, max-age={COVER_MAX_AGE}",
+            "Accept-Ranges": "bytes"
+        }
+        # If-None-Match가 있으면 If-Modified-Since는 무시 (RFC 9110 13.1.3)
+        if etag_matches(if_none_match, cover.etag) or \
+                (if_none_match is None and not_modified_since(if_modified_since, cover.mtime)):
+            return Response(status_code=304, headers=headers)
+
+        # If-Range가 현재 ETag/Last-Modified와 다르면 Range를 무시하고 전체 전송
+        if range_header and if_range in (None, cover.etag, cover.last_modified):
+            length = len(cover.body)
+            try:
+                byte_range = parse_range(range_header, length)
+            except ValueError:
+                return Response(status_code=416, headers={**headers, "Content-Range": f"bytes */{length}"})
+            if byte_range is not None:
+                start, end = byte_range
+                return Response(
+                    cover.body[start:end + 1],
+                    status_code=206,
+                    media_type=cover.media_type,
+                    headers={**headers, "Content-Range": f"bytes {start}-{end}/{length}"}
+                )
+
+        return Response(cover.body, media_type=cover.media_type, headers=headers)
 
     except Exception as e:
         logger.error(f"앨범 커버 로드 오류: {e}", exc_info=True)
@@ -271,20 +896,192 @@ def get_album_cover(filename: str):
         }
 
 
+def _is_loopback(host: Optional[str]) -> bool:
+    """클라이언트 주소가 루프백인지 (IPv4-mapped IPv6 포함)"""
+    if not host:
+        return False
+    try:
+        address = ipaddress.ip_address(host)
+    except ValueError:
+        return host == "localhost"
+    mapped = getattr(address, "ipv4_mapped", None)
+    return (mapped or address).is_loopback
+
+
+def check_admin(request: Request, x_admin_token: Optional[str]) -> Optional[dict]:
+    """
+    /admin/* 요청 권한 확인
+    토큰을 설정했으면 X-Admin-Token이 같아야 합니다. 설정하지 않았으면 루프백 클라이언트만 허용하고,
+    Origin 헤더가 붙은 요청은 거부합니다. CORS가 모든 origin을 허용하므로 그러지 않으면 사용자가 연
+    아무 웹 페이지나 (같은 기기의 브라우저에서) 리로드를 일으킬 수 있고, 브라우저는 다른 사이트로 보내는
+    POST에 항상 Origin을 붙이지만 curl이나 스크립트는 붙이지 않습니다.
+
+    Returns:
+        거부 응답 딕셔너리 (허용이면 None)
+    """
+    if ADMIN_TOKEN:
+        if x_admin_token is None or not secrets.compare_digest(x_admin_token, ADMIN_TOKEN):
+            return {
+                "success": False,
+                "error": "Invalid admin token"
+            }
+        return None
+
+    if not _is_loopback(request.client.host if request.client else None) or request.headers.get("origin"):
+        logger.warning(f"관리 요청 거부 (토큰 미설정): {request.client.host if request.client else '-'} "
+                       f"origin={request.headers.get('origin')}")
+        return {
+            "success": False,
+            "error": "Admin endpoints require DAILY_LYRICS_ADMIN_TOKEN for non-local or browser requests"
+        }
+    return None
+
+
+@app.post("/admin/reload")
+def reload_catalog(
+    request: Request,
+    catalog: Optional[str] = CATALOG_QUERY,
+    x_admin_token: Optional[str] = Header(default=None)
+):
+    """
+    data/ 변경분만 다시 읽어 카탈로그 갱신 (서비스 재시작 불필요)
+
+    Query Parameters:
+        catalog: 리로드할 카탈로그 이름 (없으면 기본 카탈로그)
+
+    Returns:
+        {
+            "success": true,
+            "data": {"added": 1, "changed": 0, "removed": 0, "unchanged": 68,
+                     "version": "...", "swapped": true, "duration_ms": 3.2}
+        }
+    """
+    denied = check_admin(request, x_admin_token)
+    if denied is not None:
+        return denied
+
+    catalog_db = registry.resolve(catalog)
+    if catalog_db is None:
+        return catalog_not_found(catalog)
+
+    try:
+        result = catalog_db.reload(partial(prepare_catalog, catalog or registry.default_name))
+        stage_latency.observe(catalog_db.last_reload_duration, (("stage", "catalog_reload"),))
+        if result['swapped']:
+            # 버전이 캐시 키에 들어가므로 필수는 아니지만 이전 카탈로그 항목을 바로 해제
+            lyric_cache.invalidate(catalog or registry.default_name)
+        logger.info(
+            f"카탈로그 리로드 ({catalog or registry.default_name}): 추가 {result['added']}, 변경 {result['changed']}, "
+            f"삭제 {result['removed']} ({result['duration_ms']}ms)"
+        )
+        return {
+            "success": True,
+            "data": result
+        }
+    except Exception as e:
+        logger.error(f"카탈로그 리로드 오류: {e}", exc_info=True)
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+def _catalog_gauge(read):
+    return lambda: [({"catalog": name}, read(catalog_db)) for name, catalog_db in registry.items()]
+
+
+def _cache_counts():
+    """캐시 이름 → (적중, 실패)"""
+    counts = {
+        "current_lyric": (lyric_cache.hits, lyric_cache.misses),
+        "cover": (cover_store.hits, cover_store.misses)
+    }
+    for name, catalog_db in registry.items():
+        if catalog_db.line_store is not None:
+            counts[f"lazy_lines:{name}"] = (catalog_db.line_store.hits, catalog_db.line_store.misses)
+    return counts
+
+
+def _cache_hit_ratio():
+    return [
+        ({"cache": name}, hits / (hits + misses) if hits + misses else 0.0)
+        for name, (hits, misses) in _cache_counts().items()
+    ]
+
+
+metrics.gauge("catalog_chunks", "카탈로그의 가사 청크 수", _catalog_gauge(lambda db: db.get_chunk_count()))
+metrics.gauge("catalog_load_duration_seconds", "시작 로드에 걸린 시간 (초)",
+              _catalog_gauge(lambda db: db.load_duration))
+metrics.gauge("catalog_reloads_total", "카탈로그가 교체된 리로드 횟수",
+              _catalog_gauge(lambda db: db.reload_count), metric_type="counter")
+metrics.gauge("catalog_last_reload_duration_seconds", "마지막 리로드에 걸린 시간 (초, 감시 스레드 포함)",
+              _catalog_gauge(lambda db: db.last_reload_duration))
+metrics.gauge("cache_hits_total", "캐시 적중 수",
+              lambda: [({"cache": name}, hits) for name, (hits, _) in _cache_counts().items()],
+              metric_type="counter")
+metrics.gauge("cache_misses_total", "캐시 실패 수",
+              lambda: [({"cache": name}, misses) for name, (_, misses) in _cache_counts().items()],
+              metric_type="counter")
+metrics.gauge("cache_hit_ratio", "캐시 적중률 (시작 이후 누적)", _cache_hit_ratio)
+metrics.gauge("cover_cache_bytes", "메모리에 보관 중인 커버 이미지 바이트 수",
+              lambda: [({}, cover_store.memory_bytes())])
+metrics.gauge("ready", "카탈로그 로드가 끝나 가사를 제공할 수 있으면 1",
+              lambda: [({}, 1 if catalog_warmup.ready else 0)])
+metrics.gauge("startup_duration_seconds", "모듈 로드부터 카탈로그 준비까지 걸린 시간 (초)",
+              lambda: [({}, catalog_warmup.duration)] if catalog_warmup.duration is not None else [])
+metrics.gauge("log_records_dropped_total", "로그 큐가 가득 차서 버린 로그 레코드 수",
+              lambda: [({}, log_pipeline.dropped if log_pipeline is not None else 0)], metric_type="counter")
+metrics.gauge("log_queue_size", "아직 출력하지 않은 로그 레코드 수",
+              lambda: [({}, log_pipeline.queue_size if log_pipeline is not None else 0)])
+metrics.gauge("stream_subscribers", "/stream 연결 수", lambda: [({}, broadcaster.subscriber_count)])
+metrics.gauge("stream_channels", "/stream 스케줄러 수 (카탈로그, 주기, 시간대 조합)",
+              lambda: [({}, broadcaster.channel_count)])
+
+
+@app.get("/metrics")
+async def get_metrics():
+    """
+    Prometheus 텍스트 형식 메트릭
+
+    Returns:
+        요청 수/지연 시간 히스토그램 (라우트, 주기, 상태 코드별), 단계별 소요 시간,
+        카탈로그 규모/로드 시간/리로드 횟수, 캐시 적중률, /stream 연결 수
+    """
+    return Response(metrics.render(), media_type=METRICS_CONTENT_TYPE)
+
+
 # 서버 시작 시 로그
 @app.on_event("startup")
 async def startup_event():
     logger.info("=" * 60)
     logger.info("Daily Lyrics Widget Service 시작")
-    logger.info(f"가사 청크: {db.get_chunk_count()}개")
-    logger.info(f"앨범: {db.albums_count}개")
-    logger.info(f"트랙: {db.tracks_count}개")
+    if catalog_warmup.ready:
+        # src.prefork 워커는 부모가 fork 전에 로드를 끝냄
+        for name, catalog_db in registry.items():
+            logger.info(f"[{name}] 가사 청크: {catalog_db.get_chunk_count()}개, "
+                        f"앨범: {catalog_db.albums_count}개, 트랙: {catalog_db.tracks_count}개")
+    else:
+        # 포트를 먼저 열고 로드는 백그라운드에서 (끝나면 /readyz가 200)
+        logger.info(f"카탈로그 로드 시작 (백그라운드): {', '.join(registry.pending)}")
+        catalog_warmup.start()
+    logger.info(f"JSON 직렬화: {'orjson' if orjson is not None else 'json (pip install orjson으로 가속)'}")
+    logger.info(f"커버 축소본: {'Pillow' if Image is not None else '원본만 제공 (pip install Pillow로 축소본 생성)'}")
     logger.info("=" * 60)
 
+    if watcher is not None:
+        watcher.start()
+        logger.info(f"카탈로그 감시 시작 (주기 {WATCH_INTERVAL:g}초)")
+
 
 @app.on_event("shutdown")
 async def shutdown_event():
+    await broadcaster.close()
+    if watcher is not None:
+        watcher.stop()
+    registry.close()
     logger.info("Daily Lyrics Widget Service 종료")
+    if log_pipeline is not None:
+        log_pipeline.stop()
 
 
 if __name__ == "__main__":
@@ -292,7 +1089,7 @@ if __name__ == "__main__":
 
     print("🎵 Daily Lyrics Widget Service")
     print("=" * 60)
-    print(f"가사 청크: {db.get_chunk_count()}개 로드됨")
+    print(f"카탈로그: {', '.join(registry.pending)} (서버 시작 후 로드, 준비 상태: /readyz)")
     print("=" * 60)
     print("서버 시작 중...")
     print("접속: http://localhost:58384")
@@ -302,5 +1099,6 @@ if __name__ == "__main__":
         app,
         host="0.0.0.0",
         port=58384,
-        log_level="info"
+        log_level="info",
+        access_log=False  # 접근 로그는 AccessLogMiddleware가 샘플링해서 남김
     )
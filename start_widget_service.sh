@@ -14,11 +14,27 @@ PYTHON3="/usr/bin/python3"
 # 로그 디렉토리 생성
 mkdir -p logs
 
+# 워커 프로세스 수 (1이면 기존처럼 uvicorn 단일 프로세스)
+# 2 이상이면 src.prefork가 카탈로그를 한 번만 로드한 뒤 워커를 fork해 카탈로그 메모리를 공유
+# (src.prefork는 uvicorn 접근 로그를 항상 끄므로 --no-access-log 옵션이 없음)
+WORKERS="${DAILY_LYRICS_WORKERS:-1}"
+
 # 서버 시작
-echo "$(date): Starting Daily Lyrics Widget Service..." >> logs/startup.log
-$PYTHON3 -m uvicorn src.widget_service:app \
-    --host 0.0.0.0 \
-    --port 58384 \
-    --loop asyncio \
-    --http h11 \
-    >> logs/widget_service.log 2>> logs/widget_service_error.log
+echo "$(date): Starting Daily Lyrics Widget Service (workers: $WORKERS)..." >> logs/startup.log
+if [ "$WORKERS" -gt 1 ]; then
+    $PYTHON3 -m src.prefork \
+        --workers "$WORKERS" \
+        --host 0.0.0.0 \
+        --port 58384 \
+        --loop asyncio \
+        --http h11 \
+        >> logs/widget_service.log 2>> logs/widget_service_error.log
+else
+    $PYTHON3 -m uvicorn src.widget_service:app \
+        --host 0.0.0.0 \
+        --port 58384 \
+        --loop asyncio \
+        --http h11 \
+        --no-access-log \
+        >> logs/widget_service.log 2>> logs/widget_service_error.log
+fi
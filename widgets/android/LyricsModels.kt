@@ -34,6 +34,7 @@ data class LyricsData(
 
         // URL 인코딩 (세미콜론 등 특수문자 처리)
         val encodedFilename = java.net.URLEncoder.encode("$albumFolder.webp", "UTF-8")
-        return "$baseURL/covers/$encodedFilename"
+        // 위젯 배경은 축소본으로 충분 (원본은 size=original)
+        return "$baseURL/covers/$encodedFilename?size=medium"
     }
 }
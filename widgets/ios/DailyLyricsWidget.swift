@@ -39,9 +39,19 @@ struct LyricsProvider: TimelineProvider {
         }
     }
 
+    // 한 번에 받아 둘 블록 수 (3h 간격이면 24시간 분량)
+    private let timelineCount = 8
+
     // 타임라인 (위젯 업데이트 스케줄)
     func getTimeline(in context: Context, completion: @escaping (Timeline<LyricsEntry>) -> Void) {
         Task {
+            // 다음 블록들의 가사를 한 번에 받아 블록 시작 시각마다 엔트리로 배치
+            if let entries = await fetchTimelineEntries(), !entries.isEmpty {
+                completion(Timeline(entries: entries, policy: .atEnd))
+                return
+            }
+
+            // /timeline을 지원하지 않는 서버면 현재 가사 하나만 표시
             let entry = await fetchLyrics()
 
             // 다음 업데이트 시간 계산 (간격에 따라)
@@ -72,6 +82,23 @@ struct LyricsProvider: TimelineProvider {
         }
     }
 
+    // API에서 타임라인 가져오기 (실패하면 nil)
+    private func fetchTimelineEntries() async -> [LyricsEntry]? {
+        guard case .success(let timeline) = await LyricsAPIService.shared.getTimeline(
+            interval: interval, count: timelineCount
+        ) else {
+            return nil
+        }
+
+        let formatter = ISO8601DateFormatter()
+        let now = Date()
+        return timeline.entries.enumerated().map { index, lyricsData in
+            // 첫 블록은 이미 시작했으므로 바로 표시
+            let date = index == 0 ? now : (formatter.date(from: lyricsData.timestamp) ?? now)
+            return LyricsEntry(date: date, lyrics: lyricsData, errorMessage: nil)
+        }
+    }
+
     // 다음 업데이트 시간 계산
     private func calculateNextUpdate(for interval: String) -> Date {
         let calendar = Calendar.current
@@ -44,6 +44,41 @@ class LyricsAPIService {
         }
     }
 
+    /// 현재 블록부터 count개 블록의 가사를 한 번에 가져오기 (위젯 타임라인 용)
+    func getTimeline(interval: String = "24h", count: Int = 8) async -> Result<TimelineData, Error> {
+        var components = URLComponents(string: "\(baseURL)/timeline")
+        components?.queryItems = [
+            URLQueryItem(name: "interval", value: interval),
+            URLQueryItem(name: "count", value: String(count)),
+            // 블록 경계를 기기 시간대로 계산하고 timestamp에 오프셋을 붙이도록
+            URLQueryItem(name: "tz", value: TimeZone.current.identifier)
+        ]
+
+        guard let url = components?.url else {
+            return .failure(APIError.invalidURL)
+        }
+
+        do {
+            let (data, response) = try await URLSession.shared.data(from: url)
+
+            guard let httpResponse = response as? HTTPURLResponse,
+                  httpResponse.statusCode == 200 else {
+                return .failure(APIError.serverError)
+            }
+
+            let decoder = JSONDecoder()
+            let timelineResponse = try decoder.decode(TimelineResponse.self, from: data)
+
+            if timelineResponse.success, let timelineData = timelineResponse.data, !timelineData.entries.isEmpty {
+                return .success(timelineData)
+            } else {
+                return .failure(APIError.noData)
+            }
+        } catch {
+            return .failure(error)
+        }
+    }
+
     /// 랜덤 가사 가져오기
     func getRandomLyrics() async -> Result<LyricsData, Error> {
         let urlString = "\(baseURL)/random-lyric"
@@ -38,11 +38,26 @@ struct LyricsData: Codable {
             return nil
         }
 
-        let urlString = "http://127.0.0.1:58384/covers/\(encodedFilename)"
+        // 위젯 배경은 축소본으로 충분 (원본은 size=original)
+        let urlString = "http://127.0.0.1:58384/covers/\(encodedFilename)?size=medium"
         return URL(string: urlString)
     }
 }
 
+/// /timeline 응답 모델
+struct TimelineResponse: Codable {
+    let success: Bool
+    let data: TimelineData?
+    let error: String?
+}
+
+/// 타임라인 데이터 (entries의 timestamp는 각 블록의 시작 시각)
+struct TimelineData: Codable {
+    let interval: String
+    let count: Int
+    let entries: [LyricsData]
+}
+
 /// 위젯에 표시할 엔트리
 struct LyricsEntry: TimelineEntry {
     let date: Date
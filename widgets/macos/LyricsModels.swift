@@ -43,6 +43,20 @@ struct LyricsData: Codable {
     }
 }
 
+/// /timeline 응답 모델
+struct TimelineResponse: Codable {
+    let success: Bool
+    let data: TimelineData?
+    let error: String?
+}
+
+/// 타임라인 데이터 (entries의 timestamp는 각 블록의 시작 시각)
+struct TimelineData: Codable {
+    let interval: String
+    let count: Int
+    let entries: [LyricsData]
+}
+
 /// 위젯에 표시할 엔트리
 struct LyricsEntry: TimelineEntry {
     let date: Date